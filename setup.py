@@ -8,6 +8,7 @@ setup(
     python_requires=">=3.10",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"web": ["static/*", "templates/*"]},
     install_requires=[
         "psutil>=5.9.0",
         "watchdog>=3.0.0",
@@ -22,12 +23,23 @@ setup(
             "fastapi>=0.109.0",
             "uvicorn>=0.27.0",
             "jinja2>=3.1.0",
+            "orjson>=3.9.0",
+            "brotli>=1.1.0",
+            "httptools>=0.6.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+            "prometheus_client>=0.19.0",
         ],
         "ml": [
             "scikit-learn>=1.4.0",
             "numpy>=1.26.0",
             "joblib>=1.3.0",
         ],
+        "hash": [
+            "blake3>=0.4.0",
+        ],
+        "match": [
+            "pyahocorasick>=2.0.0",
+        ],
         "dev": [
             "pytest>=8.0.0",
             "pytest-asyncio>=0.23.0",
@@ -185,6 +185,9 @@ class LeattDaemon:
                         message=alert["description"],
                     )
         
+        if alerts and self._web_server:
+            self._web_server.notify_alerts()
+        
         for handler in self._event_handlers:
             try:
                 handler(event)
@@ -58,8 +58,17 @@ class ProcessMonitor:
         self._previous_net: dict[int, tuple[int, int]] = {}
         self._pid_fingerprints: dict[int, tuple[str, str, float]] = {}
     
-    def _get_process_info(self, proc: psutil.Process) -> Optional[ProcessInfo]:
-        """Extract information from a psutil Process object."""
+    def _get_process_info(
+        self,
+        proc: psutil.Process,
+        known: Optional[ProcessInfo] = None,
+    ) -> Optional[ProcessInfo]:
+        """Extract information from a psutil Process object.
+        
+        If known is the info from a previous scan and the process still has
+        the same name, path and start time, its user, command line and hash
+        are reused instead of being read again.
+        """
         try:
             with proc.oneshot():
                 pid = proc.pid
@@ -70,21 +79,27 @@ class ProcessMonitor:
                 except (psutil.AccessDenied, psutil.ZombieProcess):
                     path = None
                 
-                try:
-                    user = proc.username()
-                except (psutil.AccessDenied, psutil.ZombieProcess):
-                    user = None
-                
-                try:
-                    cmdline = proc.cmdline()
-                except (psutil.AccessDenied, psutil.ZombieProcess):
-                    cmdline = []
-                
                 try:
                     create_time = proc.create_time()
                 except (psutil.AccessDenied, psutil.ZombieProcess):
                     create_time = 0.0
                 
+                hash_sha256 = None
+                if known is not None and (known.name, known.path, known.create_time) == (name, path, create_time):
+                    user = known.user
+                    cmdline = known.cmdline
+                    hash_sha256 = known.hash_sha256
+                else:
+                    try:
+                        user = proc.username()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        user = None
+                    
+                    try:
+                        cmdline = proc.cmdline()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        cmdline = []
+                
                 try:
                     cpu_percent = proc.cpu_percent()
                 except (psutil.AccessDenied, psutil.ZombieProcess):
@@ -126,6 +141,7 @@ class ProcessMonitor:
                     bytes_recv=bytes_recv,
                     read_bytes=read_bytes,
                     write_bytes=write_bytes,
+                    hash_sha256=hash_sha256,
                 )
         
         except (psutil.NoSuchProcess, psutil.ZombieProcess):
@@ -365,7 +381,7 @@ class ProcessMonitor:
         
         for proc in psutil.process_iter():
             try:
-                info = self._get_process_info(proc)
+                info = self._get_process_info(proc, self._known_processes.get(proc.pid))
                 if info is None:
                     continue
                 
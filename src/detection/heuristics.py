@@ -1,9 +1,11 @@
 """Heuristics-based behavioral analysis engine."""
 
+import re
 import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
-from collections import defaultdict
+from typing import Any, Callable, Optional
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta
 
 from ..utils.logger import get_logger
@@ -12,6 +14,37 @@ from ..utils.database import AlertSeverity
 
 logger = get_logger("heuristics")
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+    logger.debug("pyahocorasick not available, matching paths with regular expressions")
+
+# Most processes tracked at once; the oldest is dropped to make room
+MAX_PROCESS_ACTIVITIES = 4096
+
+
+@lru_cache(maxsize=32)
+def _substring_matcher(substrings: tuple[str, ...]) -> Optional[Callable[[str], bool]]:
+    """Build a case-insensitive test for whether text contains any of the substrings.
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, so the
+    cost per path does not grow with the number of substrings.
+    """
+    substrings = tuple(s for s in substrings if s)
+    if not substrings:
+        return None
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for substring in substrings:
+            automaton.add_word(substring.lower(), substring)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    
+    regex = re.compile("|".join(map(re.escape, substrings)), re.IGNORECASE)
+    return lambda text: regex.search(text) is not None
+
 
 @dataclass
 class ProcessActivity:
@@ -52,7 +85,8 @@ class HeuristicsEngine:
     def __init__(self):
         self.config = get_config()
         
-        self._process_activities: dict[int, ProcessActivity] = {}
+        # Kept in creation order, so the oldest activity is always first
+        self._process_activities: OrderedDict[int, ProcessActivity] = OrderedDict()
         self._activity_window = timedelta(seconds=self.config.get_rule(
             "heuristics.correlation_window_seconds", 60
         ))
@@ -165,22 +199,24 @@ class HeuristicsEngine:
     
     def _get_or_create_activity(self, pid: int, name: str) -> ProcessActivity:
         """Get or create activity tracker for a process."""
-        if pid not in self._process_activities:
-            self._process_activities[pid] = ProcessActivity(pid=pid, name=name)
-        return self._process_activities[pid]
+        activity = self._process_activities.get(pid)
+        if activity is None:
+            if len(self._process_activities) >= MAX_PROCESS_ACTIVITIES:
+                self._process_activities.popitem(last=False)
+            activity = self._process_activities[pid] = ProcessActivity(pid=pid, name=name)
+        return activity
     
     def _cleanup_old_activities(self) -> None:
         """Remove stale process activities."""
         current_time = time.time()
         cutoff = current_time - self._activity_window.total_seconds() * 2
         
-        stale_pids = [
-            pid for pid, activity in self._process_activities.items()
-            if activity.first_seen < cutoff
-        ]
-        
-        for pid in stale_pids:
-            del self._process_activities[pid]
+        # Oldest first, so stop at the first one still inside the window
+        while self._process_activities:
+            activity = next(iter(self._process_activities.values()))
+            if activity.first_seen >= cutoff:
+                break
+            self._process_activities.popitem(last=False)
     
     def _record_file_event(self, activity: ProcessActivity, event_data: dict) -> None:
         """Record a file access event."""
@@ -244,15 +280,11 @@ class HeuristicsEngine:
     
     def _check_credential_theft(self, activity: ProcessActivity, pattern: HeuristicPattern) -> bool:
         """Check for credential theft pattern."""
-        credential_patterns = pattern.conditions.get("credential_file_patterns", [])
-        
-        for file_access in activity.file_accesses:
-            file_path = file_access.get("path", "").lower()
-            for cred_pattern in credential_patterns:
-                if cred_pattern.lower() in file_path:
-                    return True
+        matches = _substring_matcher(tuple(pattern.conditions.get("credential_file_patterns", ())))
+        if matches is None:
+            return False
         
-        return False
+        return any(matches(f.get("path") or "") for f in activity.file_accesses)
     
     def _check_rapid_enumeration(self, activity: ProcessActivity, pattern: HeuristicPattern) -> bool:
         """Check for rapid file enumeration."""
@@ -324,15 +356,11 @@ class HeuristicsEngine:
         if activity.name.lower() in [p.lower() for p in exclude_processes]:
             return False
         
-        ssh_patterns = pattern.conditions.get("ssh_key_patterns", [])
-        
-        for file_access in activity.file_accesses:
-            file_path = file_access.get("path", "").lower()
-            for ssh_pattern in ssh_patterns:
-                if ssh_pattern.lower() in file_path:
-                    return True
+        matches = _substring_matcher(tuple(pattern.conditions.get("ssh_key_patterns", ())))
+        if matches is None:
+            return False
         
-        return False
+        return any(matches(f.get("path") or "") for f in activity.file_accesses)
     
     def _evaluate_pattern(self, activity: ProcessActivity, pattern: HeuristicPattern) -> bool:
         """Evaluate a single pattern against process activity."""
@@ -1,7 +1,7 @@
 """Rules-based detection engine."""
 
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 from enum import Enum
 
 from ..utils.logger import get_logger
@@ -18,6 +18,15 @@ class RuleType(str, Enum):
     REGISTRY = "registry"
 
 
+# Monitor that produced an event -> the only rule type it can match
+_SOURCE_TO_TYPE = {
+    "process_monitor": RuleType.PROCESS,
+    "network_monitor": RuleType.NETWORK,
+    "file_monitor": RuleType.FILE,
+    "registry_monitor": RuleType.REGISTRY,
+}
+
+
 @dataclass
 class Rule:
     """Detection rule definition."""
@@ -27,6 +36,10 @@ class Rule:
     severity: AlertSeverity
     enabled: bool = True
     conditions: dict = None
+    # Built from conditions when the rule is registered with an engine
+    matcher: Optional[Callable[[dict], Optional[dict]]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
     
     def __post_init__(self):
         if self.conditions is None:
@@ -41,18 +54,172 @@ class RuleMatch:
     details: dict = None
 
 
+def _compile_suspicious_process_name(conditions: dict):
+    names = frozenset(n.lower() for n in conditions.get("suspicious_names", []))
+    
+    def match(event_data: dict) -> Optional[dict]:
+        process_name = event_data.get("process_name", "").lower()
+        if process_name in names:
+            return {"process_name": process_name}
+        return None
+    return match
+
+
+def _compile_untrusted_process(conditions: dict):
+    def match(event_data: dict) -> Optional[dict]:
+        if not event_data.get("is_trusted", True):
+            return {
+                "process_name": event_data.get("process_name", "").lower(),
+                "path": event_data.get("path"),
+            }
+        return None
+    return match
+
+
+def _compile_high_connection_count(conditions: dict):
+    max_connections = conditions.get("max_connections", 100)
+    
+    def match(event_data: dict) -> Optional[dict]:
+        num_connections = event_data.get("num_connections", 0)
+        if num_connections > max_connections:
+            return {
+                "process_name": event_data.get("process_name", "").lower(),
+                "num_connections": num_connections,
+            }
+        return None
+    return match
+
+
+def _compile_high_io_activity(conditions: dict):
+    threshold_bytes = conditions.get("threshold_mb", 10) * 1024 * 1024
+    
+    def match(event_data: dict) -> Optional[dict]:
+        read_delta = event_data.get("read_bytes_delta", 0)
+        write_delta = event_data.get("write_bytes_delta", 0)
+        if read_delta > threshold_bytes or write_delta > threshold_bytes:
+            return {
+                "process_name": event_data.get("process_name", "").lower(),
+                "read_mb": round(read_delta / (1024 * 1024), 2),
+                "write_mb": round(write_delta / (1024 * 1024), 2),
+            }
+        return None
+    return match
+
+
+def _compile_suspicious_port_connection(conditions: dict):
+    ports = frozenset(conditions.get("suspicious_ports", []))
+    
+    def match(event_data: dict) -> Optional[dict]:
+        remote_port = event_data.get("remote_port", 0)
+        if remote_port in ports:
+            return {
+                "remote_port": remote_port,
+                "remote_address": event_data.get("remote_address"),
+                "process_name": event_data.get("process_name"),
+            }
+        return None
+    return match
+
+
+def _compile_high_upload_rate(conditions: dict):
+    threshold = conditions.get("max_mb_per_min", 50)
+    
+    def match(event_data: dict) -> Optional[dict]:
+        mb_uploaded = event_data.get("mb_uploaded", 0)
+        if mb_uploaded > threshold:
+            return {
+                "mb_uploaded": mb_uploaded,
+                "threshold": threshold,
+                "process_name": event_data.get("process_name"),
+            }
+        return None
+    return match
+
+
+def _compile_sensitive_file_access(conditions: dict):
+    def match(event_data: dict) -> Optional[dict]:
+        if event_data.get("is_sensitive", False):
+            return {
+                "file_path": event_data.get("file_path"),
+                "event_type": event_data.get("event_type"),
+            }
+        return None
+    return match
+
+
+def _compile_registry_run_key_modified(conditions: dict):
+    key_patterns = tuple(conditions.get("key_patterns", []))
+    
+    def match(event_data: dict) -> Optional[dict]:
+        key_path = event_data.get("key_path", "")
+        if any(pattern in key_path for pattern in key_patterns):
+            return {
+                "key_path": key_path,
+                "value_name": event_data.get("value_name"),
+                "change_type": event_data.get("change_type"),
+            }
+        return None
+    return match
+
+
+# Rule name -> builder turning its conditions into a matcher
+_MATCHER_BUILDERS = {
+    "suspicious_process_name": _compile_suspicious_process_name,
+    "untrusted_process": _compile_untrusted_process,
+    "high_connection_count": _compile_high_connection_count,
+    "high_io_activity": _compile_high_io_activity,
+    "suspicious_port_connection": _compile_suspicious_port_connection,
+    "high_upload_rate": _compile_high_upload_rate,
+    "sensitive_file_access": _compile_sensitive_file_access,
+    "registry_run_key_modified": _compile_registry_run_key_modified,
+}
+
+
+def _never_matches(event_data: dict) -> Optional[dict]:
+    return None
+
+
+def compile_rule(rule: Rule) -> Callable[[dict], Optional[dict]]:
+    """Build a rule's matcher: event data -> alert details, or None.
+    
+    Conditions are read once here, so changing them afterwards needs the
+    rule to be added again. Rules without a builder never match.
+    """
+    builder = _MATCHER_BUILDERS.get(rule.name)
+    if builder is None:
+        return _never_matches
+    return builder(rule.conditions)
+
+
 class RulesEngine:
     """Evaluate events against detection rules."""
     
     def __init__(self):
         self.config = get_config()
-        self.rules: list[Rule] = []
+        # Insertion-ordered, so iteration still follows load/add order
+        self._rules_by_name: dict[str, Rule] = {}
+        # The same rules bucketed by type, so evaluate() skips the other types
+        self._rules_by_type: dict[RuleType, dict[str, Rule]] = {t: {} for t in RuleType}
         self._load_default_rules()
     
+    @property
+    def rules(self) -> list[Rule]:
+        """All rules, in the order they were added."""
+        return list(self._rules_by_name.values())
+    
+    def _register(self, rule: Rule) -> None:
+        """Compile and store a rule, replacing any existing rule with the same name."""
+        rule.matcher = compile_rule(rule)
+        previous = self._rules_by_name.pop(rule.name, None)
+        if previous is not None:
+            del self._rules_by_type[previous.rule_type][previous.name]
+        self._rules_by_name[rule.name] = rule
+        self._rules_by_type[rule.rule_type][rule.name] = rule
+    
     def _load_default_rules(self) -> None:
         """Load built-in detection rules."""
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="suspicious_process_name",
             rule_type=RuleType.PROCESS,
             description="Process with known malicious name detected",
@@ -62,7 +229,7 @@ class RulesEngine:
             },
         ))
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="suspicious_port_connection",
             rule_type=RuleType.NETWORK,
             description="Connection to suspicious port detected",
@@ -72,7 +239,7 @@ class RulesEngine:
             },
         ))
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="high_upload_rate",
             rule_type=RuleType.NETWORK,
             description="Abnormally high data upload detected",
@@ -82,7 +249,7 @@ class RulesEngine:
             },
         ))
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="sensitive_file_access",
             rule_type=RuleType.FILE,
             description="Access to sensitive file detected",
@@ -92,7 +259,7 @@ class RulesEngine:
             },
         ))
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="untrusted_process",
             rule_type=RuleType.PROCESS,
             description="New untrusted process started",
@@ -101,7 +268,7 @@ class RulesEngine:
             conditions={},
         ))
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="registry_run_key_modified",
             rule_type=RuleType.REGISTRY,
             description="Startup registry key modified",
@@ -111,7 +278,7 @@ class RulesEngine:
             },
         ))
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="high_connection_count",
             rule_type=RuleType.PROCESS,
             description="Process has excessive network connections",
@@ -121,7 +288,7 @@ class RulesEngine:
             },
         ))
         
-        self.rules.append(Rule(
+        self._register(Rule(
             name="high_io_activity",
             rule_type=RuleType.PROCESS,
             description="Process has abnormally high I/O activity",
@@ -131,200 +298,60 @@ class RulesEngine:
             },
         ))
         
-        logger.info(f"Loaded {len(self.rules)} detection rules")
+        logger.info(f"Loaded {len(self._rules_by_name)} detection rules")
     
     def add_rule(self, rule: Rule) -> None:
         """Add a custom rule."""
-        self.rules.append(rule)
+        self._register(rule)
         logger.info(f"Added rule: {rule.name}")
     
     def remove_rule(self, rule_name: str) -> bool:
         """Remove a rule by name."""
-        for i, rule in enumerate(self.rules):
-            if rule.name == rule_name:
-                self.rules.pop(i)
-                logger.info(f"Removed rule: {rule_name}")
-                return True
-        return False
+        rule = self._rules_by_name.pop(rule_name, None)
+        if rule is None:
+            return False
+        del self._rules_by_type[rule.rule_type][rule_name]
+        logger.info(f"Removed rule: {rule_name}")
+        return True
     
     def enable_rule(self, rule_name: str) -> bool:
         """Enable a rule by name."""
-        for rule in self.rules:
-            if rule.name == rule_name:
-                rule.enabled = True
-                return True
-        return False
+        rule = self._rules_by_name.get(rule_name)
+        if rule is None:
+            return False
+        rule.enabled = True
+        return True
     
     def disable_rule(self, rule_name: str) -> bool:
         """Disable a rule by name."""
-        for rule in self.rules:
-            if rule.name == rule_name:
-                rule.enabled = False
-                return True
-        return False
-    
-    def _evaluate_process_rule(self, rule: Rule, event_data: dict) -> Optional[RuleMatch]:
-        """Evaluate a process-related rule."""
-        process_name = event_data.get("process_name", "").lower()
-        
-        if rule.name == "suspicious_process_name":
-            suspicious_names = [n.lower() for n in rule.conditions.get("suspicious_names", [])]
-            if process_name in suspicious_names:
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={"process_name": process_name},
-                )
-        
-        elif rule.name == "untrusted_process":
-            if not event_data.get("is_trusted", True):
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={
-                        "process_name": process_name,
-                        "path": event_data.get("path"),
-                    },
-                )
-        
-        elif rule.name == "high_connection_count":
-            num_connections = event_data.get("num_connections", 0)
-            max_connections = rule.conditions.get("max_connections", 100)
-            if num_connections > max_connections:
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={
-                        "process_name": process_name,
-                        "num_connections": num_connections,
-                    },
-                )
-        
-        elif rule.name == "high_io_activity":
-            threshold_bytes = rule.conditions.get("threshold_mb", 10) * 1024 * 1024
-            read_delta = event_data.get("read_bytes_delta", 0)
-            write_delta = event_data.get("write_bytes_delta", 0)
-            if read_delta > threshold_bytes or write_delta > threshold_bytes:
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={
-                        "process_name": process_name,
-                        "read_mb": round(read_delta / (1024 * 1024), 2),
-                        "write_mb": round(write_delta / (1024 * 1024), 2),
-                    },
-                )
-        
-        return None
-    
-    def _evaluate_network_rule(self, rule: Rule, event_data: dict) -> Optional[RuleMatch]:
-        """Evaluate a network-related rule."""
-        
-        if rule.name == "suspicious_port_connection":
-            remote_port = event_data.get("remote_port", 0)
-            suspicious_ports = rule.conditions.get("suspicious_ports", [])
-            if remote_port in suspicious_ports:
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={
-                        "remote_port": remote_port,
-                        "remote_address": event_data.get("remote_address"),
-                        "process_name": event_data.get("process_name"),
-                    },
-                )
-        
-        elif rule.name == "high_upload_rate":
-            mb_uploaded = event_data.get("mb_uploaded", 0)
-            threshold = rule.conditions.get("max_mb_per_min", 50)
-            if mb_uploaded > threshold:
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={
-                        "mb_uploaded": mb_uploaded,
-                        "threshold": threshold,
-                        "process_name": event_data.get("process_name"),
-                    },
-                )
-        
-        return None
-    
-    def _evaluate_file_rule(self, rule: Rule, event_data: dict) -> Optional[RuleMatch]:
-        """Evaluate a file-related rule."""
-        
-        if rule.name == "sensitive_file_access":
-            if event_data.get("is_sensitive", False):
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={
-                        "file_path": event_data.get("file_path"),
-                        "event_type": event_data.get("event_type"),
-                    },
-                )
-        
-        return None
-    
-    def _evaluate_registry_rule(self, rule: Rule, event_data: dict) -> Optional[RuleMatch]:
-        """Evaluate a registry-related rule."""
-        
-        if rule.name == "registry_run_key_modified":
-            key_path = event_data.get("key_path", "")
-            key_patterns = rule.conditions.get("key_patterns", [])
-            if any(pattern in key_path for pattern in key_patterns):
-                return RuleMatch(
-                    rule=rule,
-                    matched=True,
-                    details={
-                        "key_path": key_path,
-                        "value_name": event_data.get("value_name"),
-                        "change_type": event_data.get("change_type"),
-                    },
-                )
-        
-        return None
+        rule = self._rules_by_name.get(rule_name)
+        if rule is None:
+            return False
+        rule.enabled = False
+        return True
     
     def evaluate(self, event: Any) -> list[dict]:
         """Evaluate an event against all enabled rules."""
         alerts = []
         
-        event_source = event.source
         event_data = event.data
         
-        source_to_type = {
-            "process_monitor": RuleType.PROCESS,
-            "network_monitor": RuleType.NETWORK,
-            "file_monitor": RuleType.FILE,
-            "registry_monitor": RuleType.REGISTRY,
-        }
+        event_rule_type = _SOURCE_TO_TYPE.get(event.source)
+        if event_rule_type is None:
+            return alerts
         
-        event_rule_type = source_to_type.get(event_source)
-        
-        for rule in self.rules:
+        for rule in self._rules_by_type[event_rule_type].values():
             if not rule.enabled:
                 continue
             
-            if rule.rule_type != event_rule_type:
-                continue
-            
-            match = None
-            
-            if rule.rule_type == RuleType.PROCESS:
-                match = self._evaluate_process_rule(rule, event_data)
-            elif rule.rule_type == RuleType.NETWORK:
-                match = self._evaluate_network_rule(rule, event_data)
-            elif rule.rule_type == RuleType.FILE:
-                match = self._evaluate_file_rule(rule, event_data)
-            elif rule.rule_type == RuleType.REGISTRY:
-                match = self._evaluate_registry_rule(rule, event_data)
+            details = rule.matcher(event_data)
             
-            if match and match.matched:
+            if details is not None:
                 alerts.append({
                     "severity": rule.severity,
                     "source": f"rules_engine:{rule.name}",
                     "description": rule.description,
-                    "details": match.details,
+                    "details": details,
                 })
                 logger.info(f"Rule matched: {rule.name} - {rule.description}")
         
@@ -332,8 +359,8 @@ class RulesEngine:
     
     def get_rules(self) -> list[Rule]:
         """Get all rules."""
-        return self.rules.copy()
+        return self.rules
     
     def get_enabled_rules(self) -> list[Rule]:
         """Get only enabled rules."""
-        return [r for r in self.rules if r.enabled]
+        return [r for r in self._rules_by_name.values() if r.enabled]
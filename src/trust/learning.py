@@ -13,7 +13,7 @@ from ..utils.database import get_database
 logger = get_logger("learning")
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessBehavior:
     """Learned behavior profile for a process."""
     name: str
@@ -119,13 +119,13 @@ class LearningEngine:
             self._behaviors[key] = ProcessBehavior(name=name, path=path)
         
         behavior = self._behaviors[key]
-        n = behavior.sample_count
+        weight = 1.0 / (behavior.sample_count + 1)
         
-        behavior.avg_cpu_percent = (behavior.avg_cpu_percent * n + cpu_percent) / (n + 1)
-        behavior.avg_memory_percent = (behavior.avg_memory_percent * n + memory_percent) / (n + 1)
-        behavior.avg_connections = (behavior.avg_connections * n + num_connections) / (n + 1)
-        behavior.avg_io_read_bytes = (behavior.avg_io_read_bytes * n + io_read_bytes) / (n + 1)
-        behavior.avg_io_write_bytes = (behavior.avg_io_write_bytes * n + io_write_bytes) / (n + 1)
+        behavior.avg_cpu_percent += (cpu_percent - behavior.avg_cpu_percent) * weight
+        behavior.avg_memory_percent += (memory_percent - behavior.avg_memory_percent) * weight
+        behavior.avg_connections += (num_connections - behavior.avg_connections) * weight
+        behavior.avg_io_read_bytes += (io_read_bytes - behavior.avg_io_read_bytes) * weight
+        behavior.avg_io_write_bytes += (io_write_bytes - behavior.avg_io_write_bytes) * weight
         
         behavior.max_cpu_percent = max(behavior.max_cpu_percent, cpu_percent)
         behavior.max_memory_percent = max(behavior.max_memory_percent, memory_percent)
@@ -1,6 +1,9 @@
 """Process signature verification."""
 
-import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
@@ -32,52 +35,100 @@ class SignatureInfo:
     error_message: Optional[str] = None
 
 
+_CACHE_SIZE = 4096
+
+_CN_RE = re.compile(r'(?:^|,)\s*CN=(?:"([^"]*)"|([^,]+))')
+
+
+class _FileResultCache:
+    """LRU cache of per-file results, keyed with the file's mtime and size.
+    
+    Unlike lru_cache, callers decide what is stored, so a failed hash or
+    verification is retried on the next lookup instead of sticking until
+    the file changes.
+    """
+    
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple, object] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: tuple, value) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_hash_cache = _FileResultCache(_CACHE_SIZE)
+_signature_cache = _FileResultCache(_CACHE_SIZE)
+
+
+def _file_key(file_path: Path) -> tuple:
+    """Cache key for a file; mtime and size invalidate entries when it changes."""
+    st = os.stat(file_path)
+    return (str(file_path), st.st_mtime_ns, st.st_size)
+
+
 class ProcessSignature:
     """Verify process signatures and authenticity."""
     
-    def __init__(self):
-        self._signature_cache: dict[str, SignatureInfo] = {}
-        self._hash_cache: dict[str, str] = {}
-    
     def get_file_hash(self, file_path: Path, algorithm: str = "sha256") -> Optional[str]:
         """Compute hash of a file."""
-        path_str = str(file_path)
-        
-        if path_str in self._hash_cache:
-            return self._hash_cache[path_str]
-        
-        file_hash = PlatformUtils.compute_file_hash(file_path, algorithm)
-        
-        if file_hash:
-            self._hash_cache[path_str] = file_hash
+        try:
+            key = _file_key(file_path) + (algorithm,)
+        except OSError as e:
+            logger.debug(f"Cannot stat {file_path}: {e}")
+            return None
         
+        file_hash = _hash_cache.get(key)
+        if file_hash is None:
+            file_hash = PlatformUtils.compute_file_hash(Path(file_path), algorithm)
+            if file_hash is not None:
+                _hash_cache.put(key, file_hash)
         return file_hash
     
     def verify_signature(self, file_path: Path) -> SignatureInfo:
         """Verify the digital signature of a file."""
-        path_str = str(file_path)
-        
-        if path_str in self._signature_cache:
-            return self._signature_cache[path_str]
-        
-        if not file_path.exists():
+        try:
+            key = _file_key(file_path)
+        except OSError:
             return SignatureInfo(
                 status=SignatureStatus.ERROR,
                 error_message="File not found",
             )
         
+        sig_info = _signature_cache.get(key)
+        if sig_info is not None:
+            return sig_info
+        
         if PlatformUtils.is_windows():
-            sig_info = self._verify_windows_signature(file_path)
+            sig_info = self._verify_windows_signature(Path(file_path))
         else:
             sig_info = SignatureInfo(
                 status=SignatureStatus.UNKNOWN,
                 error_message="Signature verification not supported on this platform",
             )
         
-        self._signature_cache[path_str] = sig_info
+        # Errors (timeouts, locked files) may be transient, so try again next time
+        if sig_info.status != SignatureStatus.ERROR:
+            _signature_cache.put(key, sig_info)
         return sig_info
     
-    def _verify_windows_signature(self, file_path: Path) -> SignatureInfo:
+    @staticmethod
+    def _verify_windows_signature(file_path: Path) -> SignatureInfo:
         """Verify signature on Windows using WinVerifyTrust."""
         try:
             import subprocess
@@ -106,7 +157,7 @@ class ProcessSignature:
                     text=True,
                     timeout=10,
                 )
-                publisher = self._parse_certificate_subject(publisher_result.stdout.strip())
+                publisher = ProcessSignature._parse_certificate_subject(publisher_result.stdout.strip())
                 
                 return SignatureInfo(
                     status=SignatureStatus.VALID,
@@ -140,17 +191,17 @@ class ProcessSignature:
                 error_message=str(e),
             )
     
-    def _parse_certificate_subject(self, subject: str) -> Optional[str]:
+    @staticmethod
+    def _parse_certificate_subject(subject: str) -> Optional[str]:
         """Extract common name from certificate subject."""
         if not subject:
             return None
         
-        for part in subject.split(","):
-            part = part.strip()
-            if part.startswith("CN="):
-                return part[3:].strip('"')
+        match = _CN_RE.search(subject)
+        if match is None:
+            return subject
         
-        return subject
+        return (match.group(1) or match.group(2)).strip()
     
     def is_signed_by_trusted_publisher(self, file_path: Path) -> bool:
         """Check if file is signed by a trusted publisher."""
@@ -187,10 +238,13 @@ class ProcessSignature:
     
     def clear_cache(self) -> None:
         """Clear all caches."""
-        self._signature_cache.clear()
-        self._hash_cache.clear()
+        _hash_cache.clear()
+        _signature_cache.clear()
         logger.debug("Signature caches cleared")
     
     def get_cached_hash(self, file_path: Path) -> Optional[str]:
-        """Get cached hash if available."""
-        return self._hash_cache.get(str(file_path))
+        """Get cached hash if available, without hashing the file."""
+        try:
+            return _hash_cache.get(_file_key(file_path) + ("sha256",))
+        except OSError:
+            return None
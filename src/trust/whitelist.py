@@ -1,8 +1,11 @@
 """Process whitelist management."""
 
+import sys
+from collections import OrderedDict
+from functools import cache
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass
+from typing import Iterator, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from ..utils.logger import get_logger
@@ -11,6 +14,9 @@ from ..utils.platform import PlatformUtils
 
 logger = get_logger("whitelist")
 
+# Most database-confirmed lookups kept in memory; least recently used go first
+TRUST_CACHE_SIZE = 2048
+
 
 @dataclass
 class WhitelistEntry:
@@ -22,6 +28,133 @@ class WhitelistEntry:
     added_at: Optional[datetime] = None
     added_by: str = "system"
     reason: Optional[str] = None
+    name_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.name_lower = sys.intern(self.name.lower())
+
+
+# Default trusted process names per platform
+_WINDOWS_SYSTEM_PROCESSES = (
+    # Windows core
+    "System",
+    "smss.exe",
+    "csrss.exe",
+    "wininit.exe",
+    "services.exe",
+    "lsass.exe",
+    "svchost.exe",
+    "explorer.exe",
+    "taskhostw.exe",
+    "dwm.exe",
+    "conhost.exe",
+    "RuntimeBroker.exe",
+    "SearchHost.exe",
+    "ShellExperienceHost.exe",
+    "StartMenuExperienceHost.exe",
+    "sihost.exe",
+    "fontdrvhost.exe",
+    "WmiPrvSE.exe",
+    "dllhost.exe",
+    "ctfmon.exe",
+    "SecurityHealthService.exe",
+    "MsMpEng.exe",
+    "NisSrv.exe",
+    "spoolsv.exe",
+    "audiodg.exe",
+    "SearchIndexer.exe",
+    "TextInputHost.exe",
+    "ApplicationFrameHost.exe",
+    "SystemSettings.exe",
+    "SettingSyncHost.exe",
+    "backgroundTaskHost.exe",
+    "CompPkgSrv.exe",
+    "LockApp.exe",
+    "Registry",
+    "MemCompression",
+    "Idle",
+    # Browsers
+    "chrome.exe",
+    "msedge.exe",
+    "firefox.exe",
+    "brave.exe",
+    "opera.exe",
+    "vivaldi.exe",
+    "duckduckgo.exe",
+    # Dev tools
+    "Code.exe",
+    "cursor.exe",
+    "Cursor.exe",
+    "node.exe",
+    "python.exe",
+    "pythonw.exe",
+    "git.exe",
+    "WindowsTerminal.exe",
+    "powershell.exe",
+    "cmd.exe",
+    "wsl.exe",
+    "docker.exe",
+    "Docker Desktop.exe",
+    # Common apps
+    "Spotify.exe",
+    "Discord.exe",
+    "slack.exe",
+    "Teams.exe",
+    "Zoom.exe",
+    "OneDrive.exe",
+    "Dropbox.exe",
+    "Steam.exe",
+    "EpicGamesLauncher.exe",
+    "1Password.exe",
+    "Bitwarden.exe",
+    "KeePass.exe",
+    "Notion.exe",
+    "Obsidian.exe",
+    "Postman.exe",
+    "vlc.exe",
+    "NVIDIA Share.exe",
+    "nvcontainer.exe",
+    "nvidia-smi.exe",
+    "amdow.exe",
+    "RadeonSoftware.exe",
+)
+
+_UNIX_SYSTEM_PROCESSES = (
+    "systemd",
+    "init",
+    "kthreadd",
+    "kworker",
+    "ksoftirqd",
+    "migration",
+    "rcu_sched",
+    "watchdog",
+    "bash",
+    "sh",
+    "zsh",
+    "fish",
+    "sshd",
+    "cron",
+    "dbus-daemon",
+    "NetworkManager",
+    "pulseaudio",
+    "pipewire",
+    "Xorg",
+    "gdm",
+    "lightdm",
+    "gnome-shell",
+    "kwin",
+)
+
+# Lowercased once at import; is_trusted() compares lowercased names
+_SYSTEM_PROCESSES: frozenset[str] = frozenset(
+    p.lower() for p in (_WINDOWS_SYSTEM_PROCESSES if PlatformUtils.is_windows() else _UNIX_SYSTEM_PROCESSES)
+)
+
+
+@cache
+def _known_browsers_lower() -> frozenset[str]:
+    """Lowercased known browser names, computed on first use."""
+    return frozenset(b.lower() for b in PlatformUtils.get_known_browsers())
 
 
 class Whitelist:
@@ -31,134 +164,33 @@ class Whitelist:
         from ..utils.config import get_config
         self.db = get_database()
         self.config = get_config()
-        self._cache: dict[str, WhitelistEntry] = {}
-        self._system_processes: set[str] = set()
+        self._cache: OrderedDict[str, WhitelistEntry] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._system_processes: frozenset[str] = frozenset()
         
         self._load_system_defaults()
         self._load_user_whitelist()
+        
+        self._system_default_entries: tuple[WhitelistEntry, ...] = tuple(
+            WhitelistEntry(
+                name=name,
+                added_by="system",
+                reason="Default system process",
+            )
+            for name in sorted(self._system_processes)
+        )
     
     def _load_system_defaults(self) -> None:
         """Load default system processes into whitelist."""
-        if PlatformUtils.is_windows():
-            system_processes = [
-                # Windows core
-                "System",
-                "smss.exe",
-                "csrss.exe",
-                "wininit.exe",
-                "services.exe",
-                "lsass.exe",
-                "svchost.exe",
-                "explorer.exe",
-                "taskhostw.exe",
-                "dwm.exe",
-                "conhost.exe",
-                "RuntimeBroker.exe",
-                "SearchHost.exe",
-                "ShellExperienceHost.exe",
-                "StartMenuExperienceHost.exe",
-                "sihost.exe",
-                "fontdrvhost.exe",
-                "WmiPrvSE.exe",
-                "dllhost.exe",
-                "ctfmon.exe",
-                "SecurityHealthService.exe",
-                "MsMpEng.exe",
-                "NisSrv.exe",
-                "spoolsv.exe",
-                "audiodg.exe",
-                "SearchIndexer.exe",
-                "TextInputHost.exe",
-                "ApplicationFrameHost.exe",
-                "SystemSettings.exe",
-                "SettingSyncHost.exe",
-                "backgroundTaskHost.exe",
-                "CompPkgSrv.exe",
-                "LockApp.exe",
-                "Registry",
-                "MemCompression",
-                "Idle",
-                # Browsers
-                "chrome.exe",
-                "msedge.exe",
-                "firefox.exe",
-                "brave.exe",
-                "opera.exe",
-                "vivaldi.exe",
-                "duckduckgo.exe",
-                # Dev tools
-                "Code.exe",
-                "cursor.exe",
-                "Cursor.exe",
-                "node.exe",
-                "python.exe",
-                "pythonw.exe",
-                "git.exe",
-                "WindowsTerminal.exe",
-                "powershell.exe",
-                "cmd.exe",
-                "wsl.exe",
-                "docker.exe",
-                "Docker Desktop.exe",
-                # Common apps
-                "Spotify.exe",
-                "Discord.exe",
-                "slack.exe",
-                "Teams.exe",
-                "Zoom.exe",
-                "OneDrive.exe",
-                "Dropbox.exe",
-                "Steam.exe",
-                "EpicGamesLauncher.exe",
-                "1Password.exe",
-                "Bitwarden.exe",
-                "KeePass.exe",
-                "Notion.exe",
-                "Obsidian.exe",
-                "Postman.exe",
-                "vlc.exe",
-                "NVIDIA Share.exe",
-                "nvcontainer.exe",
-                "nvidia-smi.exe",
-                "amdow.exe",
-                "RadeonSoftware.exe",
-            ]
-        else:
-            system_processes = [
-                "systemd",
-                "init",
-                "kthreadd",
-                "kworker",
-                "ksoftirqd",
-                "migration",
-                "rcu_sched",
-                "watchdog",
-                "bash",
-                "sh",
-                "zsh",
-                "fish",
-                "sshd",
-                "cron",
-                "dbus-daemon",
-                "NetworkManager",
-                "pulseaudio",
-                "pipewire",
-                "Xorg",
-                "gdm",
-                "lightdm",
-                "gnome-shell",
-                "kwin",
-            ]
-        
-        self._system_processes = {p.lower() for p in system_processes}
+        self._system_processes = _SYSTEM_PROCESSES
         logger.info(f"Loaded {len(self._system_processes)} default system processes")
     
     def _load_user_whitelist(self) -> None:
         """Load user-defined whitelist from config."""
         user_whitelist = self.config.user_whitelist
         if user_whitelist:
-            for proc in user_whitelist:
-                self._system_processes.add(proc.lower())
+            self._system_processes = self._system_processes.union(p.lower() for p in user_whitelist)
             logger.info(f"Loaded {len(user_whitelist)} user-defined trusted processes")
     
     def is_trusted(
@@ -180,14 +212,17 @@ class Whitelist:
         
         cache_key = f"{name_lower}:{path or ''}:{hash_sha256 or ''}"
         if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            self._cache_hits += 1
             return True
         
+        self._cache_misses += 1
         if self.db.is_process_trusted(name, path, hash_sha256):
-            self._cache[cache_key] = WhitelistEntry(
+            self._remember(cache_key, WhitelistEntry(
                 name=name,
                 path=path,
                 hash_sha256=hash_sha256,
-            )
+            ))
             return True
         
         return False
@@ -233,8 +268,8 @@ class Whitelist:
             reason=reason,
         )
         
-        cache_key = f"{name.lower()}:{path or ''}:{hash_sha256 or ''}"
-        self._cache[cache_key] = entry
+        cache_key = f"{entry.name_lower}:{path or ''}:{hash_sha256 or ''}"
+        self._remember(cache_key, entry)
         
         logger.info(f"Added to whitelist: {name} (by {added_by})")
         return entry
@@ -251,9 +286,10 @@ class Whitelist:
                 session.delete(result)
                 session.commit()
                 
+                prefix = f"{name.lower()}:"
                 keys_to_remove = [
                     k for k in self._cache.keys()
-                    if k.startswith(f"{name.lower()}:")
+                    if k.startswith(prefix)
                 ]
                 for key in keys_to_remove:
                     del self._cache[key]
@@ -263,20 +299,17 @@ class Whitelist:
         
         return False
     
-    def get_all(self) -> list[WhitelistEntry]:
-        """Get all whitelist entries."""
-        entries = []
+    def get_all(self) -> Iterator[WhitelistEntry]:
+        """Iterate over all whitelist entries.
         
-        for name in self._system_processes:
-            entries.append(WhitelistEntry(
-                name=name,
-                added_by="system",
-                reason="Default system process",
-            ))
+        Database entries are streamed first; system defaults that are also
+        stored in the database are not yielded twice.
+        """
+        seen: set[str] = set()
         
         with self.db.get_session() as session:
-            for trusted in session.query(TrustedProcess).all():
-                entries.append(WhitelistEntry(
+            for trusted in session.query(TrustedProcess).yield_per(200):
+                entry = WhitelistEntry(
                     name=trusted.name,
                     path=trusted.path,
                     hash_sha256=trusted.hash_sha256,
@@ -284,16 +317,35 @@ class Whitelist:
                     added_at=trusted.added_at,
                     added_by=trusted.added_by,
                     reason=trusted.reason,
-                ))
+                )
+                seen.add(entry.name_lower)
+                yield entry
         
-        return entries
+        for entry in self._system_default_entries:
+            if entry.name_lower not in seen:
+                yield entry
+    
+    def _remember(self, cache_key: str, entry: WhitelistEntry) -> None:
+        """Cache a trusted lookup, evicting the least recently used past the cap."""
+        self._cache[cache_key] = entry
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > TRUST_CACHE_SIZE:
+            self._cache.popitem(last=False)
     
     def clear_cache(self) -> None:
         """Clear the in-memory cache."""
         self._cache.clear()
         logger.debug("Whitelist cache cleared")
     
+    def cache_info(self) -> dict[str, int]:
+        """Hit/miss counts and size of the trusted-lookup cache."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._cache),
+            "maxsize": TRUST_CACHE_SIZE,
+        }
+    
     def is_known_browser(self, name: str) -> bool:
         """Check if a process is a known browser."""
-        browsers = PlatformUtils.get_known_browsers()
-        return name.lower() in [b.lower() for b in browsers]
+        return name.lower() in _known_browsers_lower()
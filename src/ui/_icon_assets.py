@@ -0,0 +1,49 @@
+"""Prebuilt tray icon assets, encoded once at import time."""
+
+import io
+
+from PIL import Image, ImageDraw
+
+from .systray import TrayStatus
+
+_SIZE = 64
+
+_COLORS = {
+    TrayStatus.RUNNING: "#22c55e",
+    TrayStatus.PAUSED: "#f59e0b",
+    TrayStatus.WARNING: "#ef4444",
+    TrayStatus.ERROR: "#dc2626",
+}
+
+
+def _render(status: TrayStatus) -> bytes:
+    """Draw the icon for a status and encode it as PNG."""
+    size = _SIZE
+    image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    color = _COLORS.get(status, "#22c55e")
+    
+    draw.ellipse([4, 4, size - 4, size - 4], fill=color)
+    
+    draw.ellipse([20, 20, size - 20, size - 20], fill="white")
+    
+    if status == TrayStatus.RUNNING:
+        draw.polygon([(26, 22), (26, 42), (42, 32)], fill=color)
+    elif status == TrayStatus.PAUSED:
+        draw.rectangle([24, 22, 30, 42], fill=color)
+        draw.rectangle([34, 22, 40, 42], fill=color)
+    elif status in (TrayStatus.WARNING, TrayStatus.ERROR):
+        draw.rectangle([30, 22, 34, 36], fill=color)
+        draw.ellipse([29, 38, 35, 44], fill=color)
+    
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+ICONS: dict[TrayStatus, bytes] = {status: _render(status) for status in TrayStatus}
+
+
+def load_icon(status: TrayStatus) -> Image.Image:
+    """Decode the prebuilt icon for a status."""
+    return Image.open(io.BytesIO(ICONS[status]))
@@ -4,7 +4,10 @@ from typing import Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+from collections import deque
+from itertools import islice
 import threading
+import time
 
 from ..utils.logger import get_logger
 from ..utils.config import get_config
@@ -19,6 +22,14 @@ class NotificationPriority(str, Enum):
     CRITICAL = "critical"
 
 
+_PRIORITY_RANK = {
+    NotificationPriority.LOW: 0,
+    NotificationPriority.NORMAL: 1,
+    NotificationPriority.HIGH: 2,
+    NotificationPriority.CRITICAL: 3,
+}
+
+
 @dataclass
 class Notification:
     """A notification to display to the user."""
@@ -40,20 +51,34 @@ class NotificationManager:
     def __init__(self):
         self.config = get_config()
         self._enabled = self.config.notifications_enabled
-        self._history: list[Notification] = []
-        self._max_history = 100
-        self._lock = threading.Lock()
+        self._history: deque[Notification] = deque(maxlen=100)
+        self._hist_lock = threading.Lock()
+        self._rl_lock = threading.Lock()
         
         self._rate_limit_seconds = 5
-        self._last_notification_time = 0.0
+        self._rate = 1.0 / self._rate_limit_seconds
+        self._capacity = 3.0
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._pending: deque[Notification] = deque(maxlen=16)
         self._pending_count = 0
+        self._summary_titles = 3
+        
+        self._log_by_priority = {
+            NotificationPriority.LOW: logger.debug,
+            NotificationPriority.NORMAL: logger.info,
+            NotificationPriority.HIGH: logger.warning,
+            NotificationPriority.CRITICAL: logger.error,
+        }
         
+        self._plyer_notify: Optional[Callable] = None
         self._plyer_available = self._check_plyer()
     
     def _check_plyer(self) -> bool:
         """Check if plyer is available for notifications."""
         try:
             from plyer import notification
+            self._plyer_notify = notification.notify
             return True
         except ImportError:
             logger.warning("plyer not available, notifications will be logged only")
@@ -72,8 +97,6 @@ class NotificationManager:
         Returns:
             True if notification was displayed, False otherwise.
         """
-        import time
-        
         if not self._enabled:
             logger.debug(f"Notifications disabled, skipping: {title}")
             return False
@@ -84,44 +107,75 @@ class NotificationManager:
             priority=priority,
         )
         
-        with self._lock:
+        with self._hist_lock:
             self._history.append(notification)
-            if len(self._history) > self._max_history:
-                self._history = self._history[-self._max_history:]
-        
-        log_level = {
-            NotificationPriority.LOW: logger.debug,
-            NotificationPriority.NORMAL: logger.info,
-            NotificationPriority.HIGH: logger.warning,
-            NotificationPriority.CRITICAL: logger.error,
-        }.get(priority, logger.info)
         
+        log_level = self._log_by_priority.get(priority, logger.info)
         log_level(f"[NOTIFICATION] {title}: {message}")
         
-        current_time = time.time()
-        time_since_last = current_time - self._last_notification_time
-        
-        if time_since_last < self._rate_limit_seconds:
-            self._pending_count += 1
-            logger.debug(f"Rate limited, {self._pending_count} pending notifications")
+        with self._rl_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._rate,
+            )
+            self._last_refill = now
+            
+            if self._tokens < 1.0:
+                self._pending.append(notification)
+                self._pending_count += 1
+                pending_count = self._pending_count
+                rate_limited = True
+            else:
+                batch: list[Notification] = []
+                pending_count = 0
+                rate_limited = False
+                if self._plyer_available:
+                    batch = list(self._pending)
+                    pending_count = self._pending_count
+                    self._pending.clear()
+                    self._pending_count = 0
+                    self._tokens -= 1.0
+        
+        if rate_limited:
+            logger.debug(f"Rate limited, {pending_count} pending notifications")
             return False
         
         if self._plyer_available:
-            if self._pending_count > 0:
-                message = f"{message} (+{self._pending_count} autres alertes)"
-                self._pending_count = 0
+            if pending_count > 0:
+                title, message = self._summarize(notification, batch, pending_count)
             
-            self._last_notification_time = current_time
             return self._show_plyer_notification(title, message, timeout)
         
         return True
     
+    def _summarize(
+        self,
+        current: Notification,
+        pending: list[Notification],
+        pending_count: int,
+    ) -> tuple[str, str]:
+        """
+        Fold buffered notifications into one, led by the most severe.
+        
+        Returns:
+            Tuple of (title, message) for the summary notification.
+        """
+        batch = sorted(
+            pending + [current],
+            key=lambda n: _PRIORITY_RANK.get(n.priority, 1),
+            reverse=True,
+        )
+        top = batch[0]
+        others = ", ".join(n.title for n in batch[1:1 + self._summary_titles])
+        
+        message = f"{top.message} (+{pending_count} autres alertes: {others})"
+        return top.title, message
+    
     def _show_plyer_notification(self, title: str, message: str, timeout: int) -> bool:
         """Show notification using plyer."""
         try:
-            from plyer import notification
-            
-            notification.notify(
+            self._plyer_notify(
                 title=title,
                 message=message,
                 app_name="Leatt",
@@ -173,11 +227,13 @@ class NotificationManager:
     
     def get_history(self, limit: int = 50) -> list[Notification]:
         """Get notification history."""
-        with self._lock:
-            return self._history[-limit:]
+        with self._hist_lock:
+            snapshot = tuple(self._history)
+        
+        return list(islice(snapshot, max(0, len(snapshot) - limit), None))
     
     def clear_history(self) -> None:
         """Clear notification history."""
-        with self._lock:
+        with self._hist_lock:
             self._history.clear()
         logger.debug("Notification history cleared")
@@ -39,13 +39,23 @@ class SystrayApp:
         self._icon = None
         self._running = False
         
+        self._flash_timer: Optional[threading.Timer] = None
+        self._flash_restore_status = TrayStatus.RUNNING
+        self._flash_lock = threading.Lock()
+        
+        self._load_icon: Optional[Callable] = None
         self._pystray_available = self._check_pystray()
+        
+        self._icon_cache = {}
+        if self._pystray_available:
+            self._icon_cache = {s: self._create_icon_image(s) for s in TrayStatus}
     
     def _check_pystray(self) -> bool:
         """Check if pystray is available."""
         try:
             import pystray
-            from PIL import Image
+            from ._icon_assets import load_icon
+            self._load_icon = load_icon
             return True
         except ImportError:
             logger.warning("pystray or PIL not available, systray will be disabled")
@@ -53,34 +63,7 @@ class SystrayApp:
     
     def _create_icon_image(self, status: TrayStatus):
         """Create an icon image for the current status."""
-        from PIL import Image, ImageDraw
-        
-        size = 64
-        image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        colors = {
-            TrayStatus.RUNNING: "#22c55e",
-            TrayStatus.PAUSED: "#f59e0b",
-            TrayStatus.WARNING: "#ef4444",
-            TrayStatus.ERROR: "#dc2626",
-        }
-        color = colors.get(status, "#22c55e")
-        
-        draw.ellipse([4, 4, size - 4, size - 4], fill=color)
-        
-        draw.ellipse([20, 20, size - 20, size - 20], fill="white")
-        
-        if status == TrayStatus.RUNNING:
-            draw.polygon([(26, 22), (26, 42), (42, 32)], fill=color)
-        elif status == TrayStatus.PAUSED:
-            draw.rectangle([24, 22, 30, 42], fill=color)
-            draw.rectangle([34, 22, 40, 42], fill=color)
-        elif status in (TrayStatus.WARNING, TrayStatus.ERROR):
-            draw.rectangle([30, 22, 34, 36], fill=color)
-            draw.ellipse([29, 38, 35, 44], fill=color)
-        
-        return image
+        return self._load_icon(status)
     
     def _create_menu(self):
         """Create the system tray menu."""
@@ -181,7 +164,7 @@ class SystrayApp:
         
         logger.info("Starting systray application")
         
-        image = self._create_icon_image(self._status)
+        image = self._icon_cache[self._status]
         menu = self._create_menu()
         
         self._icon = pystray.Icon(
@@ -221,7 +204,7 @@ class SystrayApp:
         self._status = new_status
         
         if self._icon and self._pystray_available:
-            self._icon.icon = self._create_icon_image(new_status)
+            self._icon.icon = self._icon_cache[new_status]
             self._icon.title = f"Leatt - {new_status.value.capitalize()}"
         
         logger.debug(f"Tray status changed to: {new_status.value}")
@@ -237,16 +220,22 @@ class SystrayApp:
     
     def flash_warning(self) -> None:
         """Temporarily show warning status."""
-        original_status = self._status
-        self.set_status(TrayStatus.WARNING.value)
-        
-        def restore():
-            import time
-            time.sleep(3)
-            if self._status == TrayStatus.WARNING:
-                self.set_status(original_status.value)
+        with self._flash_lock:
+            if self._flash_timer is not None and self._flash_timer.is_alive():
+                self._flash_timer.cancel()
+            else:
+                self._flash_restore_status = self._status
+            
+            self._flash_timer = threading.Timer(3.0, self._restore_after_flash)
+            self._flash_timer.daemon = True
+            self._flash_timer.start()
         
-        threading.Thread(target=restore, daemon=True).start()
+        self.set_status(TrayStatus.WARNING.value)
+    
+    def _restore_after_flash(self) -> None:
+        """Restore the status that was active before flash_warning."""
+        if self._status == TrayStatus.WARNING:
+            self.set_status(self._flash_restore_status.value)
     
     @property
     def is_running(self) -> bool:
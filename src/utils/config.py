@@ -1,14 +1,31 @@
 """Configuration management for Leatt."""
 
+import threading
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 from .logger import get_logger
 
 logger = get_logger("config")
 
 _config: Optional["Config"] = None
+_config_lock = threading.Lock()
+
+
+def _flatten(data: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """Yield (dotted_key, value) pairs for every node of a nested dict."""
+    for key, value in data.items():
+        dotted = f"{prefix}{key}"
+        yield dotted, value
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{dotted}.")
 
 
 class Config:
@@ -21,6 +38,8 @@ class Config:
         self.config_dir = config_dir
         self._default: dict[str, Any] = {}
         self._rules: dict[str, Any] = {}
+        self._default_flat: dict[str, Any] = {}
+        self._rules_flat: dict[str, Any] = {}
         
         self._load_configs()
     
@@ -33,20 +52,20 @@ class Config:
         
         if default_path.exists():
             with open(default_path, "r", encoding="utf-8") as f:
-                self._default = yaml.safe_load(f) or {}
+                self._default = yaml.load(f, Loader=_Loader) or {}
             logger.info(f"Loaded default config from {default_path}")
         else:
             logger.warning(f"Default config not found at {default_path}")
         
         if user_path.exists():
             with open(user_path, "r", encoding="utf-8") as f:
-                user_config = yaml.safe_load(f) or {}
+                user_config = yaml.load(f, Loader=_Loader) or {}
                 self._merge_config(self._default, user_config)
             logger.info(f"Loaded user config from {user_path}")
         
         if rules_path.exists():
             with open(rules_path, "r", encoding="utf-8") as f:
-                self._rules = yaml.safe_load(f) or {}
+                self._rules = yaml.load(f, Loader=_Loader) or {}
             logger.info(f"Loaded rules config from {rules_path}")
         else:
             logger.warning(f"Rules config not found at {rules_path}")
@@ -54,9 +73,12 @@ class Config:
         self._whitelist_config: list[str] = []
         if whitelist_path.exists():
             with open(whitelist_path, "r", encoding="utf-8") as f:
-                whitelist_data = yaml.safe_load(f) or {}
+                whitelist_data = yaml.load(f, Loader=_Loader) or {}
                 self._whitelist_config = whitelist_data.get("trusted_processes", [])
             logger.info(f"Loaded {len(self._whitelist_config)} entries from whitelist config")
+        
+        self._default_flat = dict(_flatten(self._default))
+        self._rules_flat = dict(_flatten(self._rules))
     
     def _merge_config(self, base: dict, override: dict) -> None:
         """Recursively merge override config into base config."""
@@ -69,67 +91,52 @@ class Config:
     def reload(self) -> None:
         """Reload configuration from files."""
         self._load_configs()
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
         logger.info("Configuration reloaded")
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation."""
-        keys = key.split(".")
-        value = self._default
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._default_flat.get(key, default)
     
     def get_rule(self, key: str, default: Any = None) -> Any:
         """Get a rule configuration value using dot notation."""
-        keys = key.split(".")
-        value = self._rules
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._rules_flat.get(key, default)
     
-    @property
+    @cached_property
     def app_name(self) -> str:
         return self.get("app.name", "Leatt")
     
-    @property
+    @cached_property
     def app_version(self) -> str:
         return self.get("app.version", "0.1.0")
     
-    @property
+    @cached_property
     def learning_mode(self) -> bool:
         return self.get("app.learning_mode", True)
     
-    @property
+    @cached_property
     def process_monitoring_enabled(self) -> bool:
         return self.get("monitoring.process.enabled", True)
     
-    @property
+    @cached_property
     def process_interval(self) -> int:
         return self.get("monitoring.process.interval_seconds", 5)
     
-    @property
+    @cached_property
     def file_monitoring_enabled(self) -> bool:
         return self.get("monitoring.file.enabled", True)
     
-    @property
+    @cached_property
     def watched_folders(self) -> list[str]:
         return self.get("monitoring.file.watched_folders", [])
     
-    @property
+    @cached_property
     def sensitive_extensions(self) -> list[str]:
         return self.get("monitoring.file.sensitive_extensions", [])
     
-    @property
+    @cached_property
     def sensitive_patterns(self) -> list[str]:
         return self.get("monitoring.file.sensitive_patterns", [])
     
@@ -137,63 +144,63 @@ class Config:
     def user_whitelist(self) -> list[str]:
         return self._whitelist_config if hasattr(self, '_whitelist_config') else []
     
-    @property
+    @cached_property
     def network_monitoring_enabled(self) -> bool:
         return self.get("monitoring.network.enabled", True)
     
-    @property
+    @cached_property
     def network_interval(self) -> int:
         return self.get("monitoring.network.interval_seconds", 3)
     
-    @property
+    @cached_property
     def registry_monitoring_enabled(self) -> bool:
         return self.get("monitoring.registry.enabled", True)
     
-    @property
+    @cached_property
     def notifications_enabled(self) -> bool:
         return self.get("alerts.notifications_enabled", True)
     
-    @property
+    @cached_property
     def web_enabled(self) -> bool:
         return self.get("web.enabled", False)
     
-    @property
+    @cached_property
     def web_host(self) -> str:
         return self.get("web.host", "127.0.0.1")
     
-    @property
+    @cached_property
     def web_port(self) -> int:
         return self.get("web.port", 8080)
     
-    @property
+    @cached_property
     def ml_enabled(self) -> bool:
         return self.get("ml.enabled", False)
     
-    @property
+    @cached_property
     def max_upload_mb_per_min(self) -> int:
         return self.get_rule("network.max_upload_mb_per_min", 50)
     
-    @property
+    @cached_property
     def suspicious_ports(self) -> list[int]:
         return self.get_rule("network.suspicious_ports", [])
     
-    @property
+    @cached_property
     def suspicious_process_names(self) -> list[str]:
         return self.get_rule("processes.suspicious_names", [])
     
-    @property
+    @cached_property
     def low_risk_threshold(self) -> int:
         return self.get_rule("scoring.low_threshold", 30)
     
-    @property
+    @cached_property
     def medium_risk_threshold(self) -> int:
         return self.get_rule("scoring.medium_threshold", 60)
     
-    @property
+    @cached_property
     def high_risk_threshold(self) -> int:
         return self.get_rule("scoring.high_threshold", 80)
     
-    @property
+    @cached_property
     def critical_risk_threshold(self) -> int:
         return self.get_rule("scoring.critical_threshold", 95)
 
@@ -201,6 +208,10 @@ class Config:
 def get_config() -> Config:
     """Get the global configuration instance."""
     global _config
-    if _config is None:
-        _config = Config()
-    return _config
+    config = _config
+    if config is None:
+        with _config_lock:
+            config = _config
+            if config is None:
+                config = _config = Config()
+    return config
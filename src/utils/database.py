@@ -1,12 +1,14 @@
 """SQLite database management for Leatt."""
 
+import time
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 from enum import Enum
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text
+from sqlalchemy import create_engine, event, select, update, func, Column, Index, Integer, String, Float, DateTime, Boolean, Text
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 
 from .logger import get_logger
@@ -17,6 +19,13 @@ Base = declarative_base()
 
 _database: Optional["Database"] = None
 
+# Page cache per SQLite connection, in KiB
+SQLITE_CACHE_KIB = 8192
+# Statements slower than this are logged as warnings
+SLOW_QUERY_SECONDS = 0.1
+# Ids bound per IN (...) list, under the 999 parameters older SQLite builds allow
+SQLITE_MAX_PARAMS = 900
+
 
 class AlertSeverity(str, Enum):
     LOW = "low"
@@ -112,19 +121,158 @@ class QuarantineEvent(Base):
     success = Column(Boolean, default=True)
 
 
+class StatCounter(Base):
+    """Row counts kept current by triggers, read by the dashboard stats."""
+    __tablename__ = "counters"
+    
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+
+Index("ix_processes_last_seen", ProcessRecord.last_seen.desc())
+Index("ix_alerts_timestamp", Alert.timestamp.desc())
+Index(
+    "ix_alerts_unacknowledged",
+    Alert.acknowledged,
+    sqlite_where=Alert.acknowledged == False,
+    postgresql_where=Alert.acknowledged == False,
+)
+Index("ix_network_events_timestamp", NetworkEvent.timestamp.desc())
+Index("ix_file_events_timestamp", FileEvent.timestamp.desc())
+Index("ix_quarantine_events_timestamp", QuarantineEvent.timestamp.desc())
+
+
+# Counter name -> (table, SQL condition a row must meet to be counted)
+_COUNTERS = {
+    "total_alerts": ("alerts", "1"),
+    "unacknowledged_alerts": ("alerts", "{row}.acknowledged IS 0"),
+    "monitored_processes": ("processes", "1"),
+    "network_events": ("network_events", "1"),
+    "file_events": ("file_events", "1"),
+}
+
+# Tables whose every row change bumps a "<table>_version" counter, letting API
+# responses be revalidated without re-running their query
+_VERSIONED_TABLES = (
+    "alerts", "processes", "network_events", "file_events", "quarantine_events", "trusted_processes",
+)
+
+
+def _counter_trigger_ddl() -> list[str]:
+    """Build the triggers that keep the counters table in step with inserts and deletes."""
+    statements = []
+    for table in sorted({table for table, _ in _COUNTERS.values()}):
+        counters = [(name, cond) for name, (t, cond) in _COUNTERS.items() if t == table]
+        for op, row, sign in (("INSERT", "NEW", "+"), ("DELETE", "OLD", "-")):
+            updates = " ".join(
+                f"UPDATE counters SET value = value {sign} 1 "
+                f"WHERE name = '{name}' AND {cond.format(row=row)};"
+                for name, cond in counters
+            )
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_count_{op.lower()} "
+                f"AFTER {op} ON {table} BEGIN {updates} END"
+            )
+    
+    statements.append(
+        "CREATE TRIGGER IF NOT EXISTS trg_alerts_count_acknowledge "
+        "AFTER UPDATE OF acknowledged ON alerts BEGIN "
+        "UPDATE counters SET value = value + (NEW.acknowledged IS 0) - (OLD.acknowledged IS 0) "
+        "WHERE name = 'unacknowledged_alerts'; END"
+    )
+    
+    for table in _VERSIONED_TABLES:
+        for op in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{op.lower()} "
+                f"AFTER {op} ON {table} BEGIN "
+                f"UPDATE counters SET value = value + 1 WHERE name = '{table}_version'; END"
+            )
+    return statements
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Use WAL so dashboard reads do not block monitor writes."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    # Page cache is per pooled connection, so keep it modest (negative = KiB)
+    cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_KIB}")
+    cursor.close()
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Warn about statements slower than SLOW_QUERY_SECONDS."""
+    elapsed = time.perf_counter() - conn.info["query_start"]
+    if elapsed > SLOW_QUERY_SECONDS:
+        logger.warning(f"Slow query ({elapsed * 1000:.0f} ms): {' '.join(statement.split())[:500]}")
+
+
+def name_id(name: Optional[str]) -> Optional[int]:
+    """Stable 32-bit fingerprint of a case-folded process name."""
+    if not name:
+        return None
+    return zlib.crc32(name.lower().encode("utf-8"))
+
+
+def _register_functions(dbapi_connection, connection_record) -> None:
+    """Expose name_id() to SQL so queries can emit the same fingerprint."""
+    dbapi_connection.create_function("name_id", 1, name_id, deterministic=True)
+
+
 class Database:
     """Database connection and operations."""
     
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pool_size: int = 10, max_overflow: int = 20):
         self.db_path = db_path
         db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        self.engine = create_engine(
+            f"sqlite:///{db_path}",
+            echo=False,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_use_lifo=True,
+            connect_args={"timeout": 15},
+        )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
+        event.listen(self.engine, "connect", _register_functions)
+        event.listen(self.engine, "before_cursor_execute", _start_query_timer)
+        event.listen(self.engine, "after_cursor_execute", _log_slow_query)
         Base.metadata.create_all(self.engine)
+        self._create_missing_indexes()
+        self._create_counters()
         
         self._session_factory = sessionmaker(bind=self.engine)
         logger.info(f"Database initialized at {db_path}")
     
+    def _create_missing_indexes(self) -> None:
+        """Add indexes introduced after a database file was first created."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+    
+    def _create_counters(self) -> None:
+        """Install the counter triggers and seed any counter that does not exist yet."""
+        with self.engine.begin() as conn:
+            for ddl in _counter_trigger_ddl():
+                conn.exec_driver_sql(ddl)
+            
+            for name, (table, cond) in _COUNTERS.items():
+                conn.exec_driver_sql(
+                    f"INSERT OR IGNORE INTO counters (name, value) "
+                    f"SELECT '{name}', COUNT(*) FROM {table} WHERE {cond.format(row=table)}"
+                )
+            
+            for table in _VERSIONED_TABLES:
+                conn.exec_driver_sql(
+                    f"INSERT OR IGNORE INTO counters (name, value) VALUES ('{table}_version', 0)"
+                )
+    
     def get_session(self) -> Session:
         """Get a new database session."""
         return self._session_factory()
@@ -281,6 +429,53 @@ class Database:
                 acknowledged=False
             ).order_by(Alert.timestamp.desc()).all()
     
+    def acknowledge_alerts(self, alert_ids: list[int]) -> int:
+        """Acknowledge several alerts in one UPDATE. Returns how many were newly acknowledged.
+        
+        Alerts that are already acknowledged are not rewritten.
+        """
+        updated = 0
+        with self.get_session() as session:
+            # Chunked so the IN (...) list stays under SQLite's bound-parameter limit
+            for start in range(0, len(alert_ids), SQLITE_MAX_PARAMS):
+                chunk = alert_ids[start:start + SQLITE_MAX_PARAMS]
+                stmt = (
+                    update(Alert)
+                    .where(Alert.id.in_(chunk), Alert.acknowledged == False)
+                    .values(acknowledged=True)
+                )
+                updated += session.execute(stmt).rowcount
+            session.commit()
+        return updated
+    
+    def alert_exists(self, alert_id: int) -> bool:
+        """Check whether an alert id exists."""
+        stmt = select(Alert.id).where(Alert.id == alert_id)
+        with self.get_session() as session:
+            return session.scalar(stmt) is not None
+    
+    def table_version(self, table: str) -> int:
+        """Change counter for a table, bumped by triggers on every row write."""
+        with self.get_session() as session:
+            counter = session.get(StatCounter, f"{table}_version")
+            return counter.value if counter else 0
+    
+    def count_unacknowledged_alerts(self) -> int:
+        """Count unacknowledged alerts without loading them."""
+        stmt = select(func.count()).select_from(Alert).where(Alert.acknowledged == False)
+        with self.get_session() as session:
+            return session.scalar(stmt)
+    
+    def get_stats(self) -> dict[str, int]:
+        """Get row counts for the dashboard from the trigger-maintained counters."""
+        stats = dict.fromkeys(_COUNTERS, 0)
+        
+        with self.get_session() as session:
+            stmt = select(StatCounter.name, StatCounter.value).where(StatCounter.name.in_(_COUNTERS))
+            stats.update(session.execute(stmt).all())
+        
+        return stats
+    
     def add_quarantine_event(
         self,
         pid: int,
@@ -318,6 +513,13 @@ def get_database() -> Database:
     """Get the global database instance."""
     global _database
     if _database is None:
+        from .config import get_config
+        
+        config = get_config()
         db_path = Path(__file__).parent.parent.parent / "data" / "leatt.db"
-        _database = Database(db_path)
+        _database = Database(
+            db_path,
+            pool_size=config.get("database.pool_size", 10),
+            max_overflow=config.get("database.max_overflow", 20),
+        )
     return _database
@@ -1,12 +1,35 @@
 """Logging configuration for Leatt."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
-_loggers: dict[str, logging.Logger] = {}
+_listener: Optional[logging.handlers.QueueListener] = None
+# Handlers the listener writes to, closed in order when it stops
+_handlers: list[logging.Handler] = []
+
+
+def _stop_listener() -> None:
+    """Drain and stop the background logging thread, then close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    
+    # The buffering handler comes before its file target, so closing it
+    # flushes the buffered records while the file is still open
+    for handler in _handlers:
+        handler.close()
+    _handlers.clear()
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging(
@@ -15,6 +38,10 @@ def setup_logging(
     log_dir: Optional[Path] = None,
 ) -> None:
     """Configure logging for the application."""
+    global _listener
+    
+    _stop_listener()
+    
     level = getattr(logging, log_level.upper(), logging.INFO)
     
     log_format = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
@@ -32,18 +59,38 @@ def setup_logging(
         log_dir.mkdir(parents=True, exist_ok=True)
         
         log_file = log_dir / f"leatt_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=10 * 1024 * 1024,
+            backupCount=5,
+            encoding="utf-8",
+        )
         file_handler.setFormatter(logging.Formatter(log_format, date_format))
-        handlers.append(file_handler)
+        
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=256,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+        )
+        handlers.append(buffered_handler)
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        *handlers,
+        respect_handler_level=True,
+    )
+    _listener.start()
+    _handlers.extend(handlers)
+    if log_to_file:
+        _handlers.append(file_handler)
     
     root_logger = logging.getLogger("leatt")
     root_logger.setLevel(level)
-    root_logger.handlers = handlers
+    root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a module."""
-    if name not in _loggers:
-        logger = logging.getLogger(f"leatt.{name}")
-        _loggers[name] = logger
-    return _loggers[name]
+    return logging.getLogger(f"leatt.{name}")
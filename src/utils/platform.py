@@ -3,6 +3,8 @@
 import os
 import sys
 import hashlib
+import mmap
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
@@ -20,6 +22,78 @@ class OperatingSystem(str, Enum):
     UNKNOWN = "unknown"
 
 
+_PLATFORM_WIN = sys.platform == "win32"
+_PLATFORM_LINUX = sys.platform == "linux"
+_PLATFORM_MAC = sys.platform == "darwin"
+
+if _PLATFORM_WIN:
+    _OS = OperatingSystem.WINDOWS
+elif _PLATFORM_LINUX:
+    _OS = OperatingSystem.LINUX
+elif _PLATFORM_MAC:
+    _OS = OperatingSystem.MACOS
+else:
+    _OS = OperatingSystem.UNKNOWN
+
+_WIN_SYS_PATHS = (
+    "c:\\windows\\",
+    "c:\\program files\\",
+    "c:\\program files (x86)\\",
+)
+_POSIX_SYS_PATHS = (
+    "/usr/bin/",
+    "/usr/sbin/",
+    "/bin/",
+    "/sbin/",
+    "/usr/lib/",
+)
+
+_KNOWN_BROWSERS = frozenset({
+    "chrome.exe", "chrome",
+    "firefox.exe", "firefox",
+    "msedge.exe", "msedge",
+    "brave.exe", "brave",
+    "opera.exe", "opera",
+    "safari",
+    "iexplore.exe",
+})
+
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _sensitive_folders() -> tuple[Path, ...]:
+    """Existing sensitive folders for this OS, resolved once."""
+    home = Path.home()
+    
+    folders = [
+        home / "Documents",
+        home / "Downloads",
+        home / "Desktop",
+        home / ".ssh",
+    ]
+    
+    if _PLATFORM_WIN:
+        appdata = os.environ.get("APPDATA")
+        localappdata = os.environ.get("LOCALAPPDATA")
+        
+        if appdata:
+            folders.append(Path(appdata))
+        if localappdata:
+            folders.append(Path(localappdata))
+        if appdata:
+            folders.append(Path(appdata) / "Microsoft" / "Credentials")
+    else:
+        folders += [
+            home / ".gnupg",
+            home / ".aws",
+            home / ".config",
+        ]
+    
+    return tuple(p for p in folders if p.exists())
+
+
 @dataclass
 class SystemInfo:
     """System information."""
@@ -37,23 +111,17 @@ class PlatformUtils:
     @staticmethod
     def get_os() -> OperatingSystem:
         """Get the current operating system."""
-        if sys.platform == "win32":
-            return OperatingSystem.WINDOWS
-        elif sys.platform == "linux":
-            return OperatingSystem.LINUX
-        elif sys.platform == "darwin":
-            return OperatingSystem.MACOS
-        return OperatingSystem.UNKNOWN
+        return _OS
     
     @staticmethod
     def is_windows() -> bool:
         """Check if running on Windows."""
-        return sys.platform == "win32"
+        return _PLATFORM_WIN
     
     @staticmethod
     def is_linux() -> bool:
         """Check if running on Linux."""
-        return sys.platform == "linux"
+        return _PLATFORM_LINUX
     
     @staticmethod
     def get_system_info() -> SystemInfo:
@@ -72,9 +140,10 @@ class PlatformUtils:
         )
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_admin() -> bool:
         """Check if running with admin/root privileges."""
-        if PlatformUtils.is_windows():
+        if _PLATFORM_WIN:
             try:
                 import ctypes
                 return ctypes.windll.shell32.IsUserAnAdmin() != 0
@@ -92,46 +161,55 @@ class PlatformUtils:
     @staticmethod
     def get_sensitive_folders() -> list[Path]:
         """Get list of sensitive folders to monitor based on OS."""
-        home = Path.home()
-        
-        common_folders = [
-            home / "Documents",
-            home / "Downloads",
-            home / "Desktop",
-            home / ".ssh",
-        ]
-        
-        if PlatformUtils.is_windows():
-            appdata = Path(os.environ.get("APPDATA", ""))
-            localappdata = Path(os.environ.get("LOCALAPPDATA", ""))
-            
-            return common_folders + [
-                appdata,
-                localappdata,
-                appdata / "Microsoft" / "Credentials",
-            ]
-        else:
-            return common_folders + [
-                home / ".gnupg",
-                home / ".aws",
-                home / ".config",
-            ]
+        return list(_sensitive_folders())
     
     @staticmethod
     def get_temp_folder() -> Path:
         """Get the system temp folder."""
-        if PlatformUtils.is_windows():
+        if _PLATFORM_WIN:
             return Path(os.environ.get("TEMP", "C:\\Windows\\Temp"))
         return Path("/tmp")
     
     @staticmethod
     def compute_file_hash(file_path: Path, algorithm: str = "sha256") -> Optional[str]:
         """Compute hash of a file."""
+        if algorithm == "blake3":
+            return PlatformUtils._compute_blake3(file_path)
+        
         try:
-            hasher = hashlib.new(algorithm)
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(65536), b""):
+                if os.fstat(f.fileno()).st_size > 0:
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            hasher = hashlib.new(algorithm)
+                            hasher.update(mm)
+                            return hasher.hexdigest()
+                    except (ValueError, OSError):
+                        f.seek(0)
+                
+                if _HAS_FILE_DIGEST:
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+                
+                hasher = hashlib.new(algorithm)
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
                     hasher.update(chunk)
+                return hasher.hexdigest()
+        except (OSError, IOError) as e:
+            logger.debug(f"Cannot hash file {file_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _compute_blake3(file_path: Path) -> Optional[str]:
+        """Compute a multithreaded, memory-mapped BLAKE3 digest of a file."""
+        try:
+            import blake3
+        except ImportError:
+            logger.warning("blake3 not available, install leatt[hash] to use it")
+            return None
+        
+        try:
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(str(file_path))
             return hasher.hexdigest()
         except (OSError, IOError) as e:
             logger.debug(f"Cannot hash file {file_path}: {e}")
@@ -156,41 +234,17 @@ class PlatformUtils:
             return False
         
         path_str = str(process_path).lower()
-        
-        if PlatformUtils.is_windows():
-            system_paths = [
-                "c:\\windows\\",
-                "c:\\program files\\",
-                "c:\\program files (x86)\\",
-            ]
-        else:
-            system_paths = [
-                "/usr/bin/",
-                "/usr/sbin/",
-                "/bin/",
-                "/sbin/",
-                "/usr/lib/",
-            ]
-        
-        return any(path_str.startswith(sp) for sp in system_paths)
+        return path_str.startswith(_WIN_SYS_PATHS if _PLATFORM_WIN else _POSIX_SYS_PATHS)
     
     @staticmethod
-    def get_known_browsers() -> list[str]:
-        """Get list of known browser process names."""
-        return [
-            "chrome.exe", "chrome",
-            "firefox.exe", "firefox",
-            "msedge.exe", "msedge",
-            "brave.exe", "brave",
-            "opera.exe", "opera",
-            "safari",
-            "iexplore.exe",
-        ]
+    def get_known_browsers() -> frozenset[str]:
+        """Get set of known browser process names."""
+        return _KNOWN_BROWSERS
     
     @staticmethod
     def registry_available() -> bool:
         """Check if Windows registry monitoring is available."""
-        if not PlatformUtils.is_windows():
+        if not _PLATFORM_WIN:
             return False
         try:
             import winreg
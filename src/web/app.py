@@ -1,15 +1,57 @@
 """FastAPI web dashboard for Leatt."""
 
+import asyncio
+import hashlib
+import html
+import json
+import secrets
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+import psutil
+
 from ..utils.logger import get_logger
 from ..utils.config import get_config
+from sqlalchemy import func, select, tuple_
+
+from ..utils.database import (
+    get_database, Alert, ProcessRecord, NetworkEvent, FileEvent, QuarantineEvent, StatCounter,
+)
+from ..trust.whitelist import Whitelist
+from .cache import ResponseCache
+from .compression import StaticAsset
+from .metrics import LatencyMiddleware, create_metrics
 
 logger = get_logger("web")
 
+STATIC_DIR = Path(__file__).parent / "static"
+# The page template lives outside STATIC_DIR so the mount never serves it unrendered
+DASHBOARD_PATH = Path(__file__).parent / "templates" / "dashboard.html"
+# Assets the page links by URL: url -> (file in STATIC_DIR, media type, preload kind)
+DASHBOARD_ASSETS = {
+    "/static/dashboard.css": ("dashboard.css", "text/css", "style"),
+    "/static/dashboard.js": ("dashboard.js", "text/javascript", "script"),
+}
+
+# Seconds between change checks for each /api/events stream
+EVENT_POLL_INTERVAL = 2.0
+# Send an SSE comment at least this often so proxies keep the stream open
+EVENT_HEARTBEAT = 30.0
+# Most new alerts pushed per stream check; the client's refresh() loads the rest
+EVENT_ALERT_LIMIT = 50
+
+# Pages with a larger limit are streamed as a JSON array, not built in one piece
+STREAM_MIN_ROWS = 1000
+# Seconds a cached process/network/file page is served before re-querying
+PAGE_TTL = 5.0
+# How long an expired cache entry may stand in when its query fails
+STALE_FOR = 300.0
+# Most alert ids one batch acknowledge request may carry
+MAX_ACK_IDS = 10000
+
 
 class WebDashboard:
     """Web dashboard server using FastAPI."""
@@ -19,11 +61,16 @@ class WebDashboard:
         self.port = port
         self.config = get_config()
         
+        self._cache = ResponseCache()
         self._app = None
         self._server = None
         self._thread: Optional[threading.Thread] = None
         self._running = False
         
+        # Set by notify_alerts() to wake /api/events streams before their next poll
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup = asyncio.Event()
+        
         self._fastapi_available = self._check_fastapi()
         
         if self._fastapi_available:
@@ -46,201 +93,406 @@ class WebDashboard:
         from fastapi.responses import HTMLResponse, JSONResponse
         from fastapi.staticfiles import StaticFiles
         
+        from .middleware import CompressionMiddleware
+        
+        try:
+            import orjson
+            from fastapi.responses import ORJSONResponse as DefaultResponse
+        except ImportError:
+            logger.debug("orjson not available, using stdlib JSON responses")
+            DefaultResponse = JSONResponse
+        
         self._app = FastAPI(
             title="Leatt Dashboard",
             description="Data Leak Prevention monitoring dashboard",
-            version="0.1.0",
+            version=self.config.app_version,
+            default_response_class=DefaultResponse,
         )
+        self._json_response = DefaultResponse
+        self._app.add_middleware(CompressionMiddleware, minimum_size=500, compresslevel=5, brotli_quality=4)
+        
+        # The page links its assets by content hash so they can be cached
+        # indefinitely; everything is rendered and compressed once, here.
+        page = DASHBOARD_PATH.read_bytes()
+        for placeholder, value in (("APP_NAME", self.config.app_name), ("VERSION", self.config.app_version)):
+            page = page.replace(f"{{{{{placeholder}}}}}".encode(), html.escape(value).encode())
+        self._assets: dict[str, StaticAsset] = {}
+        preloads = []
+        for url, (filename, media_type, kind) in DASHBOARD_ASSETS.items():
+            asset = StaticAsset((STATIC_DIR / filename).read_bytes(), media_type)
+            versioned = f"{url}?v={asset.digest[:12]}"
+            page = page.replace(url.encode(), versioned.encode())
+            preloads.append(f"<{versioned}>; rel=preload; as={kind}")
+            self._assets[url] = asset
+        self._dashboard = StaticAsset(page, "text/html")
+        self._dashboard_preloads = ", ".join(preloads)
+        
+        self._db = get_database()
+        self._whitelist = Whitelist()
+        # Part of version-based ETags, so they never match across restarts
+        self._boot_id = secrets.token_hex(4)
+        
+        self._metrics = create_metrics(self._db.engine.pool, self._whitelist)
+        if self._metrics is not None:
+            self._app.add_middleware(LatencyMiddleware, metrics=self._metrics)
         
         self._setup_routes()
+        # Mounted after the routes so the precompressed script route wins
+        self._app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
         
         logger.info("FastAPI application created")
     
     def _setup_routes(self) -> None:
         """Setup API routes."""
         from fastapi import Request
-        from fastapi.responses import HTMLResponse, JSONResponse
+        from fastapi.concurrency import run_in_threadpool
+        from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+        from . import schemas
         
         app = self._app
         
+        def wants_ndjson(request: Request) -> bool:
+            """Check whether the client asked for a streamed NDJSON body."""
+            return "application/x-ndjson" in request.headers.get("accept", "")
+        
+        def row_batches(model, stmt, keys):
+            """JSON rows rendered by SQLite in page order, fetched and yielded 200 at a time."""
+            with self._db.get_session() as session:
+                query = schemas.json_page(model, stmt, *keys).execution_options(yield_per=200)
+                for batch in session.execute(query).partitions():
+                    yield [row[-1] for row in batch]
+        
+        def stream_ndjson(model, stmt, keys):
+            """Stream rows as NDJSON, one chunk per fetched batch."""
+            def chunks():
+                for batch in row_batches(model, stmt, keys):
+                    yield "\n".join(batch) + "\n"
+            
+            return StreamingResponse(chunks(), media_type="application/x-ndjson")
+        
+        def stream_json(model, stmt, keys, headers: dict):
+            """Stream rows as one JSON array, framed around each fetched batch."""
+            def chunks():
+                opening = "["
+                for batch in row_batches(model, stmt, keys):
+                    yield opening + ",".join(batch)
+                    opening = ","
+                yield "[]" if opening == "[" else "]"
+            
+            return StreamingResponse(chunks(), media_type="application/json", headers=headers)
+        
+        def serve_asset(request: Request, asset: StaticAsset, headers: dict) -> Response:
+            """Serve a precompressed asset, answering 304 for a matching ETag."""
+            encoding, body, etag = asset.select(request.headers.get("accept-encoding", ""))
+            headers["ETag"] = etag
+            
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            
+            if encoding is not None:
+                headers["Content-Encoding"] = encoding
+                headers["Vary"] = "Accept-Encoding"
+            return Response(body, media_type=asset.media_type, headers=headers)
+        
         @app.get("/", response_class=HTMLResponse)
-        async def index():
-            """Main dashboard page."""
-            return self._render_dashboard()
+        async def index(request: Request):
+            """Main dashboard page, served from precompressed bodies."""
+            return serve_asset(request, self._dashboard, {
+                "Cache-Control": "public, max-age=300, stale-while-revalidate=60",
+                "Link": self._dashboard_preloads,
+            })
+        
+        async def dashboard_asset(request: Request):
+            """Dashboard CSS/JS; URLs carry the content hash, so they never change."""
+            return serve_asset(request, self._assets[request.url.path], {
+                "Cache-Control": "public, max-age=31536000, immutable",
+            })
+        
+        for url in DASHBOARD_ASSETS:
+            app.add_api_route(url, dashboard_asset, include_in_schema=False)
+        
+        if self._metrics is not None:
+            @app.get("/metrics", include_in_schema=False)
+            def metrics():
+                """Request latency and pool usage for Prometheus to scrape."""
+                return Response(self._metrics.render(), media_type=self._metrics.content_type)
         
         @app.get("/api/status")
-        async def get_status():
+        def get_status():
             """Get current system status."""
-            from ..utils.database import get_database
-            
-            db = get_database()
-            unacked_alerts = db.get_unacknowledged_alerts()
-            
             return {
                 "status": "running",
-                "timestamp": datetime.utcnow().isoformat(),
-                "unacknowledged_alerts": len(unacked_alerts),
+                "timestamp": datetime.utcnow(),
+                "unacknowledged_alerts": self._db.count_unacknowledged_alerts(),
                 "learning_mode": self.config.learning_mode,
             }
         
+        def json_with_etag(request: Request, body: bytes, headers: dict) -> Response:
+            """JSON response with a content-hash ETag, or 304 if the client has it."""
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            headers.update({"ETag": etag, "Cache-Control": "no-cache"})
+            
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+            
+            return Response(body, media_type="application/json", headers=headers)
+        
+        # (path, query) -> ETag of the last cached page, so a page whose change
+        # counter cannot be read still finds its stale copy in the cache
+        page_etags: OrderedDict[tuple, str] = OrderedDict()
+        page_etags_lock = threading.Lock()
+        
+        def remember_etag(url: tuple, etag: str) -> None:
+            with page_etags_lock:
+                page_etags[url] = etag
+                page_etags.move_to_end(url)
+                if len(page_etags) > ResponseCache.MAX_ENTRIES:
+                    page_etags.popitem(last=False)
+        
+        def newest_order(column) -> tuple:
+            """Columns a newest-first page sorts on: column, then id to break ties."""
+            id_column = column.class_.id
+            return (column,) if column is id_column else (column, id_column)
+        
+        def list_page(request, model, stmt, column, limit, before, counter=None, ttl=None, before_id=None):
+            """Return one newest-first page, keyed on column rather than an offset.
+            
+            Rows are ordered by (column, id), so rows sharing a timestamp are
+            not skipped between pages: X-Next-Cursor and X-Next-Cursor-Id carry
+            the last row's values, sent back as before and before_id.
+            
+            Row JSON is rendered by SQLite (see schemas.json_page), and streamed
+            in batches above STREAM_MIN_ROWS. When counter names a stats counter,
+            its value is sent as X-Total-Count, read in the same transaction as the
+            page. The ETag comes from the table's change counter, so revalidating an
+            unchanged page costs one primary-key read. With a ttl, the page is
+            cached per URL, and served stale for STALE_FOR seconds if the
+            database fails.
+            """
+            order = newest_order(column)
+            if before is not None and before_id is not None and len(order) > 1:
+                stmt = stmt.where(tuple_(*order) < (before, before_id))
+            elif before is not None:
+                stmt = stmt.where(column < before)
+            
+            keys = tuple(c.key for c in order)
+            stmt = stmt.order_by(*(c.desc() for c in order)).limit(limit)
+            
+            if wants_ndjson(request):
+                return stream_ndjson(model, stmt, keys)
+            
+            def page_headers(session, count, last) -> dict:
+                headers = {}
+                if count == limit and last is not None:
+                    cursor = last[0]
+                    headers["X-Next-Cursor"] = cursor.isoformat() if isinstance(cursor, datetime) else str(cursor)
+                    if len(last) > 1:
+                        headers["X-Next-Cursor-Id"] = str(last[1])
+                
+                if counter is not None:
+                    total = session.get(StatCounter, counter)
+                    headers["X-Total-Count"] = str(total.value if total else 0)
+                return headers
+            
+            if limit > STREAM_MIN_ROWS:
+                with self._db.get_session() as session:
+                    bounds = session.execute(schemas.page_bounds(stmt, *keys)).one_or_none()
+                    count, last = (bounds[0], tuple(bounds[1:])) if bounds else (0, None)
+                    headers = page_headers(session, count, last)
+                return stream_json(model, stmt, keys, headers)
+            
+            # One session (one pooled connection) serves the whole request. The
+            # table's change counter is read before the page, so a write in
+            # between can only cause a spare refetch, never a stale 304.
+            with self._db.get_session() as session:
+                table = column.table.name
+                url = (request.url.path, str(request.query_params))
+                try:
+                    version = session.get(StatCounter, f"{table}_version")
+                except Exception:
+                    # Reuse the last ETag so get_or_set below can fall back to the stale page
+                    etag = page_etags.get(url) if ttl is not None else None
+                    if etag is None:
+                        raise
+                else:
+                    etag = f'"{table}-{version.value if version else 0}-{self._boot_id}"'
+                    if ttl is not None:
+                        remember_etag(url, etag)
+                headers = {"ETag": etag, "Cache-Control": "no-cache"}
+                
+                if request.headers.get("if-none-match") == etag:
+                    return Response(status_code=304, headers=headers)
+                
+                def fetch():
+                    rows = session.execute(schemas.json_page(model, stmt, *keys)).all()
+                    last = tuple(rows[-1][:-1]) if rows else None
+                    return schemas.json_array(rows), page_headers(session, len(rows), last)
+                
+                if ttl is None:
+                    body, page = fetch()
+                else:
+                    key = url + (etag,)
+                    body, page = self._cache.get_or_set("pages", key, ttl, fetch, stale_for=STALE_FOR)
+            
+            headers.update(page)
+            return Response(body, media_type="application/json", headers=headers)
+        
         @app.get("/api/alerts")
-        async def get_alerts(limit: int = 50):
+        def get_alerts(
+            request: Request,
+            limit: int = 50,
+            before: Optional[datetime] = None,
+            before_id: Optional[int] = None,
+        ):
             """Get recent alerts."""
-            from ..utils.database import get_database
-            
-            db = get_database()
-            alerts = db.get_recent_alerts(limit)
+            return list_page(
+                request, schemas.AlertOut,
+                select(Alert), Alert.timestamp, limit, before, "total_alerts",
+                before_id=before_id,
+            )
+        
+        @app.get("/api/alerts/{alert_id}")
+        def get_alert(alert_id: int):
+            """Get one alert including its details."""
+            stmt = select(Alert).where(Alert.id == alert_id)
+            with self._db.get_session() as session:
+                body = session.scalar(schemas.json_rows(schemas.AlertDetailOut, stmt))
+            
+            if body is None:
+                return JSONResponse({"success": False, "error": "Alert not found"}, status_code=404)
+            return Response(body, media_type="application/json")
+        
+        def acknowledge(alert_ids: list[int]) -> int:
+            """Acknowledge alerts and drop the cached stats."""
+            updated = self._db.acknowledge_alerts(alert_ids)
+            if updated:
+                self._cache.clear("stats")
+            return updated
+        
+        @app.post("/api/alerts/acknowledge")
+        async def acknowledge_alerts(request: Request):
+            """Acknowledge several alerts at once."""
+            try:
+                data = await request.json()
+            except ValueError:
+                data = None
+            ids = data.get("ids") if isinstance(data, dict) else None
+            
+            # type() rather than isinstance(), which would let true/false through as 1/0
+            if not isinstance(ids, list) or not all(type(i) is int for i in ids):
+                return JSONResponse({"success": False, "error": "A list of alert ids is required"}, status_code=400)
+            if len(ids) > MAX_ACK_IDS:
+                return JSONResponse(
+                    {"success": False, "error": f"At most {MAX_ACK_IDS} alert ids per request"},
+                    status_code=413,
+                )
             
-            return [
-                {
-                    "id": alert.id,
-                    "timestamp": alert.timestamp.isoformat() if alert.timestamp else None,
-                    "severity": alert.severity,
-                    "source": alert.source,
-                    "process_name": alert.process_name,
-                    "process_pid": alert.process_pid,
-                    "description": alert.description,
-                    "details": alert.details,
-                    "acknowledged": alert.acknowledged,
-                }
-                for alert in alerts
-            ]
+            updated = await run_in_threadpool(acknowledge, ids)
+            return {"success": True, "updated": updated}
         
         @app.post("/api/alerts/{alert_id}/acknowledge")
-        async def acknowledge_alert(alert_id: int):
+        def acknowledge_alert(alert_id: int):
             """Acknowledge an alert."""
-            from ..utils.database import get_database
-            
-            db = get_database()
-            with db.get_session() as session:
-                from ..utils.database import Alert
-                alert = session.query(Alert).filter_by(id=alert_id).first()
-                if alert:
-                    alert.acknowledged = True
-                    session.commit()
-                    return {"success": True}
+            # Nothing updated also covers an alert that was already acknowledged
+            if acknowledge([alert_id]) or self._db.alert_exists(alert_id):
+                return {"success": True}
             
             return {"success": False, "error": "Alert not found"}
         
         @app.get("/api/processes")
-        async def get_processes():
-            """Get monitored processes."""
-            from ..utils.database import get_database
-            
-            db = get_database()
-            with db.get_session() as session:
-                from ..utils.database import ProcessRecord
-                processes = session.query(ProcessRecord).order_by(
-                    ProcessRecord.last_seen.desc()
-                ).limit(100).all()
-                
-                return [
-                    {
-                        "id": proc.id,
-                        "pid": proc.pid,
-                        "name": proc.name,
-                        "path": proc.path,
-                        "user": proc.user,
-                        "is_trusted": proc.is_trusted,
-                        "risk_score": proc.risk_score,
-                        "first_seen": proc.first_seen.isoformat() if proc.first_seen else None,
-                        "last_seen": proc.last_seen.isoformat() if proc.last_seen else None,
-                    }
-                    for proc in processes
-                ]
+        def get_processes(
+            request: Request,
+            limit: int = 100,
+            before: Optional[int] = None,
+        ):
+            """Get monitored processes, newest first by id.
+            
+            last_seen changes on every scan, so it cannot be a stable cursor.
+            """
+            return list_page(
+                request, schemas.ProcessOut,
+                select(ProcessRecord), ProcessRecord.id, limit, before, "monitored_processes",
+                ttl=PAGE_TTL,
+            )
         
         @app.get("/api/network")
-        async def get_network_events(limit: int = 50):
+        def get_network_events(
+            request: Request,
+            limit: int = 50,
+            before: Optional[datetime] = None,
+            before_id: Optional[int] = None,
+        ):
             """Get recent network events."""
-            from ..utils.database import get_database
-            
-            db = get_database()
-            with db.get_session() as session:
-                from ..utils.database import NetworkEvent
-                events = session.query(NetworkEvent).order_by(
-                    NetworkEvent.timestamp.desc()
-                ).limit(limit).all()
-                
-                return [
-                    {
-                        "id": event.id,
-                        "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-                        "process_name": event.process_name,
-                        "process_pid": event.process_pid,
-                        "remote_address": event.remote_address,
-                        "remote_port": event.remote_port,
-                        "bytes_sent": event.bytes_sent,
-                        "bytes_received": event.bytes_received,
-                    }
-                    for event in events
-                ]
+            return list_page(
+                request, schemas.NetworkEventOut,
+                select(NetworkEvent), NetworkEvent.timestamp, limit, before, "network_events",
+                ttl=PAGE_TTL, before_id=before_id,
+            )
         
         @app.get("/api/files")
-        async def get_file_events(limit: int = 50, sensitive_only: bool = False):
+        def get_file_events(
+            request: Request,
+            limit: int = 50,
+            sensitive_only: bool = False,
+            before: Optional[datetime] = None,
+            before_id: Optional[int] = None,
+        ):
             """Get recent file events."""
-            from ..utils.database import get_database
+            stmt = select(FileEvent)
+            if sensitive_only:
+                stmt = stmt.where(FileEvent.is_sensitive == True)
+            
+            return list_page(
+                request, schemas.FileEventOut,
+                stmt, FileEvent.timestamp, limit, before,
+                None if sensitive_only else "file_events",
+                ttl=PAGE_TTL, before_id=before_id,
+            )
+        
+        def whitelist_version() -> int:
+            """Trigger-maintained change counter, so writes from any process count."""
+            return self._db.table_version("trusted_processes")
+        
+        def whitelist_rows(version: int) -> list:
+            """Serialized whitelist rows, rebuilt only when the whitelist version changes."""
+            def build():
+                return schemas.dump_rows(schemas.WHITELIST, self._whitelist.get_all())
             
-            db = get_database()
-            with db.get_session() as session:
-                from ..utils.database import FileEvent
-                query = session.query(FileEvent)
-                if sensitive_only:
-                    query = query.filter_by(is_sensitive=True)
-                events = query.order_by(
-                    FileEvent.timestamp.desc()
-                ).limit(limit).all()
-                
-                return [
-                    {
-                        "id": event.id,
-                        "timestamp": event.timestamp.isoformat() if event.timestamp else None,
-                        "process_name": event.process_name,
-                        "file_path": event.file_path,
-                        "event_type": event.event_type,
-                        "is_sensitive": event.is_sensitive,
-                    }
-                    for event in events
-                ]
+            return self._cache.get_or_set("whitelist", ("rows", version), 300, build)
         
-        @app.get("/api/whitelist")
-        async def get_whitelist():
-            """Get trusted process whitelist."""
-            from ..trust.whitelist import Whitelist
+        def whitelist_json() -> bytes:
+            """Encoded whitelist body, cached alongside the rows."""
+            version = whitelist_version()
             
-            whitelist = Whitelist()
-            entries = whitelist.get_all()
+            def build():
+                return self._json_response(whitelist_rows(version)).body
             
-            return [
-                {
-                    "name": entry.name,
-                    "path": entry.path,
-                    "hash_sha256": entry.hash_sha256,
-                    "publisher": entry.publisher,
-                    "added_by": entry.added_by,
-                    "reason": entry.reason,
-                }
-                for entry in entries
-            ]
+            return self._cache.get_or_set("whitelist", ("json", version), 300, build)
+        
+        @app.get("/api/whitelist")
+        def get_whitelist():
+            """Get trusted process whitelist."""
+            return Response(whitelist_json(), media_type="application/json")
         
         @app.post("/api/whitelist")
         async def add_to_whitelist(request: Request):
             """Add a process to whitelist."""
-            from ..trust.whitelist import Whitelist
-            
             data = await request.json()
             name = data.get("name", "").strip()
             
             if not name:
                 return {"success": False, "error": "Process name required"}
             
-            whitelist = Whitelist()
+            def add_entry():
+                return self._whitelist.add(
+                    name=name,
+                    path=data.get("path"),
+                    reason=data.get("reason"),
+                    added_by="user",
+                )
             
-            entry = whitelist.add(
-                name=name,
-                path=data.get("path"),
-                reason=data.get("reason"),
-                added_by="user",
-            )
+            entry = await run_in_threadpool(add_entry)
+            self._cache.clear("whitelist")
             
             if entry is None:
                 return {"success": False, "error": "Process already whitelisted"}
@@ -248,25 +500,24 @@ class WebDashboard:
             return {"success": True, "name": entry.name}
         
         @app.delete("/api/whitelist/{name}")
-        async def remove_from_whitelist(name: str):
+        def remove_from_whitelist(name: str):
             """Remove a process from whitelist."""
-            from ..trust.whitelist import Whitelist
-            
-            whitelist = Whitelist()
-            success = whitelist.remove(name)
+            success = self._whitelist.remove(name)
+            self._cache.clear("whitelist")
             
             return {"success": success}
         
         @app.post("/api/quarantine/{pid}")
         async def quarantine_process(pid: int, request: Request):
             """Kill/quarantine a process by PID."""
-            import psutil
-            from ..utils.database import get_database
-            
             data = await request.json() if request.headers.get("content-type") == "application/json" else {}
             reason = data.get("reason", "Manually quarantined by user")
             
-            db = get_database()
+            return await run_in_threadpool(terminate_process, pid, reason)
+        
+        def terminate_process(pid: int, reason: str) -> dict:
+            """Terminate a process and record the quarantine event."""
+            db = self._db
             
             try:
                 proc = psutil.Process(pid)
@@ -306,30 +557,21 @@ class WebDashboard:
                 return {"success": False, "error": str(e)}
         
         @app.get("/api/quarantine")
-        async def get_quarantine_history():
+        def get_quarantine_history(
+            request: Request,
+            limit: int = 50,
+            before: Optional[datetime] = None,
+            before_id: Optional[int] = None,
+        ):
             """Get quarantine history."""
-            from ..utils.database import get_database
-            
-            db = get_database()
-            events = db.get_quarantine_history(limit=50)
-            
-            return [
-                {
-                    "id": e.id,
-                    "timestamp": e.timestamp.isoformat() if e.timestamp else None,
-                    "pid": e.pid,
-                    "name": e.name,
-                    "path": e.path,
-                    "reason": e.reason,
-                    "killed_by": e.killed_by,
-                    "success": e.success,
-                }
-                for e in events
-            ]
+            return list_page(
+                request, schemas.QuarantineOut,
+                select(QuarantineEvent), QuarantineEvent.timestamp, limit, before,
+                before_id=before_id,
+            )
         
-        @app.get("/api/config")
-        async def get_config_info():
-            """Get current configuration."""
+        def config_info() -> dict:
+            """Build the configuration summary shown by the dashboard."""
             return {
                 "app_name": self.config.app_name,
                 "version": self.config.app_version,
@@ -342,1044 +584,150 @@ class WebDashboard:
                 "ml_enabled": self.config.ml_enabled,
             }
         
+        @app.get("/api/config")
+        async def get_config_info():
+            """Get current configuration."""
+            return self._cache.get_or_set("config", None, 3600, config_info)
+        
         @app.get("/api/stats")
-        async def get_stats():
+        def get_stats():
             """Get system statistics."""
-            from ..utils.database import get_database
-            
-            db = get_database()
-            with db.get_session() as session:
-                from ..utils.database import Alert, ProcessRecord, NetworkEvent, FileEvent
-                
-                return {
-                    "total_alerts": session.query(Alert).count(),
-                    "unacknowledged_alerts": session.query(Alert).filter_by(acknowledged=False).count(),
-                    "monitored_processes": session.query(ProcessRecord).count(),
-                    "network_events": session.query(NetworkEvent).count(),
-                    "file_events": session.query(FileEvent).count(),
-                }
-    
-    def _render_dashboard(self) -> str:
-        """Render the main dashboard HTML."""
-        return """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Leatt Dashboard</title>
-    <link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>🛡️</text></svg>">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root {
-            --bg-primary: #0a0a0f;
-            --bg-secondary: #12121a;
-            --bg-card: #16161f;
-            --bg-hover: #1e1e2a;
-            --border: #2a2a3a;
-            --text-primary: #f0f0f5;
-            --text-secondary: #8888a0;
-            --text-muted: #5a5a70;
-            --accent: #00d4aa;
-            --accent-dim: rgba(0, 212, 170, 0.15);
-            --danger: #ff4757;
-            --warning: #ffa502;
-            --info: #3498ff;
-            --success: #00d4aa;
-            --gradient-1: linear-gradient(135deg, #00d4aa 0%, #00a080 100%);
-            --gradient-2: linear-gradient(135deg, #3498ff 0%, #1e6fd9 100%);
-            --gradient-danger: linear-gradient(135deg, #ff4757 0%, #c0392b 100%);
-            --glass: rgba(22, 22, 31, 0.8);
-            --shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
-            --shadow-glow: 0 0 40px rgba(0, 212, 170, 0.1);
-        }
-        
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            min-height: 100vh;
-            line-height: 1.5;
-        }
-        
-        .bg-pattern {
-            position: fixed; top: 0; left: 0; right: 0; bottom: 0;
-            background-image: radial-gradient(circle at 20% 50%, rgba(0, 212, 170, 0.03) 0%, transparent 50%),
-                              radial-gradient(circle at 80% 20%, rgba(52, 152, 255, 0.03) 0%, transparent 50%);
-            pointer-events: none; z-index: 0;
-        }
-        
-        .container { max-width: 1600px; margin: 0 auto; padding: 24px; position: relative; z-index: 1; }
-        
-        header {
-            display: flex; justify-content: space-between; align-items: center;
-            padding: 20px 24px; margin-bottom: 24px;
-            background: var(--glass); backdrop-filter: blur(20px);
-            border-radius: 16px; border: 1px solid var(--border);
-            box-shadow: var(--shadow);
-        }
-        
-        .logo {
-            display: flex; align-items: center; gap: 14px;
-        }
-        .logo-brand {
-            display: flex; align-items: center; gap: 10px;
-            font-size: 28px; font-weight: 800; letter-spacing: -0.5px;
-            background: linear-gradient(135deg, #00d4aa 0%, #00f5c4 50%, #00d4aa 100%);
-            -webkit-background-clip: text; background-clip: text;
-            -webkit-text-fill-color: transparent;
-            text-shadow: 0 0 30px rgba(0, 212, 170, 0.3);
-        }
-        .logo-icon {
-            width: 38px; height: 38px; border-radius: 10px;
-            background: linear-gradient(135deg, #00d4aa 0%, #00a085 100%);
-            display: flex; align-items: center; justify-content: center;
-            font-size: 20px; box-shadow: 0 4px 15px rgba(0, 212, 170, 0.4);
-        }
-        .version {
-            color: var(--text-secondary); font-size: 11px; font-weight: 600;
-            padding: 5px 10px; background: var(--bg-secondary);
-            border: 1px solid var(--border); border-radius: 6px;
-            letter-spacing: 0.5px;
-        }
-        
-        .status { display: flex; align-items: center; gap: 10px; }
-        .status-indicator {
-            display: flex; align-items: center; gap: 8px;
-            padding: 8px 16px; border-radius: 20px;
-            background: var(--accent-dim); border: 1px solid var(--accent);
-        }
-        .status-dot {
-            width: 8px; height: 8px; border-radius: 50%;
-            background: var(--accent);
-            box-shadow: 0 0 12px var(--accent);
-            animation: pulse 2s ease-in-out infinite;
-        }
-        @keyframes pulse {
-            0%, 100% { transform: scale(1); opacity: 1; }
-            50% { transform: scale(1.2); opacity: 0.7; }
-        }
-        .status-text { font-size: 13px; font-weight: 500; color: var(--accent); }
-        
-        .stats-grid {
-            display: grid; grid-template-columns: repeat(4, 1fr);
-            gap: 16px; margin-bottom: 24px;
-        }
-        @media (max-width: 1200px) { .stats-grid { grid-template-columns: repeat(2, 1fr); } }
-        @media (max-width: 600px) { .stats-grid { grid-template-columns: 1fr; } }
-        
-        .stat-card {
-            background: var(--bg-card); border-radius: 16px;
-            padding: 20px 24px; border: 1px solid var(--border);
-            transition: all 0.3s ease; position: relative; overflow: hidden;
-        }
-        .stat-card::before {
-            content: ''; position: absolute; top: 0; left: 0; right: 0; height: 3px;
-            background: var(--gradient-2); opacity: 0; transition: opacity 0.3s;
-        }
-        .stat-card:hover { transform: translateY(-4px); box-shadow: var(--shadow); }
-        .stat-card:hover::before { opacity: 1; }
-        .stat-card.alert::before { background: var(--gradient-danger); opacity: 1; }
-        .stat-card h3 { font-size: 11px; font-weight: 600; color: var(--text-muted); 
-                        text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px; }
-        .stat-card .value { font-size: 36px; font-weight: 700; }
-        .stat-card.alert .value { color: var(--danger); }
-        .stat-card.info .value { color: var(--info); }
-        
-        .tabs {
-            display: flex; gap: 6px; margin-bottom: 20px;
-            background: var(--bg-card); padding: 6px; border-radius: 12px;
-            border: 1px solid var(--border); width: fit-content;
-        }
-        .tab {
-            padding: 10px 20px; border-radius: 8px; cursor: pointer;
-            background: transparent; color: var(--text-secondary);
-            border: none; font-size: 13px; font-weight: 500;
-            transition: all 0.2s ease;
-        }
-        .tab:hover { color: var(--text-primary); background: var(--bg-hover); }
-        .tab.active {
-            background: var(--gradient-1); color: var(--bg-primary);
-            box-shadow: 0 4px 12px rgba(0, 212, 170, 0.3);
-        }
-        
-        .section {
-            background: var(--bg-card); border-radius: 16px;
-            padding: 24px; margin-bottom: 20px;
-            border: 1px solid var(--border);
-            box-shadow: var(--shadow);
-        }
-        .section-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 16px; }
-        .section h2 { font-size: 18px; font-weight: 600; color: var(--text-primary); }
-        
-        .filter-bar {
-            display: flex; gap: 10px; align-items: center; flex-wrap: wrap;
-            padding: 12px 16px; background: var(--bg-secondary);
-            border-radius: 10px; margin-bottom: 16px;
-        }
-        .filter-label { font-size: 12px; color: var(--text-muted); font-weight: 500; }
-        .filter-group { display: flex; gap: 6px; }
-        .filter-btn {
-            padding: 6px 14px; border-radius: 6px; border: 1px solid var(--border);
-            background: var(--bg-card); color: var(--text-secondary);
-            font-size: 12px; font-weight: 500; cursor: pointer;
-            transition: all 0.2s ease;
-        }
-        .filter-btn:hover { border-color: var(--text-muted); color: var(--text-primary); }
-        .filter-btn.active {
-            border-color: var(--accent); color: var(--accent);
-            background: var(--accent-dim);
-        }
-        .filter-select {
-            padding: 6px 12px; border-radius: 6px; border: 1px solid var(--border);
-            background: var(--bg-card); color: var(--text-primary);
-            font-size: 12px; cursor: pointer;
-        }
-        .filter-select:focus { outline: none; border-color: var(--accent); }
-        
-        .table-wrapper { overflow-x: auto; }
-        table { width: 100%; border-collapse: collapse; }
-        th {
-            padding: 12px 16px; text-align: left;
-            font-size: 10px; font-weight: 600; color: var(--text-muted);
-            text-transform: uppercase; letter-spacing: 1px;
-            border-bottom: 1px solid var(--border);
-            background: var(--bg-secondary);
-        }
-        th:first-child { border-radius: 8px 0 0 0; }
-        th:last-child { border-radius: 0 8px 0 0; }
-        td {
-            padding: 14px 16px; font-size: 13px; color: var(--text-primary);
-            border-bottom: 1px solid var(--border);
-            transition: background 0.2s;
-        }
-        tr:hover td { background: var(--bg-hover); }
-        tr:last-child td { border-bottom: none; }
-        
-        .truncate {
-            white-space: nowrap; overflow: hidden; text-overflow: ellipsis;
-            max-width: 100%; display: block;
-        }
-        
-        .badge {
-            display: inline-flex; align-items: center; justify-content: center;
-            padding: 4px 10px; border-radius: 6px;
-            font-size: 10px; font-weight: 600; text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        .badge.low { background: rgba(52, 152, 255, 0.15); color: #3498ff; }
-        .badge.medium { background: rgba(255, 165, 2, 0.15); color: #ffa502; }
-        .badge.high { background: rgba(255, 71, 87, 0.15); color: #ff4757; }
-        .badge.critical { background: rgba(255, 71, 87, 0.25); color: #ff6b7a; animation: blink 1s infinite; }
-        @keyframes blink { 50% { opacity: 0.7; } }
-        .badge.file-created { background: rgba(0, 212, 170, 0.15); color: #00d4aa; }
-        .badge.file-deleted { background: rgba(255, 71, 87, 0.15); color: #ff4757; }
-        .badge.file-modified { background: rgba(255, 165, 2, 0.15); color: #ffa502; }
-        .badge.file-moved { background: rgba(155, 89, 182, 0.15); color: #9b59b6; }
-        .badge.file-accessed { background: rgba(52, 152, 255, 0.15); color: #3498ff; }
-        
-        .btn {
-            padding: 8px 14px; border-radius: 8px; border: none;
-            font-size: 12px; font-weight: 500; cursor: pointer;
-            transition: all 0.2s ease; display: inline-flex;
-            align-items: center; gap: 6px;
-        }
-        .btn-icon { padding: 8px; background: var(--bg-hover); color: var(--text-secondary); }
-        .btn-icon:hover { background: var(--border); color: var(--text-primary); transform: scale(1.05); }
-        .btn-primary { background: var(--gradient-1); color: var(--bg-primary); }
-        .btn-primary:hover { box-shadow: 0 4px 12px rgba(0, 212, 170, 0.3); transform: translateY(-2px); }
-        .btn-secondary { background: var(--bg-hover); color: var(--text-primary); border: 1px solid var(--border); }
-        .btn-secondary:hover { border-color: var(--text-muted); }
-        .btn-danger { background: var(--gradient-danger); color: white; }
-        .btn-danger:hover { box-shadow: 0 4px 12px rgba(255, 71, 87, 0.3); }
-        .btn-sm { padding: 6px 10px; font-size: 11px; }
-        
-        .actions { display: flex; gap: 6px; }
-        .dismissed { color: var(--text-muted); font-size: 11px; font-style: italic; }
-        
-        .trust-badge { display: inline-flex; align-items: center; gap: 4px; font-weight: 500; }
-        .trust-badge.trusted { color: var(--success); }
-        .trust-badge.untrusted { color: var(--danger); }
-        .risk-value { font-weight: 600; font-family: 'SF Mono', monospace; }
-        .risk-low { color: var(--success); }
-        .risk-med { color: var(--warning); }
-        .risk-high { color: var(--danger); }
-        .anomaly-badge {
-            display: inline-block; padding: 2px 6px; border-radius: 4px;
-            background: rgba(255, 165, 2, 0.2); color: var(--warning);
-            font-size: 9px; font-weight: 600; margin-left: 6px;
-        }
-        
-        .empty-state {
-            text-align: center; padding: 48px 24px; color: var(--text-muted);
-        }
-        .empty-state-icon { font-size: 48px; margin-bottom: 12px; opacity: 0.5; }
-        .empty-state-text { font-size: 14px; }
-        
-        .modal {
-            display: none; position: fixed; top: 0; left: 0; width: 100%; height: 100%;
-            background: rgba(0, 0, 0, 0.8); backdrop-filter: blur(8px);
-            z-index: 1000; align-items: center; justify-content: center;
-        }
-        .modal.active { display: flex; }
-        .modal-content {
-            background: var(--bg-card); border-radius: 20px; padding: 28px;
-            max-width: 600px; width: 90%; max-height: 85vh; overflow-y: auto;
-            border: 1px solid var(--border); box-shadow: var(--shadow);
-            animation: modalIn 0.3s ease;
-        }
-        @keyframes modalIn { from { opacity: 0; transform: scale(0.95) translateY(20px); } }
-        .modal-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; }
-        .modal-header h3 { font-size: 18px; font-weight: 600; }
-        .modal-close {
-            width: 32px; height: 32px; border-radius: 8px;
-            background: var(--bg-hover); border: none; color: var(--text-secondary);
-            font-size: 18px; cursor: pointer; transition: all 0.2s;
-        }
-        .modal-close:hover { background: var(--border); color: var(--text-primary); }
-        .modal-body pre {
-            background: var(--bg-primary); padding: 16px; border-radius: 10px;
-            font-size: 12px; overflow-x: auto; white-space: pre-wrap;
-            word-break: break-all; font-family: 'SF Mono', monospace;
-        }
-        .detail-row { margin-bottom: 16px; }
-        .detail-label { font-size: 10px; font-weight: 600; color: var(--text-muted);
-                        text-transform: uppercase; letter-spacing: 1px; margin-bottom: 6px; }
-        .detail-value { font-size: 14px; color: var(--text-primary); }
-        
-        .whitelist-header { display: flex; gap: 12px; margin-bottom: 20px; flex-wrap: wrap; }
-        .whitelist-input {
-            flex: 1; min-width: 200px; padding: 12px 16px; border-radius: 10px;
-            border: 1px solid var(--border); background: var(--bg-secondary);
-            color: var(--text-primary); font-size: 13px;
-            transition: all 0.2s;
-        }
-        .whitelist-input:focus { outline: none; border-color: var(--accent); box-shadow: 0 0 0 3px var(--accent-dim); }
-        .whitelist-input::placeholder { color: var(--text-muted); }
-        
-        .whitelist-grid { display: grid; grid-template-columns: repeat(auto-fill, minmax(280px, 1fr)); gap: 12px; }
-        .whitelist-item {
-            background: var(--bg-secondary); padding: 16px; border-radius: 12px;
-            border: 1px solid var(--border);
-            display: flex; justify-content: space-between; align-items: center;
-            transition: all 0.2s;
-        }
-        .whitelist-item:hover { border-color: var(--text-muted); }
-        .whitelist-item .info { flex: 1; }
-        .whitelist-item .name { font-weight: 600; font-size: 14px; margin-bottom: 4px; }
-        .whitelist-item .meta { font-size: 11px; color: var(--text-muted); }
-        .whitelist-item .type-badge {
-            font-size: 9px; padding: 2px 6px; border-radius: 4px;
-            background: var(--bg-hover); color: var(--text-muted);
-            text-transform: uppercase; margin-left: 8px;
-        }
-        
-        .footer-info {
-            text-align: center; font-size: 11px; color: var(--text-muted);
-            margin-top: 20px; padding: 16px;
-        }
-        
-        .note-box {
-            padding: 12px 16px; background: rgba(52, 152, 255, 0.1);
-            border: 1px solid rgba(52, 152, 255, 0.2); border-radius: 8px;
-            font-size: 12px; color: var(--info); margin-top: 12px;
-        }
-        
-        .toast {
-            position: fixed; bottom: 24px; right: 24px;
-            padding: 14px 20px; border-radius: 10px;
-            background: var(--bg-card); border: 1px solid var(--border);
-            box-shadow: var(--shadow); font-size: 13px;
-            animation: toastIn 0.3s ease; z-index: 2000;
-        }
-        .toast.error { border-color: var(--danger); }
-        .toast.success { border-color: var(--success); }
-        @keyframes toastIn { from { opacity: 0; transform: translateY(20px); } }
-    </style>
-</head>
-<body>
-    <div class="bg-pattern"></div>
-    <div class="container">
-        <header>
-            <div class="logo">
-                <div class="logo-brand">
-                    <span class="logo-icon">🛡️</span>
-                    LEATT
-                </div>
-                <span class="version">v0.1.0</span>
-            </div>
-            <div class="status">
-                <div class="status-indicator">
-                    <div class="status-dot"></div>
-                    <span class="status-text">Monitoring Active</span>
-                </div>
-            </div>
-        </header>
-        
-        <div class="stats-grid">
-            <div class="stat-card alert">
-                <h3>Active Alerts</h3>
-                <div class="value" id="stat-alerts">0</div>
-            </div>
-            <div class="stat-card info">
-                <h3>Processes</h3>
-                <div class="value" id="stat-processes">0</div>
-            </div>
-            <div class="stat-card info">
-                <h3>Network Events</h3>
-                <div class="value" id="stat-network">0</div>
-            </div>
-            <div class="stat-card info">
-                <h3>File Events</h3>
-                <div class="value" id="stat-files">0</div>
-            </div>
-        </div>
-        
-        <div class="tabs">
-            <button class="tab active" onclick="showTab('alerts')">🔔 Alerts</button>
-            <button class="tab" onclick="showTab('processes')">⚙️ Processes</button>
-            <button class="tab" onclick="showTab('network')">🌐 Network</button>
-            <button class="tab" onclick="showTab('files')">📁 Files</button>
-            <button class="tab" onclick="showTab('whitelist')">✓ Whitelist</button>
-            <button class="tab" onclick="showTab('quarantine')">☠ Quarantine</button>
-        </div>
-        
-        <div class="section" id="alerts-section">
-            <div class="section-header">
-                <h2>🔔 Recent Alerts</h2>
-            </div>
-            <div class="filter-bar">
-                <span class="filter-label">Severity:</span>
-                <select class="filter-select" id="filter-severity" onchange="renderAlerts()">
-                    <option value="all">All Levels</option>
-                    <option value="critical">Critical</option>
-                    <option value="high">High</option>
-                    <option value="medium">Medium</option>
-                    <option value="low">Low</option>
-                </select>
-                <span class="filter-label" style="margin-left: 12px;">Source:</span>
-                <div class="filter-group">
-                    <button class="filter-btn active" id="alert-filter-all" onclick="setAlertTrustFilter('all')">All</button>
-                    <button class="filter-btn" id="alert-filter-untrusted" onclick="setAlertTrustFilter('untrusted')">✗ Untrusted only</button>
-                </div>
-                <div class="filter-group" style="margin-left: 12px;">
-                    <button class="filter-btn" id="filter-unack" onclick="toggleFilter('unack')">
-                        Unacknowledged only
-                    </button>
-                </div>
-            </div>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>Severity</th>
-                            <th>Source</th>
-                            <th>Process</th>
-                            <th>Description</th>
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody id="alerts-table"></tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="section" id="processes-section" style="display:none;">
-            <div class="section-header">
-                <h2>⚙️ Monitored Processes</h2>
-            </div>
-            <div class="filter-bar">
-                <span class="filter-label">Filter:</span>
-                <div class="filter-group">
-                    <button class="filter-btn active" id="filter-all" onclick="setTrustFilter('all')">All</button>
-                    <button class="filter-btn" id="filter-trusted" onclick="setTrustFilter('trusted')">✓ Trusted</button>
-                    <button class="filter-btn" id="filter-untrusted" onclick="setTrustFilter('untrusted')">✗ Untrusted</button>
-                    <button class="filter-btn" id="filter-risky" onclick="setTrustFilter('risky')">⚠ Has Risk</button>
-                </div>
-            </div>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>PID</th>
-                            <th>Name</th>
-                            <th>Path</th>
-                            <th>Trusted</th>
-                            <th>Risk</th>
-                            <th>Last Seen</th>
-                            <th>Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody id="processes-table"></tbody>
-                </table>
-            </div>
-            <div class="note-box">
-                ℹ️ Trusted processes can still have risk scores if they exhibit anomalous behavior (potential hijacking/injection)
-            </div>
-        </div>
-        
-        <div class="section" id="network-section" style="display:none;">
-            <div class="section-header">
-                <h2>🌐 Network Activity</h2>
-            </div>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>Process</th>
-                            <th>Address</th>
-                            <th>Port</th>
-                            <th>Sent</th>
-                        </tr>
-                    </thead>
-                    <tbody id="network-table"></tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="section" id="files-section" style="display:none;">
-            <div class="section-header">
-                <h2>📁 File Activity</h2>
-            </div>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>Process</th>
-                            <th>Path</th>
-                            <th>Action</th>
-                            <th>Sensitive</th>
-                        </tr>
-                    </thead>
-                    <tbody id="files-table"></tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="section" id="whitelist-section" style="display:none;">
-            <div class="section-header">
-                <h2>✓ Trusted Processes (Whitelist)</h2>
-            </div>
-            <div class="whitelist-header">
-                <input type="text" class="whitelist-input" id="whitelist-name" placeholder="Process name (e.g., myapp.exe)">
-                <input type="text" class="whitelist-input" id="whitelist-reason" placeholder="Reason (optional)">
-                <button class="btn btn-primary" onclick="addToWhitelist()">+ Add to Whitelist</button>
-            </div>
-            <div class="whitelist-grid" id="whitelist-grid"></div>
-        </div>
-        
-        <div class="section" id="quarantine-section" style="display:none;">
-            <div class="section-header">
-                <h2>☠ Quarantine Log</h2>
-            </div>
-            <div class="note-box" style="margin-bottom: 16px;">
-                ⚠️ This log shows all processes that have been terminated. Killing critical system processes may cause instability.
-            </div>
-            <div class="table-wrapper">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Time</th>
-                            <th>PID</th>
-                            <th>Name</th>
-                            <th>Path</th>
-                            <th>Reason</th>
-                            <th>Status</th>
-                        </tr>
-                    </thead>
-                    <tbody id="quarantine-table"></tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="footer-info">
-            Auto-refresh every 15 seconds • Leatt Data Leak Prevention
-        </div>
-    </div>
-    
-    <div id="toast-container"></div>
-    
-    <div class="modal" id="detail-modal">
-        <div class="modal-content">
-            <div class="modal-header">
-                <h3>Alert Details</h3>
-                <button class="modal-close" onclick="closeModal()">&times;</button>
-            </div>
-            <div class="modal-body" id="modal-body"></div>
-        </div>
-    </div>
-    
-    <script>
-        let currentTab = 'alerts';
-        let alertsCache = [];
-        let processesCache = [];
-        let whitelistCache = [];
-        let trustFilter = 'all';
-        let alertTrustFilter = 'all';
-        let filterUnackOnly = false;
-        
-        function showTab(tab) {
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.section').forEach(s => s.style.display = 'none');
-            document.querySelector(`[onclick="showTab('${tab}')"]`).classList.add('active');
-            document.getElementById(`${tab}-section`).style.display = 'block';
-            currentTab = tab;
-            loadData();
-        }
-        
-        function setTrustFilter(filter) {
-            trustFilter = filter;
-            document.querySelectorAll('#processes-section .filter-btn').forEach(b => b.classList.remove('active'));
-            document.getElementById('filter-' + filter).classList.add('active');
-            renderProcesses();
-        }
-        
-        function setAlertTrustFilter(filter) {
-            alertTrustFilter = filter;
-            document.getElementById('alert-filter-all').classList.toggle('active', filter === 'all');
-            document.getElementById('alert-filter-untrusted').classList.toggle('active', filter === 'untrusted');
-            renderAlerts();
-        }
-        
-        function toggleFilter(type) {
-            if (type === 'unack') {
-                filterUnackOnly = !filterUnackOnly;
-                document.getElementById('filter-unack').classList.toggle('active', filterUnackOnly);
-                renderAlerts();
-            }
-        }
-        
-        async function loadStats() {
-            try {
-                const res = await fetch('/api/stats');
-                const data = await res.json();
-                document.getElementById('stat-alerts').textContent = data.unacknowledged_alerts;
-                document.getElementById('stat-processes').textContent = data.monitored_processes;
-                document.getElementById('stat-network').textContent = data.network_events;
-                document.getElementById('stat-files').textContent = data.file_events;
-            } catch (e) { console.error('Stats error:', e); }
-        }
-        
-        async function loadAlerts() {
-            try {
-                const res = await fetch('/api/alerts?limit=50');
-                alertsCache = await res.json();
-                renderAlerts();
-            } catch (e) { console.error('Alerts error:', e); }
-        }
-        
-        function renderAlerts() {
-            const tbody = document.getElementById('alerts-table');
-            const severityFilter = document.getElementById('filter-severity').value;
-            const trustedNames = new Set(whitelistCache.map(w => w.name.toLowerCase()));
-            
-            let filtered = alertsCache;
-            
-            if (severityFilter !== 'all') {
-                filtered = filtered.filter(a => a.severity === severityFilter);
-            }
-            if (filterUnackOnly) {
-                filtered = filtered.filter(a => !a.acknowledged);
-            }
-            if (alertTrustFilter === 'untrusted') {
-                filtered = filtered.filter(a => !a.process_name || !trustedNames.has(a.process_name.toLowerCase()));
-            }
-            
-            if (filtered.length === 0) {
-                tbody.innerHTML = `<tr><td colspan="6"><div class="empty-state">
-                    <div class="empty-state-icon">✅</div>
-                    <div class="empty-state-text">No alerts matching filters</div>
-                </div></td></tr>`;
-                return;
-            }
-            
-            tbody.innerHTML = filtered.slice(0, 30).map(a => `
-                <tr>
-                    <td>${formatTime(a.timestamp)}</td>
-                    <td><span class="badge ${a.severity}">${a.severity.toUpperCase()}</span></td>
-                    <td><span class="truncate" title="${a.source}">${a.source.split(':')[0]}</span></td>
-                    <td><span class="truncate" title="${a.process_name || ''}">${a.process_name || '-'}</span></td>
-                    <td><span class="truncate" title="${a.description}">${a.description}</span></td>
-                    <td class="actions">
-                        ${a.acknowledged ? '<span class="dismissed">Dismissed</span>' : `
-                            <button class="btn btn-icon btn-sm" onclick="inspectAlert(${a.id})" title="Inspect">🔍</button>
-                            ${a.process_name ? `<button class="btn btn-primary btn-sm" onclick="trustProcess('${a.process_name}')" title="Trust">✓</button>` : ''}
-                            ${a.process_pid ? `<button class="btn btn-danger btn-sm" onclick="quarantineProcess(${a.process_pid}, '${a.process_name || ''}')" title="Kill Process">☠</button>` : ''}
-                            <button class="btn btn-secondary btn-sm" onclick="dismissAlert(${a.id})">Dismiss</button>
-                        `}
-                    </td>
-                </tr>
-            `).join('');
-        }
-        
-        async function loadProcesses() {
-            try {
-                const res = await fetch('/api/processes');
-                processesCache = await res.json();
-                renderProcesses();
-            } catch (e) { console.error('Processes error:', e); }
-        }
-        
-        function renderProcesses() {
-            const tbody = document.getElementById('processes-table');
-            
-            let filtered = processesCache;
-            
-            if (trustFilter === 'trusted') {
-                filtered = filtered.filter(p => p.is_trusted);
-            } else if (trustFilter === 'untrusted') {
-                filtered = filtered.filter(p => !p.is_trusted);
-            } else if (trustFilter === 'risky') {
-                filtered = filtered.filter(p => p.risk_score > 0);
-            }
-            
-            if (filtered.length === 0) {
-                tbody.innerHTML = `<tr><td colspan="7"><div class="empty-state">
-                    <div class="empty-state-icon">📭</div>
-                    <div class="empty-state-text">No processes matching filter</div>
-                </div></td></tr>`;
-                return;
-            }
-            
-            filtered.sort((a, b) => b.risk_score - a.risk_score);
-            
-            tbody.innerHTML = filtered.map(p => `
-                <tr>
-                    <td><span style="font-family: 'SF Mono', monospace; font-size: 12px;">${p.pid}</span></td>
-                    <td><span class="truncate" title="${p.name}" style="font-weight: 500;">${p.name}</span></td>
-                    <td><span class="truncate" title="${p.path || ''}" style="color: var(--text-secondary); font-size: 12px;">${p.path || '-'}</span></td>
-                    <td>
-                        <span class="trust-badge ${p.is_trusted ? 'trusted' : 'untrusted'}">
-                            ${p.is_trusted ? '✓ Trusted' : '✗ Untrusted'}
-                        </span>
-                        ${p.is_trusted && p.risk_score > 0 ? '<span class="anomaly-badge">ANOMALY</span>' : ''}
-                    </td>
-                    <td><span class="risk-value ${getRiskClass(p.risk_score)}">${p.risk_score.toFixed(0)}</span></td>
-                    <td style="color: var(--text-secondary);">${formatTime(p.last_seen)}</td>
-                    <td class="actions">
-                        <button class="btn btn-danger btn-sm" onclick="quarantineProcess(${p.pid}, '${p.name}')" title="Kill Process">☠ Kill</button>
-                    </td>
-                </tr>
-            `).join('');
-        }
-        
-        async function loadNetwork() {
-            try {
-                const res = await fetch('/api/network?limit=30');
-                const data = await res.json();
-                const tbody = document.getElementById('network-table');
-                
-                if (data.length === 0) {
-                    tbody.innerHTML = `<tr><td colspan="5"><div class="empty-state">
-                        <div class="empty-state-icon">🌐</div>
-                        <div class="empty-state-text">No network events yet</div>
-                    </div></td></tr>`;
-                    return;
-                }
-                
-                tbody.innerHTML = data.map(n => `
-                    <tr>
-                        <td style="color: var(--text-secondary);">${formatTime(n.timestamp)}</td>
-                        <td><span class="truncate" style="font-weight: 500;">${n.process_name || '-'}</span></td>
-                        <td><code style="background: var(--bg-secondary); padding: 2px 6px; border-radius: 4px; font-size: 11px;">${n.remote_address}</code></td>
-                        <td><span style="color: var(--info);">${n.remote_port}</span></td>
-                        <td><span style="font-weight: 500;">${formatBytes(n.bytes_sent)}</span></td>
-                    </tr>
-                `).join('');
-            } catch (e) { console.error('Network error:', e); }
-        }
-        
-        async function loadFiles() {
-            try {
-                const res = await fetch('/api/files?limit=30');
-                const data = await res.json();
-                const tbody = document.getElementById('files-table');
-                
-                if (data.length === 0) {
-                    tbody.innerHTML = `<tr><td colspan="5"><div class="empty-state">
-                        <div class="empty-state-icon">📁</div>
-                        <div class="empty-state-text">No file events yet</div>
-                    </div></td></tr>`;
-                    return;
-                }
-                
-                tbody.innerHTML = data.map(f => `
-                    <tr>
-                        <td style="color: var(--text-secondary);">${formatTime(f.timestamp)}</td>
-                        <td><span class="truncate" style="font-weight: 500;">${f.process_name || '-'}</span></td>
-                        <td><span class="truncate" title="${f.file_path}" style="font-size: 12px; color: var(--text-secondary);">${f.file_path}</span></td>
-                        <td>${getFileActionBadge(f.event_type)}</td>
-                        <td>${f.is_sensitive ? '<span class="badge high">⚠ SENSITIVE</span>' : '<span style="color: var(--text-muted);">No</span>'}</td>
-                    </tr>
-                `).join('');
-            } catch (e) { console.error('Files error:', e); }
-        }
-        
-        async function loadWhitelist() {
-            try {
-                const res = await fetch('/api/whitelist');
-                const data = await res.json();
-                whitelistCache = data;
-                const grid = document.getElementById('whitelist-grid');
-                
-                if (data.length === 0) {
-                    grid.innerHTML = `<div class="empty-state">
-                        <div class="empty-state-icon">📋</div>
-                        <div class="empty-state-text">No whitelist entries</div>
-                    </div>`;
-                    return;
-                }
-                
-                grid.innerHTML = data.map(w => `
-                    <div class="whitelist-item">
-                        <div class="info">
-                            <div class="name">${w.name}<span class="type-badge">${w.added_by}</span></div>
-                            <div class="meta">${w.reason || 'No reason specified'}</div>
-                        </div>
-                        ${w.added_by !== 'system' ? `<button class="btn btn-danger btn-sm" onclick="removeFromWhitelist('${w.name}')">✕</button>` : ''}
-                    </div>
-                `).join('');
-            } catch (e) { console.error('Whitelist error:', e); }
-        }
-        
-        function showToast(message, type = 'success') {
-            const container = document.getElementById('toast-container');
-            const toast = document.createElement('div');
-            toast.className = 'toast ' + type;
-            toast.textContent = message;
-            container.appendChild(toast);
-            setTimeout(() => toast.remove(), 3000);
-        }
-        
-        async function addToWhitelist() {
-            const name = document.getElementById('whitelist-name').value.trim();
-            const reason = document.getElementById('whitelist-reason').value.trim();
-            
-            if (!name) {
-                showToast('Please enter a process name', 'error');
-                return;
-            }
-            
-            const res = await fetch('/api/whitelist', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ name, reason })
-            });
-            const data = await res.json();
-            
-            if (data.success) {
-                showToast(`Added "${name}" to whitelist`, 'success');
-                document.getElementById('whitelist-name').value = '';
-                document.getElementById('whitelist-reason').value = '';
-                loadWhitelist();
-            } else {
-                showToast(data.error || 'Failed to add', 'error');
-            }
-        }
-        
-        async function removeFromWhitelist(name) {
-            if (!confirm(`Remove "${name}" from whitelist?`)) return;
-            await fetch(`/api/whitelist/${encodeURIComponent(name)}`, { method: 'DELETE' });
-            showToast(`Removed "${name}" from whitelist`, 'success');
-            loadWhitelist();
-        }
-        
-        async function trustProcess(name) {
-            const res = await fetch('/api/whitelist', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ name, reason: 'Trusted from alert' })
-            });
-            const data = await res.json();
-            
-            if (data.success) {
-                showToast(`"${name}" is now trusted`, 'success');
-            } else {
-                showToast(data.error || 'Already trusted', 'error');
-            }
-            loadAlerts();
-            loadStats();
-        }
-        
-        async function dismissAlert(id) {
-            await fetch(`/api/alerts/${id}/acknowledge`, { method: 'POST' });
-            showToast('Alert dismissed', 'success');
-            loadAlerts();
-            loadStats();
-        }
-        
-        async function quarantineProcess(pid, name) {
-            if (!confirm(`⚠️ KILL PROCESS\\n\\nAre you sure you want to terminate "${name}" (PID: ${pid})?\\n\\nThis action cannot be undone.`)) {
-                return;
-            }
-            
-            try {
-                const res = await fetch(`/api/quarantine/${pid}`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ reason: 'Manually killed by user' })
-                });
-                const data = await res.json();
-                
-                if (data.success) {
-                    showToast(`Process "${name}" terminated`, 'success');
-                    loadProcesses();
-                    loadStats();
-                    if (currentTab === 'quarantine') loadQuarantine();
-                } else {
-                    showToast(data.error || 'Failed to kill process', 'error');
-                }
-            } catch (e) {
-                showToast('Error: ' + e.message, 'error');
-            }
-        }
-        
-        async function loadQuarantine() {
-            try {
-                const res = await fetch('/api/quarantine');
-                const data = await res.json();
-                const tbody = document.getElementById('quarantine-table');
-                
-                if (data.length === 0) {
-                    tbody.innerHTML = `<tr><td colspan="6"><div class="empty-state">
-                        <div class="empty-state-icon">🛡️</div>
-                        <div class="empty-state-text">No processes quarantined yet</div>
-                    </div></td></tr>`;
-                    return;
-                }
+            return self._cache.get_or_set("stats", None, 10, self._db.get_stats, stale_for=STALE_FOR)
+        
+        # tab -> (row schema, model, newest-first key column, row limit)
+        dashboard_tabs = {
+            "alerts": (schemas.AlertOut, Alert, Alert.timestamp, 50),
+            "processes": (schemas.ProcessOut, ProcessRecord, ProcessRecord.id, 100),
+            "network": (schemas.NetworkEventOut, NetworkEvent, NetworkEvent.timestamp, 30),
+            "files": (schemas.FileEventOut, FileEvent, FileEvent.timestamp, 30),
+            "quarantine": (schemas.QuarantineOut, QuarantineEvent, QuarantineEvent.timestamp, 50),
+        }
+        
+        def newest_json(model, table, column, limit: int) -> bytes:
+            """The newest rows of table as a JSON array, rows rendered by SQLite."""
+            order = newest_order(column)
+            stmt = select(table).order_by(*(c.desc() for c in order)).limit(limit)
+            query = schemas.json_page(model, stmt, *(c.key for c in order))
+            with self._db.get_session() as session:
+                return schemas.json_array(session.execute(query).all())
+        
+        def dashboard_part(name: str, build) -> bytes:
+            """One section of /api/dashboard, or null if it cannot be built."""
+            try:
+                return build()
+            except Exception as e:
+                logger.warning(f"Dashboard {name} unavailable: {e}")
+                return b"null"
+        
+        @app.get("/api/dashboard")
+        def get_dashboard(request: Request, tab: str = "alerts"):
+            """Get stats, whitelist and the active tab's rows in one response.
+            
+            A section that fails comes back as null so the others still render.
+            """
+            rows = b"null"
+            if tab in dashboard_tabs:
+                rows = dashboard_part(tab, lambda: newest_json(*dashboard_tabs[tab]))
+            
+            body = b"".join((
+                b'{"stats":', dashboard_part("stats", lambda: self._json_response(get_stats()).body),
+                b',"whitelist":', dashboard_part("whitelist", whitelist_json),
+                b',"rows":', rows,
+                b"}",
+            ))
+            return json_with_etag(request, body, {})
+        
+        def alerts_after(alert_id: int) -> list[tuple[int, str]]:
+            """(id, JSON) for up to EVENT_ALERT_LIMIT of the newest alerts after alert_id, oldest first."""
+            stmt = select(Alert).where(Alert.id > alert_id).order_by(Alert.id.desc()).limit(EVENT_ALERT_LIMIT)
+            with self._db.get_session() as session:
+                rows = session.execute(schemas.json_page(schemas.AlertOut, stmt, "id")).all()
+            return rows[::-1]
+        
+        def latest_alert_id() -> int:
+            """Highest alert id currently stored."""
+            with self._db.get_session() as session:
+                return session.scalar(select(func.max(Alert.id))) or 0
+        
+        @app.get("/api/events")
+        async def stream_events(request: Request):
+            """Push stats, new alerts and whitelist changes as Server-Sent Events.
+            
+            Each stream checks for alerts past the last id it sent and the
+            trigger-maintained counters every EVENT_POLL_INTERVAL seconds, or at
+            once when notify_alerts() is called, and only sends something when
+            they move.
+            """
+            async def events():
+                loop = asyncio.get_running_loop()
+                self._loop = loop
+                last_alert_id = await run_in_threadpool(latest_alert_id)
+                last_stats = None
+                last_whitelist = await run_in_threadpool(whitelist_version)
+                last_sent = loop.time()
                 
-                tbody.innerHTML = data.map(q => `
-                    <tr>
-                        <td style="color: var(--text-secondary);">${formatTime(q.timestamp)}</td>
-                        <td><span style="font-family: 'SF Mono', monospace;">${q.pid}</span></td>
-                        <td><span style="font-weight: 500;">${q.name}</span></td>
-                        <td><span class="truncate" title="${q.path || ''}" style="font-size: 12px; color: var(--text-secondary);">${q.path || '-'}</span></td>
-                        <td>${q.reason || '-'}</td>
-                        <td>${q.success ? '<span class="badge file-deleted">KILLED</span>' : '<span class="badge medium">FAILED</span>'}</td>
-                    </tr>
-                `).join('');
-            } catch (e) { console.error('Quarantine error:', e); }
-        }
+                yield "retry: 5000\n\n"
+                while not await request.is_disconnected():
+                    stats = await run_in_threadpool(self._db.get_stats)
+                    sent = False
+                    
+                    # Keyed on ids rather than total_alerts, which an insert and a
+                    # retention delete in the same interval would leave unchanged
+                    for alert_id, line in await run_in_threadpool(alerts_after, last_alert_id):
+                        last_alert_id = alert_id
+                        sent = True
+                        yield f"event: alert\ndata: {line}\n\n"
+                    
+                    if stats != last_stats:
+                        last_stats = stats
+                        self._cache.clear("stats")
+                        yield f"event: stats\ndata: {json.dumps(stats)}\n\n"
+                        sent = True
+                    
+                    whitelist = await run_in_threadpool(whitelist_version)
+                    if whitelist != last_whitelist:
+                        last_whitelist = whitelist
+                        yield f"event: whitelist\ndata: {last_whitelist}\n\n"
+                        sent = True
+                    
+                    if not sent and loop.time() - last_sent >= EVENT_HEARTBEAT:
+                        sent = True
+                        yield ": ping\n\n"
+                    if sent:
+                        last_sent = loop.time()
+                    
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), EVENT_POLL_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+            
+            return StreamingResponse(
+                events(),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache"},
+            )
         
-        function inspectAlert(id) {
-            const alert = alertsCache.find(a => a.id === id);
-            if (!alert) return;
-            
-            let detailsHtml = '';
-            if (alert.details) {
-                try {
-                    const details = typeof alert.details === 'string' ? alert.details : JSON.stringify(alert.details, null, 2);
-                    detailsHtml = `
-                        <div class="detail-row">
-                            <div class="detail-label">Raw Data</div>
-                            <pre>${details}</pre>
-                        </div>
-                    `;
-                } catch (e) {}
-            }
+        @app.get("/api/bootstrap")
+        def get_bootstrap(limit: int = 50):
+            """Get all initial dashboard panel data in one response."""
+            stats = get_stats()
+            encode = lambda value: self._json_response(value).body
             
-            const body = document.getElementById('modal-body');
-            body.innerHTML = `
-                <div class="detail-row">
-                    <div class="detail-label">Severity</div>
-                    <div class="detail-value"><span class="badge ${alert.severity}">${alert.severity.toUpperCase()}</span></div>
-                </div>
-                <div class="detail-row">
-                    <div class="detail-label">Time</div>
-                    <div class="detail-value">${new Date(alert.timestamp).toLocaleString()}</div>
-                </div>
-                <div class="detail-row">
-                    <div class="detail-label">Source</div>
-                    <div class="detail-value"><code style="background: var(--bg-secondary); padding: 4px 8px; border-radius: 4px;">${alert.source}</code></div>
-                </div>
-                <div class="detail-row">
-                    <div class="detail-label">Process</div>
-                    <div class="detail-value" style="font-weight: 500;">${alert.process_name || '-'} <span style="color: var(--text-muted);">(PID: ${alert.process_pid || '-'})</span></div>
-                </div>
-                <div class="detail-row">
-                    <div class="detail-label">Description</div>
-                    <div class="detail-value">${alert.description}</div>
-                </div>
-                ${detailsHtml}
-                ${alert.process_name ? `
-                <div style="margin-top: 20px; padding-top: 16px; border-top: 1px solid var(--border);">
-                    <button class="btn btn-primary" onclick="trustProcess('${alert.process_name}'); closeModal();">
-                        ✓ Trust this process
-                    </button>
-                </div>
-                ` : ''}
-            `;
-            document.getElementById('detail-modal').classList.add('active');
-        }
-        
-        function closeModal() {
-            document.getElementById('detail-modal').classList.remove('active');
-        }
-        
-        document.getElementById('detail-modal').addEventListener('click', (e) => {
-            if (e.target.classList.contains('modal')) closeModal();
-        });
-        
-        function formatTime(ts) {
-            if (!ts) return '-';
-            const d = new Date(ts);
-            return d.toLocaleTimeString('en-US', {hour: '2-digit', minute: '2-digit'}) + ' ' + 
-                   d.toLocaleDateString('en-US', {month: 'short', day: 'numeric'});
-        }
-        
-        function formatBytes(bytes) {
-            if (!bytes || bytes === 0) return '0 B';
-            const k = 1024, sizes = ['B', 'KB', 'MB', 'GB'];
-            const i = Math.floor(Math.log(bytes) / Math.log(k));
-            return parseFloat((bytes / Math.pow(k, i)).toFixed(1)) + ' ' + sizes[i];
-        }
-        
-        function getRiskClass(score) {
-            if (score >= 60) return 'risk-high';
-            if (score >= 30) return 'risk-med';
-            return 'risk-low';
-        }
-        
-        function getFileActionBadge(action) {
-            const type = (action || '').toLowerCase();
-            if (type.includes('created') || type.includes('create')) {
-                return '<span class="badge file-created">+ CREATED</span>';
-            } else if (type.includes('deleted') || type.includes('delete')) {
-                return '<span class="badge file-deleted">✕ DELETED</span>';
-            } else if (type.includes('modified') || type.includes('modify') || type.includes('changed')) {
-                return '<span class="badge file-modified">✎ MODIFIED</span>';
-            } else if (type.includes('moved') || type.includes('renamed')) {
-                return '<span class="badge file-moved">→ MOVED</span>';
-            } else if (type.includes('accessed') || type.includes('read')) {
-                return '<span class="badge file-accessed">👁 ACCESSED</span>';
-            }
-            return `<span class="badge low">${action}</span>`;
-        }
-        
-        function loadData() {
-            loadStats();
-            loadWhitelist();
-            switch (currentTab) {
-                case 'alerts': loadAlerts(); break;
-                case 'processes': loadProcesses(); break;
-                case 'network': loadNetwork(); break;
-                case 'files': loadFiles(); break;
-                case 'whitelist': break;
-                case 'quarantine': loadQuarantine(); break;
+            status = {
+                "status": "running",
+                "timestamp": datetime.utcnow().isoformat(),
+                "unacknowledged_alerts": stats["unacknowledged_alerts"],
+                "learning_mode": self.config.learning_mode,
             }
-        }
-        
-        loadData();
-        setInterval(loadData, 15000);
-    </script>
-</body>
-</html>
-"""
+            body = b"".join((
+                b'{"status":', encode(status),
+                b',"stats":', encode(stats),
+                b',"alerts":', newest_json(schemas.AlertOut, Alert, Alert.timestamp, limit),
+                b',"whitelist":', whitelist_json(),
+                b',"config":', encode(self._cache.get_or_set("config", None, 3600, config_info)),
+                b"}",
+            ))
+            return Response(body, media_type="application/json")
     
     def run(self) -> None:
         """Run the web server."""
@@ -1397,11 +745,27 @@ class WebDashboard:
             host=self.host,
             port=self.port,
             log_level="warning",
+            # "auto" picks uvloop and httptools when installed, asyncio/h11 otherwise
+            loop="auto",
+            http="auto",
+            access_log=False,
+            timeout_keep_alive=30,
+            timeout_graceful_shutdown=5,
         )
         
         self._server = uvicorn.Server(config)
         self._server.run()
     
+    def notify_alerts(self) -> None:
+        """Wake the open event streams so new alerts go out now; safe from any thread."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake_streams)
+    
+    def _wake_streams(self) -> None:
+        # Release every waiting stream, then arm a fresh event for the next round
+        self._wakeup.set()
+        self._wakeup = asyncio.Event()
+    
     def stop(self) -> None:
         """Stop the web server."""
         self._running = False
@@ -0,0 +1,67 @@
+"""In-process TTL cache for dashboard API responses."""
+
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger("web.cache")
+
+
+class ResponseCache:
+    """Thread-safe TTL cache grouped by namespace."""
+    
+    # Per-namespace size at which expired entries are swept on insert
+    MAX_ENTRIES = 256
+    
+    def __init__(self):
+        self._entries: dict[str, dict[Hashable, tuple[float, Any]]] = {}
+        self._lock = threading.Lock()
+    
+    def get_or_set(
+        self,
+        namespace: str,
+        key: Hashable,
+        ttl: float,
+        factory: Callable[[], Any],
+        stale_for: float = 0.0,
+    ) -> Any:
+        """Return the cached value, or compute and store it when missing or expired.
+        
+        If the factory raises, a value that expired less than stale_for seconds
+        ago is returned instead of propagating the error.
+        """
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(namespace, {}).get(key)
+        
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        try:
+            value = factory()
+        except Exception as e:
+            if entry is None or entry[0] + stale_for <= now:
+                raise
+            logger.warning(f"Serving stale {namespace} entry: {e}")
+            return entry[1]
+        
+        with self._lock:
+            entries = self._entries.setdefault(namespace, {})
+            if len(entries) >= self.MAX_ENTRIES:
+                # Keys like page cursors are open-ended; drop what has expired
+                for stale_key in [k for k, (expires, _) in entries.items() if expires <= now]:
+                    del entries[stale_key]
+            entries[key] = (now + ttl, value)
+        
+        return value
+    
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop one namespace, or everything when no namespace is given."""
+        with self._lock:
+            if namespace is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(namespace, None)
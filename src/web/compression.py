@@ -0,0 +1,74 @@
+"""Precompressed response bodies for static dashboard assets."""
+
+import gzip
+import hashlib
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger("web.compression")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+    logger.debug("brotli not available, serving gzip-encoded assets only")
+
+# Preferred first when the client accepts several
+ENCODINGS = ("br", "gzip")
+
+
+def encode_variants(body: bytes) -> dict[str, bytes]:
+    """Compress a body once with every available encoding.
+    
+    Maximum compression levels are used since this only runs at startup.
+    """
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return variants
+
+
+def negotiate(accept_encoding: str, available) -> Optional[str]:
+    """Pick the preferred encoding the client accepts, or None for identity."""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    
+    for coding in ENCODINGS:
+        if coding in available and (coding in accepted or "*" in accepted):
+            return coding
+    return None
+
+
+@dataclass(frozen=True)
+class StaticAsset:
+    """A static body encoded once at startup, with its content hash."""
+    body: bytes
+    media_type: str
+    variants: dict[str, bytes] = field(init=False)
+    digest: str = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "variants", encode_variants(self.body))
+        object.__setattr__(self, "digest", hashlib.sha256(self.body).hexdigest()[:32])
+    
+    def select(self, accept_encoding: str) -> tuple[Optional[str], bytes, str]:
+        """Pick (encoding, body, etag) for a request's Accept-Encoding."""
+        encoding = negotiate(accept_encoding, self.variants)
+        if encoding is None:
+            return None, self.body, f'"{self.digest}"'
+        return encoding, self.variants[encoding], f'"{self.digest}-{encoding}"'
@@ -0,0 +1,91 @@
+"""Prometheus metrics for the dashboard API."""
+
+import time
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ..utils.logger import get_logger
+
+logger = get_logger("web.metrics")
+
+try:
+    from prometheus_client import CollectorRegistry, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
+except ImportError:
+    CollectorRegistry = None
+    logger.debug("prometheus_client not available, /metrics disabled")
+
+
+class Metrics:
+    """Request latency and connection pool gauges in a registry of their own.
+    
+    A private registry keeps each app's collectors separate, so building
+    more than one dashboard in a process does not register duplicates.
+    """
+    
+    content_type = CONTENT_TYPE_LATEST if CollectorRegistry is not None else None
+    
+    def __init__(self, pool, whitelist=None):
+        self.registry = CollectorRegistry()
+        self.latency = Histogram(
+            "leatt_http_request_duration_seconds",
+            "Time to serve a request, by route",
+            ["method", "route"],
+            registry=self.registry,
+        )
+        checked_out = Gauge(
+            "leatt_db_pool_checked_out",
+            "Database connections currently in use",
+            registry=self.registry,
+        )
+        checked_out.set_function(pool.checkedout)
+        checked_in = Gauge(
+            "leatt_db_pool_checked_in",
+            "Idle database connections held by the pool",
+            registry=self.registry,
+        )
+        checked_in.set_function(pool.checkedin)
+        
+        if whitelist is not None:
+            trust_cache = Gauge(
+                "leatt_whitelist_cache",
+                "Whitelist trusted-lookup cache statistics",
+                ["stat"],
+                registry=self.registry,
+            )
+            for stat in ("hits", "misses", "size", "maxsize"):
+                trust_cache.labels(stat).set_function(lambda stat=stat: whitelist.cache_info()[stat])
+    
+    def render(self) -> bytes:
+        """Current values in the Prometheus text format."""
+        return generate_latest(self.registry)
+
+
+def create_metrics(pool, whitelist=None) -> Optional[Metrics]:
+    """Build the metrics for a pool (and whitelist), or None without prometheus_client."""
+    if CollectorRegistry is None:
+        return None
+    return Metrics(pool, whitelist)
+
+
+class LatencyMiddleware:
+    """Times every HTTP request and records it under its route template."""
+    
+    def __init__(self, app: ASGIApp, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            # The router stores the matched route in the scope; label by its
+            # template so path parameters do not create a series per id
+            route = scope.get("route")
+            label = getattr(route, "path", "unmatched")
+            self.metrics.latency.labels(scope["method"], label).observe(time.perf_counter() - start)
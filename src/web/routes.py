@@ -1,13 +1,18 @@
 """Additional API routes for the web dashboard."""
 
+import math
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timedelta
 
 
 def format_timedelta(td: timedelta) -> str:
     """Format a timedelta as a human-readable string."""
-    seconds = int(td.total_seconds())
-    
+    return _format_seconds(int(td.total_seconds()))
+
+
+@lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
     if seconds < 60:
         return f"{seconds}s"
     elif seconds < 3600:
@@ -18,25 +23,37 @@ def format_timedelta(td: timedelta) -> str:
         return f"{seconds // 86400}d"
 
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+@lru_cache(maxsize=4096)
 def format_bytes(num_bytes: int) -> str:
     """Format bytes as human-readable string."""
     if num_bytes == 0:
         return "0 B"
+    if not math.isfinite(num_bytes):
+        # Like the old divide-by-1024 loop, which ran inf and nan through to PB
+        return f"{num_bytes:.1f} {_BYTE_UNITS[-1]}"
     
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(num_bytes) < 1024:
-            return f"{num_bytes:.1f} {unit}"
-        num_bytes /= 1024
-    
-    return f"{num_bytes:.1f} PB"
+    # Units are powers of 1024, so the bit length gives the unit directly;
+    # fractions below one byte have no bits and stay in bytes
+    index = min(max(0, int(abs(num_bytes)).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{num_bytes / (1 << (10 * index)):.1f} {_BYTE_UNITS[index]}"
+
+
+_SEVERITY_COLORS = {
+    "low": "#3b82f6",
+    "medium": "#f59e0b",
+    "high": "#ef4444",
+    "critical": "#dc2626",
+}
+_DEFAULT_SEVERITY_COLOR = "#94a3b8"
 
 
 def severity_to_color(severity: str) -> str:
     """Map severity to color class."""
-    colors = {
-        "low": "#3b82f6",
-        "medium": "#f59e0b",
-        "high": "#ef4444",
-        "critical": "#dc2626",
-    }
-    return colors.get(severity.lower(), "#94a3b8")
+    # Severities are stored lowercase, so the first lookup almost always hits
+    color = _SEVERITY_COLORS.get(severity)
+    if color is None:
+        color = _SEVERITY_COLORS.get(severity.lower(), _DEFAULT_SEVERITY_COLOR)
+    return color
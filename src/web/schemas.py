@@ -0,0 +1,168 @@
+"""Response schemas for the dashboard API."""
+
+from datetime import datetime
+from typing import Any, ClassVar, Iterable, Optional
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, computed_field
+from sqlalchemy import Boolean, DateTime, Select, case, func, null, select
+
+from ..utils.database import name_id
+
+
+class _RowModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    # Field whose name_id() fingerprint is emitted as "wid", if any
+    name_id_source: ClassVar[Optional[str]] = None
+
+
+class _NamedRowModel(_RowModel):
+    """Row carrying a process name the dashboard matches against the whitelist."""
+    
+    @computed_field
+    @property
+    def wid(self) -> Optional[int]:
+        return name_id(getattr(self, self.name_id_source))
+
+
+class AlertOut(_NamedRowModel):
+    name_id_source: ClassVar[Optional[str]] = "process_name"
+    
+    id: int
+    timestamp: Optional[datetime] = None
+    severity: str
+    source: str
+    process_name: Optional[str] = None
+    process_pid: Optional[int] = None
+    description: str
+    acknowledged: Optional[bool] = None
+
+
+class AlertDetailOut(AlertOut):
+    """A single alert with its details blob, which list responses leave out."""
+    
+    details: Optional[str] = None
+
+
+class ProcessOut(_RowModel):
+    id: int
+    pid: int
+    name: str
+    path: Optional[str] = None
+    user: Optional[str] = None
+    is_trusted: Optional[bool] = None
+    risk_score: Optional[float] = None
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
+
+
+class NetworkEventOut(_RowModel):
+    id: int
+    timestamp: Optional[datetime] = None
+    process_name: Optional[str] = None
+    process_pid: Optional[int] = None
+    remote_address: Optional[str] = None
+    remote_port: Optional[int] = None
+    bytes_sent: Optional[int] = None
+    bytes_received: Optional[int] = None
+
+
+class FileEventOut(_RowModel):
+    id: int
+    timestamp: Optional[datetime] = None
+    process_name: Optional[str] = None
+    file_path: str
+    event_type: str
+    is_sensitive: Optional[bool] = None
+
+
+class WhitelistOut(_NamedRowModel):
+    name_id_source: ClassVar[Optional[str]] = "name"
+    
+    name: str
+    path: Optional[str] = None
+    hash_sha256: Optional[str] = None
+    publisher: Optional[str] = None
+    added_by: str
+    reason: Optional[str] = None
+
+
+class QuarantineOut(_RowModel):
+    id: int
+    timestamp: Optional[datetime] = None
+    pid: int
+    name: str
+    path: Optional[str] = None
+    reason: Optional[str] = None
+    killed_by: Optional[str] = None
+    success: Optional[bool] = None
+
+
+ALERTS = TypeAdapter(list[AlertOut])
+PROCESSES = TypeAdapter(list[ProcessOut])
+NETWORK_EVENTS = TypeAdapter(list[NetworkEventOut])
+FILE_EVENTS = TypeAdapter(list[FileEventOut])
+WHITELIST = TypeAdapter(list[WhitelistOut])
+QUARANTINE = TypeAdapter(list[QuarantineOut])
+
+
+def dump_rows(adapter: TypeAdapter, rows: Iterable[Any]) -> list[dict]:
+    """Serialize ORM rows or dataclasses to JSON-ready dicts in one pass."""
+    return adapter.dump_python(
+        adapter.validate_python(list(rows), from_attributes=True),
+        mode="json",
+    )
+
+
+def _json_object(model: type[BaseModel], page) -> Any:
+    """SQLite json_object() expression rendering one row of page like model would."""
+    pairs = []
+    for name in model.model_fields:
+        column = page.c[name]
+        if isinstance(column.type, DateTime):
+            value = func.replace(column, " ", "T")
+        elif isinstance(column.type, Boolean):
+            value = case(
+                (column.is_(None), null()),
+                (column == True, func.json("true")),
+                else_=func.json("false"),
+            )
+        else:
+            value = column
+        pairs.extend((name, value))
+    if model.name_id_source:
+        pairs.extend(("wid", func.name_id(page.c[model.name_id_source])))
+    return func.json_object(*pairs)
+
+
+def json_rows(model: type[BaseModel], stmt: Select) -> Select:
+    """Wrap a query so SQLite renders each row as one JSON object string."""
+    return select(_json_object(model, stmt.subquery()))
+
+
+def page_bounds(stmt: Select, *keys: str) -> Select:
+    """Row count and last row's key values of a newest-first page query, without rendering rows.
+    
+    Returns no row at all for an empty page.
+    """
+    page = stmt.subquery()
+    columns = [page.c[key] for key in keys]
+    return select(func.count().over(), *columns).order_by(*(column.asc() for column in columns)).limit(1)
+
+
+def json_page(model: type[BaseModel], stmt: Select, *keys: str) -> Select:
+    """Wrap a newest-first page query so SQLite renders each row as JSON.
+    
+    Result rows are (*key values, JSON object string). The outer query
+    repeats the descending ORDER BY on keys: SQLite does not promise to
+    keep a subquery's order otherwise, json_group_array() included.
+    Output matches dump_rows apart from always-present microseconds.
+    """
+    page = stmt.subquery()
+    columns = [page.c[key] for key in keys]
+    return select(*columns, _json_object(model, page)).order_by(*(column.desc() for column in columns))
+
+
+def json_array(rows) -> bytes:
+    """Join the JSON column of json_page rows into one JSON array body."""
+    return ("[" + ",".join(row[-1] for row in rows) + "]").encode()
@@ -0,0 +1,913 @@
+let currentTab = 'alerts';
+let alertsCache = [];
+let visibleAlerts = [];
+let processesCache = [];
+let whitelistCache = [];
+let trustedIds = new Set();
+let trustFilter = 'all';
+let alertTrustFilter = 'all';
+let filterUnackOnly = false;
+
+const severityFilterEl = document.getElementById('filter-severity');
+const alertsBody = document.getElementById('alerts-table');
+const processesBody = document.getElementById('processes-table');
+const networkBody = document.getElementById('network-table');
+const filesBody = document.getElementById('files-table');
+
+function debounce(fn, ms) {
+    let timer;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+    };
+}
+
+// Filter clicks go through these so a burst of toggles renders once
+const scheduleRenderAlerts = debounce(() => renderAlerts(), 50);
+const scheduleRenderProcesses = debounce(() => renderProcesses(), 50);
+
+function setWhitelist(data) {
+    whitelistCache = data;
+    trustedIds = new Set(data.map(w => w.wid));
+    alertColumns = null;
+}
+
+// Alerts arrive newest first, one keyset page at a time; older pages are
+// fetched as the table is scrolled towards its end.
+const ALERT_PAGE = 50;
+let alertsExhausted = false;
+let alertsLoadingMore = false;
+
+// Pages are ordered by (timestamp, id), so alerts sharing a timestamp keep
+// their place across page boundaries
+function isOlderAlert(a, than) {
+    return a.timestamp < than.timestamp || (a.timestamp === than.timestamp && a.id < than.id);
+}
+
+function setAlerts(data) {
+    // A refresh only covers the newest page: keep older pages already scrolled in
+    const oldest = data.length > 0 ? data[data.length - 1] : null;
+    const older = oldest === null ? [] : alertsCache.filter(a => isOlderAlert(a, oldest));
+    if (older.length === 0) alertsExhausted = data.length < ALERT_PAGE;
+    alertsCache = data.concat(older);
+    alertColumns = null;
+}
+
+async function loadOlderAlerts() {
+    if (alertsLoadingMore || alertsExhausted || alertsCache.length === 0) return;
+    alertsLoadingMore = true;
+    try {
+        const last = alertsCache[alertsCache.length - 1];
+        const before = encodeURIComponent(last.timestamp);
+        const res = await fetch(`/api/alerts?limit=${ALERT_PAGE}&before=${before}&before_id=${last.id}`);
+        const rows = await res.json();
+        alertsExhausted = !res.headers.get('X-Next-Cursor');
+        alertsCache = alertsCache.concat(rows);
+        alertColumns = null;
+        renderAlerts();
+    } catch (e) {
+        console.error('Older alerts error:', e);
+    } finally {
+        alertsLoadingMore = false;
+    }
+}
+
+// Column-wise copy of alertsCache so filtering scans typed arrays rather
+// than row objects; rebuilt lazily whenever the alerts or whitelist change.
+const SEVERITY_CODES = { low: 1, medium: 2, high: 3, critical: 4 };
+const ALERT_ACKED = 1;
+const ALERT_TRUSTED = 2;
+let alertColumns = null;
+
+function buildAlertColumns() {
+    const n = alertsCache.length;
+    const severity = new Uint8Array(n);
+    const flags = new Uint8Array(n);
+    for (let i = 0; i < n; i++) {
+        const a = alertsCache[i];
+        severity[i] = SEVERITY_CODES[a.severity] || 0;
+        flags[i] = (a.acknowledged ? ALERT_ACKED : 0)
+            | (a.wid !== null && trustedIds.has(a.wid) ? ALERT_TRUSTED : 0);
+    }
+    return { severity, flags, matches: new Uint32Array(n) };
+}
+
+function filterAlerts(severityCode, excludeFlags) {
+    if (!alertColumns) alertColumns = buildAlertColumns();
+    const { severity, flags, matches } = alertColumns;
+    let count = 0;
+    for (let i = 0; i < severity.length; i++) {
+        if ((flags[i] & excludeFlags) === 0 && (severityCode === 0 || severity[i] === severityCode)) {
+            matches[count++] = i;
+        }
+    }
+    const rows = new Array(count);
+    for (let i = 0; i < count; i++) rows[i] = alertsCache[matches[i]];
+    return rows;
+}
+
+function setProcesses(data) {
+    processesCache = data.sort((a, b) => b.risk_score - a.risk_score);
+}
+
+function showTab(tab) {
+    document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+    document.querySelectorAll('.section').forEach(s => { s.hidden = s.id !== `${tab}-section`; });
+    document.querySelector(`[onclick="showTab('${tab}')"]`).classList.add('active');
+    currentTab = tab;
+    loadData();
+}
+
+function setTrustFilter(filter) {
+    trustFilter = filter;
+    document.querySelectorAll('#processes-section .filter-btn').forEach(b => b.classList.remove('active'));
+    document.getElementById('filter-' + filter).classList.add('active');
+    scheduleRenderProcesses();
+}
+
+function setAlertTrustFilter(filter) {
+    alertTrustFilter = filter;
+    document.getElementById('alert-filter-all').classList.toggle('active', filter === 'all');
+    document.getElementById('alert-filter-untrusted').classList.toggle('active', filter === 'untrusted');
+    scheduleRenderAlerts();
+}
+
+function toggleFilter(type) {
+    if (type === 'unack') {
+        filterUnackOnly = !filterUnackOnly;
+        document.getElementById('filter-unack').classList.toggle('active', filterUnackOnly);
+        scheduleRenderAlerts();
+    }
+}
+
+async function loadBootstrap() {
+    try {
+        const res = await fetch(`/api/bootstrap?limit=${ALERT_PAGE}`);
+        const data = await res.json();
+        renderStats(data.stats);
+        setWhitelist(data.whitelist);
+        renderWhitelist();
+        setAlerts(data.alerts);
+        renderAlerts();
+    } catch (e) { console.error('Bootstrap error:', e); }
+}
+
+// Last ETag seen per URL. Browsers revalidate no-cache responses on their
+// own, so a repeated ETag means the body is the one already rendered.
+const seenEtags = new Map();
+
+async function fetchChanged(url) {
+    const res = await fetch(url);
+    const etag = res.headers.get('ETag');
+    if (etag && seenEtags.get(url) === etag) return null;
+    if (etag) seenEtags.set(url, etag);
+    return res.json();
+}
+
+async function loadStats() {
+    try {
+        const res = await fetch('/api/stats');
+        renderStats(await res.json());
+    } catch (e) { console.error('Stats error:', e); }
+}
+
+function renderStats(data) {
+    document.getElementById('stat-alerts').textContent = data.unacknowledged_alerts;
+    document.getElementById('stat-processes').textContent = data.monitored_processes;
+    document.getElementById('stat-network').textContent = data.network_events;
+    document.getElementById('stat-files').textContent = data.file_events;
+}
+
+// Virtualized tables: only rows inside the scroll viewport (plus overscan)
+// are in the DOM; spacer rows stand in for the rest. Row elements are
+// cloned from a <template> once per key and refilled in place.
+const VIRTUAL_OVERSCAN = 8;
+const virtualTables = new Map();
+const rowCells = new WeakMap();
+const rowData = new WeakMap();
+
+// DOM writes are queued per target and committed together in the next
+// animation frame; a later write to the same target replaces an earlier one.
+const pendingWrites = new Map();
+
+function writeInFrame(target, write) {
+    if (pendingWrites.size === 0) requestAnimationFrame(flushWrites);
+    pendingWrites.set(target, write);
+}
+
+function flushWrites() {
+    const writes = [...pendingWrites.values()];
+    pendingWrites.clear();
+    writes.forEach(write => write());
+}
+
+function setContent(container, html) {
+    writeInFrame(container, () => { container.innerHTML = html; });
+}
+
+function renderVirtual(tbody, rows, templateId, fillRow, { key = r => r.id, onEnd = null } = {}) {
+    let state = virtualTables.get(tbody);
+    if (!state) {
+        state = {
+            rows: [], template: document.getElementById(templateId).content.firstElementChild,
+            fillRow, key, rowHeight: 0,
+            nodes: new Map(), top: spacerRow(), bottom: spacerRow(),
+            lastScrollTop: 0, scrolledDown: false,
+        };
+        virtualTables.set(tbody, state);
+        const wrapper = tbody.closest('.table-wrapper');
+        wrapper.addEventListener('scroll', () => {
+            // Only a user scroll towards the end may ask onEnd for more rows
+            if (wrapper.scrollTop > state.lastScrollTop) state.scrolledDown = true;
+            state.lastScrollTop = wrapper.scrollTop;
+            if (state.rows.length > 0 && !pendingWrites.has(tbody)) {
+                writeInFrame(tbody, () => paintVirtual(tbody));
+            }
+        }, { passive: true });
+    }
+    state.rows = rows;
+    state.fillRow = fillRow;
+    state.key = key;
+    state.onEnd = onEnd;
+    writeInFrame(tbody, () => paintVirtual(tbody));
+}
+
+function clearVirtual(tbody, html) {
+    const state = virtualTables.get(tbody);
+    if (state) {
+        state.rows = [];
+        state.nodes.clear();
+    }
+    setContent(tbody, html);
+}
+
+function spacerRow() {
+    const tr = document.createElement('tr');
+    tr.className = 'virtual-spacer';
+    tr.appendChild(document.createElement('td')).colSpan = 99;
+    return tr;
+}
+
+function cellsOf(tr) {
+    let cells = rowCells.get(tr);
+    if (!cells) {
+        cells = {};
+        tr.querySelectorAll('[data-cell]').forEach(el => { cells[el.dataset.cell] = el; });
+        rowCells.set(tr, cells);
+    }
+    return cells;
+}
+
+// Setters only touch the DOM when the value actually changed
+function setText(el, text) {
+    text = String(text);
+    if (el.textContent !== text) el.textContent = text;
+}
+
+function setTitle(el, title) {
+    if (el.title !== title) el.title = title;
+}
+
+function setClass(el, className) {
+    if (el.className !== className) el.className = className;
+}
+
+function setHidden(el, hidden) {
+    if (el.hidden !== hidden) el.hidden = hidden;
+}
+
+function onRowAction(container, handlers, rowSelector = 'tr') {
+    container.addEventListener('click', e => {
+        const button = e.target.closest('[data-action]');
+        if (!button || !container.contains(button)) return;
+        const row = rowData.get(button.closest(rowSelector));
+        if (row) handlers[button.dataset.action](row);
+    });
+}
+
+// Clone a template per record and fill it; for small, non-virtualized lists.
+// Elements are kept per key, so a refresh only touches rows that changed.
+const listNodes = new WeakMap();
+
+function renderList(container, rows, templateId, fillRow, { key = r => r.id } = {}) {
+    const template = document.getElementById(templateId).content.firstElementChild;
+    writeInFrame(container, () => {
+        const previous = listNodes.get(container) || new Map();
+        const nodes = new Map();
+        const wanted = [];
+        for (const row of rows) {
+            const k = key(row);
+            const el = previous.get(k) || template.cloneNode(true);
+            fillRow(cellsOf(el), row);
+            rowData.set(el, row);
+            nodes.set(k, el);
+            wanted.push(el);
+        }
+        listNodes.set(container, nodes);
+        placeInOrder(container, wanted);
+    });
+}
+
+// Move/insert nodes into order, leaving ones already in place untouched
+function placeInOrder(parent, wanted) {
+    let cursor = parent.firstChild;
+    for (const node of wanted) {
+        if (node === cursor) {
+            cursor = cursor.nextSibling;
+        } else {
+            parent.insertBefore(node, cursor);
+        }
+    }
+    while (cursor) {
+        const next = cursor.nextSibling;
+        parent.removeChild(cursor);
+        cursor = next;
+    }
+}
+
+function paintVirtual(tbody) {
+    const state = virtualTables.get(tbody);
+    const wrapper = tbody.closest('.table-wrapper');
+    const rowHeight = state.rowHeight || 49;
+    const headerHeight = wrapper.querySelector('thead').offsetHeight;
+    const scrollTop = Math.max(0, wrapper.scrollTop - headerHeight);
+    const viewport = wrapper.clientHeight || window.innerHeight;
+    const count = state.rows.length;
+    const visible = Math.ceil(viewport / rowHeight);
+    // Clamp so a list that shrank while scrolled down still shows its tail
+    const first = Math.min(Math.floor(scrollTop / rowHeight), Math.max(0, count - visible));
+    const start = Math.max(0, first - VIRTUAL_OVERSCAN);
+    const end = Math.min(count, first + visible + VIRTUAL_OVERSCAN);
+    
+    const wanted = [];
+    const nodes = new Map();
+    if (start > 0) {
+        state.top.style.height = `${start * rowHeight}px`;
+        wanted.push(state.top);
+    }
+    for (let i = start; i < end; i++) {
+        const row = state.rows[i];
+        const k = state.key(row);
+        let tr = state.nodes.get(k);
+        if (!tr) tr = state.template.cloneNode(true);
+        state.fillRow(cellsOf(tr), row);
+        rowData.set(tr, row);
+        nodes.set(k, tr);
+        wanted.push(tr);
+    }
+    if (end < count) {
+        state.bottom.style.height = `${(count - end) * rowHeight}px`;
+        wanted.push(state.bottom);
+    }
+    state.nodes = nodes;
+    // At most one onEnd call per scroll: the rows it adds repaint the table,
+    // and a short (filtered) list must not keep fetching pages on its own
+    if (state.onEnd && state.scrolledDown && end >= count - VIRTUAL_OVERSCAN) {
+        state.scrolledDown = false;
+        state.onEnd();
+    }
+    
+    placeInOrder(tbody, wanted);
+    
+    if (!state.rowHeight && end > start) {
+        const firstRow = state.nodes.get(state.key(state.rows[start]));
+        if (firstRow.offsetHeight) {
+            state.rowHeight = firstRow.offsetHeight;
+            if (state.rowHeight !== rowHeight) paintVirtual(tbody);
+        }
+    }
+}
+
+async function loadAlerts() {
+    try {
+        const data = await fetchChanged(`/api/alerts?limit=${ALERT_PAGE}`);
+        if (!data) return;
+        setAlerts(data);
+        renderAlerts();
+    } catch (e) { console.error('Alerts error:', e); }
+}
+
+function renderAlerts() {
+    const tbody = alertsBody;
+    const severity = severityFilterEl.value;
+    const filtered = filterAlerts(
+        severity === 'all' ? 0 : SEVERITY_CODES[severity],
+        (filterUnackOnly ? ALERT_ACKED : 0) | (alertTrustFilter === 'untrusted' ? ALERT_TRUSTED : 0),
+    );
+    visibleAlerts = filtered;
+    
+    if (filtered.length === 0) {
+        clearVirtual(tbody, `<tr><td colspan="6"><div class="empty-state">
+            <div class="empty-state-icon">✅</div>
+            <div class="empty-state-text">No alerts matching filters</div>
+        </div></td></tr>`);
+        return;
+    }
+    
+    renderVirtual(tbody, filtered, 'tpl-alert-row', fillAlertRow, { onEnd: loadOlderAlerts });
+}
+
+function fillAlertRow(c, a) {
+    setText(c.time, formatTime(a.timestamp));
+    setClass(c.severity, `badge ${a.severity}`);
+    setText(c.severity, a.severity.toUpperCase());
+    setText(c.source, a.source.split(':')[0]);
+    setTitle(c.source, a.source);
+    setText(c.process, a.process_name || '-');
+    setTitle(c.process, a.process_name || '');
+    setText(c.description, a.description);
+    setTitle(c.description, a.description);
+    setHidden(c.dismissed, !a.acknowledged);
+    setHidden(c.inspect, a.acknowledged);
+    setHidden(c.trust, a.acknowledged || !a.process_name);
+    setHidden(c.kill, a.acknowledged || !a.process_pid);
+    setHidden(c.dismiss, a.acknowledged);
+}
+
+async function loadProcesses() {
+    try {
+        const data = await fetchChanged('/api/processes');
+        if (!data) return;
+        setProcesses(data);
+        renderProcesses();
+    } catch (e) { console.error('Processes error:', e); }
+}
+
+function renderProcesses() {
+    const tbody = processesBody;
+    
+    let filtered = processesCache;
+    
+    if (trustFilter === 'trusted') {
+        filtered = filtered.filter(p => p.is_trusted);
+    } else if (trustFilter === 'untrusted') {
+        filtered = filtered.filter(p => !p.is_trusted);
+    } else if (trustFilter === 'risky') {
+        filtered = filtered.filter(p => p.risk_score > 0);
+    }
+    
+    if (filtered.length === 0) {
+        clearVirtual(tbody, `<tr><td colspan="7"><div class="empty-state">
+            <div class="empty-state-icon">📭</div>
+            <div class="empty-state-text">No processes matching filter</div>
+        </div></td></tr>`);
+        return;
+    }
+    
+    renderVirtual(tbody, filtered, 'tpl-process-row', fillProcessRow);
+}
+
+function fillProcessRow(c, p) {
+    setText(c.pid, p.pid);
+    setText(c.name, p.name);
+    setTitle(c.name, p.name);
+    setText(c.path, p.path || '-');
+    setTitle(c.path, p.path || '');
+    setClass(c.trust, `trust-badge ${p.is_trusted ? 'trusted' : 'untrusted'}`);
+    setText(c.trust, p.is_trusted ? '✓ Trusted' : '✗ Untrusted');
+    setHidden(c.anomaly, !(p.is_trusted && p.risk_score > 0));
+    setClass(c.risk, `risk-value ${getRiskClass(p.risk_score)}`);
+    setText(c.risk, p.risk_score.toFixed(0));
+    setText(c.seen, formatTime(p.last_seen));
+}
+
+async function loadNetwork() {
+    try {
+        const data = await fetchChanged('/api/network?limit=30');
+        if (data) renderNetwork(data);
+    } catch (e) { console.error('Network error:', e); }
+}
+
+function renderNetwork(data) {
+    const tbody = networkBody;
+    
+    if (data.length === 0) {
+        clearVirtual(tbody, `<tr><td colspan="5"><div class="empty-state">
+            <div class="empty-state-icon">🌐</div>
+            <div class="empty-state-text">No network events yet</div>
+        </div></td></tr>`);
+        return;
+    }
+    
+    renderVirtual(tbody, data, 'tpl-network-row', fillNetworkRow);
+}
+
+function fillNetworkRow(c, n) {
+    setText(c.time, formatTime(n.timestamp));
+    setText(c.process, n.process_name || '-');
+    setText(c.address, n.remote_address);
+    setText(c.port, n.remote_port);
+    setText(c.sent, formatBytes(n.bytes_sent));
+}
+
+async function loadFiles() {
+    try {
+        const data = await fetchChanged('/api/files?limit=30');
+        if (data) renderFiles(data);
+    } catch (e) { console.error('Files error:', e); }
+}
+
+function renderFiles(data) {
+    const tbody = filesBody;
+    
+    if (data.length === 0) {
+        clearVirtual(tbody, `<tr><td colspan="5"><div class="empty-state">
+            <div class="empty-state-icon">📁</div>
+            <div class="empty-state-text">No file events yet</div>
+        </div></td></tr>`);
+        return;
+    }
+    
+    renderVirtual(tbody, data, 'tpl-file-row', fillFileRow);
+}
+
+function fillFileRow(c, f) {
+    const [badgeClass, badgeText] = fileActionBadge(f.event_type);
+    setText(c.time, formatTime(f.timestamp));
+    setText(c.process, f.process_name || '-');
+    setText(c.path, f.file_path);
+    setTitle(c.path, f.file_path);
+    setClass(c.action, `badge ${badgeClass}`);
+    setText(c.action, badgeText);
+    setClass(c.sensitive, f.is_sensitive ? 'badge high' : 'cell-none');
+    setText(c.sensitive, f.is_sensitive ? '⚠ SENSITIVE' : 'No');
+}
+
+async function loadWhitelist() {
+    try {
+        const res = await fetch('/api/whitelist');
+        setWhitelist(await res.json());
+        renderWhitelist();
+    } catch (e) { console.error('Whitelist error:', e); }
+}
+
+function renderWhitelist() {
+    const data = whitelistCache;
+    const grid = document.getElementById('whitelist-grid');
+    
+    if (data.length === 0) {
+        setContent(grid, `<div class="empty-state">
+            <div class="empty-state-icon">📋</div>
+            <div class="empty-state-text">No whitelist entries</div>
+        </div>`);
+        return;
+    }
+    
+    renderList(grid, data, 'tpl-whitelist-item', fillWhitelistItem, { key: w => w.name });
+}
+
+function fillWhitelistItem(c, w) {
+    setText(c.name, w.name);
+    setText(c.source, w.added_by);
+    setText(c.reason, w.reason || 'No reason specified');
+    setHidden(c.remove, w.added_by === 'system');
+}
+
+function showToast(message, type = 'success') {
+    const container = document.getElementById('toast-container');
+    const toast = document.createElement('div');
+    toast.className = 'toast ' + type;
+    toast.textContent = message;
+    container.appendChild(toast);
+    setTimeout(() => toast.remove(), 3000);
+}
+
+async function addToWhitelist() {
+    const name = document.getElementById('whitelist-name').value.trim();
+    const reason = document.getElementById('whitelist-reason').value.trim();
+    
+    if (!name) {
+        showToast('Please enter a process name', 'error');
+        return;
+    }
+    
+    const res = await fetch('/api/whitelist', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name, reason })
+    });
+    const data = await res.json();
+    
+    if (data.success) {
+        showToast(`Added "${name}" to whitelist`, 'success');
+        document.getElementById('whitelist-name').value = '';
+        document.getElementById('whitelist-reason').value = '';
+        loadWhitelist();
+    } else {
+        showToast(data.error || 'Failed to add', 'error');
+    }
+}
+
+async function removeFromWhitelist(name) {
+    if (!confirm(`Remove "${name}" from whitelist?`)) return;
+    await fetch(`/api/whitelist/${encodeURIComponent(name)}`, { method: 'DELETE' });
+    showToast(`Removed "${name}" from whitelist`, 'success');
+    loadWhitelist();
+}
+
+async function trustProcess(name) {
+    const res = await fetch('/api/whitelist', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ name, reason: 'Trusted from alert' })
+    });
+    const data = await res.json();
+    
+    if (data.success) {
+        showToast(`"${name}" is now trusted`, 'success');
+    } else {
+        showToast(data.error || 'Already trusted', 'error');
+    }
+    // Trusting changes the whitelist, not the alerts, so re-filter locally
+    await loadWhitelist();
+    renderAlerts();
+    loadStats();
+}
+
+async function dismissAlert(id) {
+    await fetch(`/api/alerts/${id}/acknowledge`, { method: 'POST' });
+    showToast('Alert dismissed', 'success');
+    loadAlerts();
+    loadStats();
+}
+
+async function dismissVisibleAlerts() {
+    const ids = visibleAlerts.filter(a => !a.acknowledged).map(a => a.id);
+    if (ids.length === 0) {
+        showToast('No alerts to dismiss', 'error');
+        return;
+    }
+    
+    const res = await fetch('/api/alerts/acknowledge', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ids })
+    });
+    const data = await res.json();
+    if (!res.ok) {
+        showToast(data.error, 'error');
+        return;
+    }
+    showToast(`${data.updated} alert(s) dismissed`, 'success');
+    loadAlerts();
+    loadStats();
+}
+
+async function quarantineProcess(pid, name) {
+    if (!confirm(`⚠️ KILL PROCESS\n\nAre you sure you want to terminate "${name}" (PID: ${pid})?\n\nThis action cannot be undone.`)) {
+        return;
+    }
+    
+    try {
+        const res = await fetch(`/api/quarantine/${pid}`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ reason: 'Manually killed by user' })
+        });
+        const data = await res.json();
+        
+        if (data.success) {
+            showToast(`Process "${name}" terminated`, 'success');
+            loadProcesses();
+            loadStats();
+            if (currentTab === 'quarantine') loadQuarantine();
+        } else {
+            showToast(data.error || 'Failed to kill process', 'error');
+        }
+    } catch (e) {
+        showToast('Error: ' + e.message, 'error');
+    }
+}
+
+async function loadQuarantine() {
+    try {
+        const data = await fetchChanged('/api/quarantine');
+        if (data) renderQuarantine(data);
+    } catch (e) { console.error('Quarantine error:', e); }
+}
+
+function renderQuarantine(data) {
+    const tbody = document.getElementById('quarantine-table');
+    
+    if (data.length === 0) {
+        setContent(tbody, `<tr><td colspan="6"><div class="empty-state">
+            <div class="empty-state-icon">🛡️</div>
+            <div class="empty-state-text">No processes quarantined yet</div>
+        </div></td></tr>`);
+        return;
+    }
+    
+    renderList(tbody, data, 'tpl-quarantine-row', fillQuarantineRow);
+}
+
+function fillQuarantineRow(c, q) {
+    setText(c.time, formatTime(q.timestamp));
+    setText(c.pid, q.pid);
+    setText(c.name, q.name);
+    setText(c.path, q.path || '-');
+    setTitle(c.path, q.path || '');
+    setText(c.reason, q.reason || '-');
+    setClass(c.result, q.success ? 'badge file-deleted' : 'badge medium');
+    setText(c.result, q.success ? 'KILLED' : 'FAILED');
+}
+
+async function inspectAlert(id) {
+    // List pages leave out the details blob, so fetch the full alert here
+    let alert = null;
+    try {
+        const res = await fetch(`/api/alerts/${id}`);
+        if (res.ok) alert = await res.json();
+    } catch (e) { console.error('Alert detail error:', e); }
+    alert = alert || alertsCache.find(a => a.id === id);
+    if (!alert) return;
+    
+    const view = document.getElementById('tpl-alert-detail').content.firstElementChild.cloneNode(true);
+    const c = cellsOf(view);
+    setClass(c.severity, `badge ${alert.severity}`);
+    setText(c.severity, alert.severity.toUpperCase());
+    setText(c.time, new Date(alert.timestamp).toLocaleString());
+    setText(c.source, alert.source);
+    setText(c.process, alert.process_name || '-');
+    setText(c.pid, `(PID: ${alert.process_pid || '-'})`);
+    setText(c.description, alert.description);
+    
+    setHidden(c['details-row'], !alert.details);
+    if (alert.details) {
+        setText(c.details, typeof alert.details === 'string' ? alert.details : JSON.stringify(alert.details, null, 2));
+    }
+    
+    setHidden(c.actions, !alert.process_name);
+    c.trust.addEventListener('click', () => {
+        trustProcess(alert.process_name);
+        closeModal();
+    });
+    
+    document.getElementById('modal-body').replaceChildren(view);
+    document.getElementById('detail-modal').classList.add('active');
+}
+
+function closeModal() {
+    document.getElementById('detail-modal').classList.remove('active');
+}
+
+document.getElementById('detail-modal').addEventListener('click', (e) => {
+    if (e.target.classList.contains('modal')) closeModal();
+});
+
+const TIME_FORMAT = new Intl.DateTimeFormat('en-US', {hour: '2-digit', minute: '2-digit'});
+const DATE_FORMAT = new Intl.DateTimeFormat('en-US', {month: 'short', day: 'numeric'});
+const formattedTimes = new Map();
+
+function formatTime(ts) {
+    if (!ts) return '-';
+    let text = formattedTimes.get(ts);
+    if (text === undefined) {
+        const d = new Date(ts);
+        text = TIME_FORMAT.format(d) + ' ' + DATE_FORMAT.format(d);
+        if (formattedTimes.size >= 2048) formattedTimes.clear();
+        formattedTimes.set(ts, text);
+    }
+    return text;
+}
+
+const BYTE_UNITS = ['B', 'KB', 'MB', 'GB'];
+
+function formatBytes(bytes) {
+    if (!bytes) return '0 B';
+    let i = 0;
+    while (bytes >= 1024 && i < BYTE_UNITS.length - 1) {
+        bytes /= 1024;
+        i++;
+    }
+    return parseFloat(bytes.toFixed(1)) + ' ' + BYTE_UNITS[i];
+}
+
+function getRiskClass(score) {
+    if (score >= 60) return 'risk-high';
+    if (score >= 30) return 'risk-med';
+    return 'risk-low';
+}
+
+function fileActionBadge(action) {
+    const type = (action || '').toLowerCase();
+    if (type.includes('created') || type.includes('create')) {
+        return ['file-created', '+ CREATED'];
+    } else if (type.includes('deleted') || type.includes('delete')) {
+        return ['file-deleted', '✕ DELETED'];
+    } else if (type.includes('modified') || type.includes('modify') || type.includes('changed')) {
+        return ['file-modified', '✎ MODIFIED'];
+    } else if (type.includes('moved') || type.includes('renamed')) {
+        return ['file-moved', '→ MOVED'];
+    } else if (type.includes('accessed') || type.includes('read')) {
+        return ['file-accessed', '👁 ACCESSED'];
+    }
+    return ['low', action];
+}
+
+let dashboardEtag = null;
+
+async function loadData() {
+    try {
+        const tab = currentTab;
+        const res = await fetch(`/api/dashboard?tab=${tab}`);
+        const etag = `${tab}:${res.headers.get('ETag')}`;
+        if (etag === dashboardEtag) return false;
+        
+        const data = await res.json();
+        dashboardEtag = etag;
+        // The server sends null for any section it failed to build
+        if (data.stats) renderStats(data.stats);
+        if (data.whitelist) {
+            setWhitelist(data.whitelist);
+            renderWhitelist();
+        }
+        if (data.rows) switch (tab) {
+            case 'alerts': setAlerts(data.rows); renderAlerts(); break;
+            case 'processes': setProcesses(data.rows); renderProcesses(); break;
+            case 'network': renderNetwork(data.rows); break;
+            case 'files': renderFiles(data.rows); break;
+            case 'quarantine': renderQuarantine(data.rows); break;
+        }
+        return true;
+    } catch (e) { console.error('Dashboard error:', e); }
+    return false;
+}
+
+let refreshInFlight = null;
+
+// Resolves to whether anything changed; hidden tabs never fetch
+function refresh() {
+    if (document.visibilityState !== 'visible') return Promise.resolve(false);
+    if (!refreshInFlight) refreshInFlight = loadData().finally(() => { refreshInFlight = null; });
+    return refreshInFlight;
+}
+
+// Live updates arrive over SSE; polling only runs while the stream is down,
+// backing off while nothing changes
+const POLL_MIN = 5000;
+const POLL_MAX = 60000;
+let pollTimer = null;
+let pollInterval = POLL_MIN;
+
+function startPolling() {
+    if (pollTimer !== null) return;
+    pollInterval = POLL_MIN;
+    pollTimer = setTimeout(poll, pollInterval);
+}
+
+function stopPolling() {
+    clearTimeout(pollTimer);
+    pollTimer = null;
+}
+
+async function poll() {
+    const changed = await refresh();
+    if (pollTimer === null) return;
+    pollInterval = changed ? POLL_MIN : Math.min(pollInterval * 2, POLL_MAX);
+    pollTimer = setTimeout(poll, pollInterval);
+}
+
+function wake() {
+    refresh();
+    if (pollTimer === null) return;
+    clearTimeout(pollTimer);
+    pollInterval = POLL_MIN;
+    pollTimer = setTimeout(poll, pollInterval);
+}
+
+function connectEvents() {
+    if (typeof EventSource === 'undefined') {
+        startPolling();
+        return;
+    }
+    const events = new EventSource('/api/events');
+    events.addEventListener('open', stopPolling);
+    events.addEventListener('error', startPolling);
+    events.addEventListener('alert', e => {
+        alertsCache.unshift(JSON.parse(e.data));
+        alertColumns = null;
+        if (currentTab === 'alerts') scheduleRenderAlerts();
+    });
+    events.addEventListener('stats', e => {
+        renderStats(JSON.parse(e.data));
+        refresh();
+    });
+    events.addEventListener('whitelist', () => loadWhitelist());
+}
+
+onRowAction(alertsBody, {
+    inspect: a => inspectAlert(a.id),
+    trust: a => trustProcess(a.process_name),
+    kill: a => quarantineProcess(a.process_pid, a.process_name || ''),
+    dismiss: a => dismissAlert(a.id),
+});
+onRowAction(processesBody, {
+    kill: p => quarantineProcess(p.pid, p.name),
+});
+onRowAction(document.getElementById('whitelist-grid'), {
+    remove: w => removeFromWhitelist(w.name),
+}, '.whitelist-item');
+
+loadBootstrap();
+connectEvents();
+document.addEventListener('visibilitychange', wake);
@@ -2,111 +2,138 @@
 
 import pytest
 import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import SimpleNamespace
 
 src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+
+# Read-only configuration the detection engines see during tests
+ENGINE_CONFIG = SimpleNamespace(
+    suspicious_process_names=["malware.exe"],
+    suspicious_ports=[4444],
+    max_upload_mb_per_min=50,
+    sensitive_extensions=[".key", ".pem"],
+    get_rule=lambda key, default=None: 60,
+)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def engine_config():
+    """Point the detection engines' get_config() at ENGINE_CONFIG for the whole run."""
+    import detection.heuristics
+    import detection.rules_engine
+    
+    with pytest.MonkeyPatch.context() as mp:
+        for module in (detection.heuristics, detection.rules_engine):
+            mp.setattr(module, "get_config", lambda: ENGINE_CONFIG)
+        yield ENGINE_CONFIG
+
+
+@dataclass
+class FakeEvent:
+    """Stand-in for a monitor event with the fields the detectors read."""
+    source: str
+    event_type: str
+    data: dict
+    timestamp: float = field(default_factory=time.time)
+    risk_score: float = 0.0
+
+
+class FakeDatabase:
+    """Database stand-in returning empty or untrusted results."""
+    
+    def is_process_trusted(self, *args, **kwargs):
+        return False
+    
+    def add_alert(self, *args, **kwargs):
+        return SimpleNamespace(id=1)
+    
+    def add_process(self, *args, **kwargs):
+        return SimpleNamespace(id=1)
+    
+    def get_recent_alerts(self, *args, **kwargs):
+        return []
+    
+    def get_unacknowledged_alerts(self, *args, **kwargs):
+        return []
 
 
 @pytest.fixture
 def mock_config():
     """Create a mock configuration."""
-    from unittest.mock import MagicMock
-    
-    config = MagicMock()
-    config.app_name = "Leatt"
-    config.app_version = "0.1.0"
-    config.learning_mode = True
-    config.process_monitoring_enabled = True
-    config.file_monitoring_enabled = True
-    config.network_monitoring_enabled = True
-    config.registry_monitoring_enabled = True
-    config.notifications_enabled = True
-    config.ml_enabled = False
-    config.process_interval = 5
-    config.network_interval = 3
-    config.suspicious_process_names = ["malware.exe"]
-    config.suspicious_ports = [4444, 5555]
-    config.max_upload_mb_per_min = 50
-    config.sensitive_extensions = [".key", ".pem", ".env"]
-    config.watched_folders = []
-    
-    return config
+    return SimpleNamespace(
+        app_name="Leatt",
+        app_version="0.1.0",
+        learning_mode=True,
+        process_monitoring_enabled=True,
+        file_monitoring_enabled=True,
+        network_monitoring_enabled=True,
+        registry_monitoring_enabled=True,
+        notifications_enabled=True,
+        ml_enabled=False,
+        process_interval=5,
+        network_interval=3,
+        suspicious_process_names=["malware.exe"],
+        suspicious_ports=[4444, 5555],
+        max_upload_mb_per_min=50,
+        sensitive_extensions=[".key", ".pem", ".env"],
+        watched_folders=[],
+    )
 
 
 @pytest.fixture
 def mock_database():
     """Create a mock database."""
-    from unittest.mock import MagicMock
-    
-    db = MagicMock()
-    db.is_process_trusted.return_value = False
-    db.add_alert.return_value = MagicMock(id=1)
-    db.add_process.return_value = MagicMock(id=1)
-    db.get_recent_alerts.return_value = []
-    db.get_unacknowledged_alerts.return_value = []
-    
-    return db
+    return FakeDatabase()
 
 
 @pytest.fixture
 def sample_process_event():
     """Create a sample process monitoring event."""
-    from unittest.mock import MagicMock
-    import time
-    
-    event = MagicMock()
-    event.source = "process_monitor"
-    event.event_type = "new_process"
-    event.timestamp = time.time()
-    event.data = {
-        "pid": 1234,
-        "process_name": "test.exe",
-        "path": "C:\\test\\test.exe",
-        "user": "testuser",
-        "is_trusted": False,
-    }
-    event.risk_score = 0.0
-    
-    return event
+    return FakeEvent(
+        source="process_monitor",
+        event_type="new_process",
+        data={
+            "pid": 1234,
+            "process_name": "test.exe",
+            "path": "C:\\test\\test.exe",
+            "user": "testuser",
+            "is_trusted": False,
+        },
+    )
 
 
 @pytest.fixture
 def sample_network_event():
     """Create a sample network monitoring event."""
-    from unittest.mock import MagicMock
-    import time
-    
-    event = MagicMock()
-    event.source = "network_monitor"
-    event.event_type = "suspicious_port"
-    event.timestamp = time.time()
-    event.data = {
-        "pid": 1234,
-        "process_name": "suspicious.exe",
-        "remote_address": "192.168.1.100",
-        "remote_port": 4444,
-    }
-    event.risk_score = 60.0
-    
-    return event
+    return FakeEvent(
+        source="network_monitor",
+        event_type="suspicious_port",
+        data={
+            "pid": 1234,
+            "process_name": "suspicious.exe",
+            "remote_address": "192.168.1.100",
+            "remote_port": 4444,
+        },
+        risk_score=60.0,
+    )
 
 
 @pytest.fixture
 def sample_file_event():
     """Create a sample file monitoring event."""
-    from unittest.mock import MagicMock
-    import time
-    
-    event = MagicMock()
-    event.source = "file_monitor"
-    event.event_type = "file_modified"
-    event.timestamp = time.time()
-    event.data = {
-        "file_path": "C:\\Users\\test\\Documents\\secret.key",
-        "event_type": "modified",
-        "is_sensitive": True,
-    }
-    event.risk_score = 30.0
-    
-    return event
+    return FakeEvent(
+        source="file_monitor",
+        event_type="file_modified",
+        data={
+            "file_path": "C:\\Users\\test\\Documents\\secret.key",
+            "event_type": "modified",
+            "is_sensitive": True,
+        },
+        risk_score=30.0,
+    )
@@ -0,0 +1,119 @@
+"""Tests for the database module."""
+
+import pytest
+from sqlalchemy import delete
+
+from utils.database import Alert, AlertSeverity, Database, ProcessRecord, TrustedProcess
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Create a Database on a temporary file."""
+    db = Database(tmp_path / "leatt.db")
+    yield db
+    db.engine.dispose()
+
+
+class TestCounters:
+    """Tests for the trigger-maintained counters."""
+    
+    def test_counters_start_at_zero(self, database):
+        """Test that a new database has every counter seeded."""
+        assert set(database.get_stats().values()) == {0}
+        assert database.table_version("alerts") == 0
+    
+    def test_insert_acknowledge_delete_alerts(self, database):
+        """Test that alert counters follow inserts, acknowledgements and deletes."""
+        ids = [database.add_alert(AlertSeverity.HIGH, "test", f"Alert {i}").id for i in range(3)]
+        
+        stats = database.get_stats()
+        assert stats["total_alerts"] == 3
+        assert stats["unacknowledged_alerts"] == 3
+        
+        database.acknowledge_alerts(ids[:2])
+        # Acknowledging again must not count twice
+        database.acknowledge_alerts(ids[:2])
+        
+        stats = database.get_stats()
+        assert stats["total_alerts"] == 3
+        assert stats["unacknowledged_alerts"] == 1
+        assert stats["unacknowledged_alerts"] == database.count_unacknowledged_alerts()
+        
+        with database.get_session() as session:
+            session.execute(delete(Alert).where(Alert.id.in_([ids[0], ids[2]])))
+            session.commit()
+        
+        stats = database.get_stats()
+        assert stats["total_alerts"] == 1
+        assert stats["unacknowledged_alerts"] == 0
+    
+    def test_process_counter(self, database):
+        """Test that updating an existing process does not count it again."""
+        database.add_process(pid=1, name="a.exe")
+        database.add_process(pid=2, name="a.exe")
+        database.add_process(pid=3, name="b.exe")
+        
+        assert database.get_stats()["monitored_processes"] == 2
+        
+        with database.get_session() as session:
+            session.execute(delete(ProcessRecord))
+            session.commit()
+        
+        assert database.get_stats()["monitored_processes"] == 0
+    
+    def test_event_counters(self, database):
+        """Test the network and file event counters."""
+        database.add_network_event(1, "a.exe", "10.0.0.1", 443)
+        database.add_file_event("/tmp/a.key", "modified", is_sensitive=True)
+        database.add_file_event("/tmp/b.txt", "created")
+        
+        stats = database.get_stats()
+        assert stats["network_events"] == 1
+        assert stats["file_events"] == 2
+
+
+class TestTableVersions:
+    """Tests for the per-table change counters."""
+    
+    def test_every_write_bumps_the_version(self, database):
+        """Test that insert, update and delete each bump the table version."""
+        alert = database.add_alert(AlertSeverity.LOW, "test", "Alert")
+        assert database.table_version("alerts") == 1
+        
+        database.acknowledge_alerts([alert.id])
+        assert database.table_version("alerts") == 2
+        
+        # Nothing changes, so the version stays put
+        database.acknowledge_alerts([alert.id])
+        assert database.table_version("alerts") == 2
+        
+        with database.get_session() as session:
+            session.execute(delete(Alert))
+            session.commit()
+        assert database.table_version("alerts") == 3
+    
+    def test_versions_are_per_table(self, database):
+        """Test that a write only bumps its own table's version."""
+        database.add_trusted_process("a.exe")
+        database.add_quarantine_event(pid=1, name="a.exe")
+        
+        assert database.table_version("trusted_processes") == 1
+        assert database.table_version("quarantine_events") == 1
+        assert database.table_version("alerts") == 0
+        
+        with database.get_session() as session:
+            session.execute(delete(TrustedProcess))
+            session.commit()
+        assert database.table_version("trusted_processes") == 2
+    
+    def test_counters_survive_reopen(self, database, tmp_path):
+        """Test that reopening a database keeps counters instead of reseeding them."""
+        database.add_alert(AlertSeverity.LOW, "test", "Alert")
+        database.engine.dispose()
+        
+        reopened = Database(tmp_path / "leatt.db")
+        try:
+            assert reopened.get_stats()["total_alerts"] == 1
+            assert reopened.table_version("alerts") == 1
+        finally:
+            reopened.engine.dispose()
@@ -4,9 +4,6 @@ import pytest
 import time
 from unittest.mock import MagicMock, patch
 
-import sys
-sys.path.insert(0, str(__file__).rsplit('tests', 1)[0] + 'src')
-
 from detection.heuristics import HeuristicsEngine, ProcessActivity, HeuristicPattern
 
 
@@ -30,12 +27,7 @@ class TestHeuristicsEngine:
     @pytest.fixture
     def engine(self):
         """Create a HeuristicsEngine instance for testing."""
-        with patch('detection.heuristics.get_config') as mock_config:
-            mock_config.return_value = MagicMock()
-            mock_config.return_value.get_rule.return_value = 60
-            engine = HeuristicsEngine()
-        
-        return engine
+        return HeuristicsEngine()
     
     def test_engine_loads_patterns(self, engine):
         """Test that heuristic patterns are loaded."""
@@ -115,3 +107,11 @@ class TestHeuristicsEngine:
         assert summary is not None
         assert summary["pid"] == 1234
         assert summary["sensitive_files"] == 5
+    
+    def test_activities_capped(self, engine):
+        """Test that the oldest process activity is evicted at the cap."""
+        with patch('detection.heuristics.MAX_PROCESS_ACTIVITIES', 3):
+            for pid in range(5):
+                engine._get_or_create_activity(pid, f"proc{pid}.exe")
+        
+        assert list(engine._process_activities) == [2, 3, 4]
@@ -0,0 +1,58 @@
+"""Tests for the response compression middleware."""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+import web.middleware
+from web.middleware import CompressionMiddleware
+
+BODY = "leatt " * 500
+
+
+@pytest.fixture
+def client():
+    """Client for an app serving a large and a small body through the middleware."""
+    app = Starlette(routes=[
+        Route("/large", lambda request: PlainTextResponse(BODY)),
+        Route("/small", lambda request: PlainTextResponse("ok")),
+    ])
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+    
+    @pytest.mark.skipif(not web.middleware.BROTLI_SUPPORTED, reason="brotli responses unavailable")
+    def test_prefers_brotli(self, client):
+        """Test that brotli is used when the client accepts it."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+        
+        assert response.headers["content-encoding"] == "br"
+        assert response.text == BODY
+    
+    def test_gzip_when_brotli_not_accepted(self, client):
+        """Test that gzip is used for clients without brotli."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == BODY
+    
+    def test_small_bodies_are_not_compressed(self, client):
+        """Test that bodies under minimum_size are sent as they are."""
+        response = client.get("/small", headers={"Accept-Encoding": "gzip, br"})
+        
+        assert "content-encoding" not in response.headers
+        assert response.text == "ok"
+    
+    def test_falls_back_to_gzip_without_brotli_support(self, client, monkeypatch):
+        """Test that the middleware acts as GZipMiddleware when brotli cannot be used."""
+        monkeypatch.setattr(web.middleware, "BROTLI_SUPPORTED", False)
+        
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+        
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == BODY
@@ -0,0 +1,58 @@
+"""Tests for the notifications module."""
+
+import pytest
+from types import SimpleNamespace
+
+import ui.notifications
+from ui.notifications import NotificationManager, NotificationPriority
+
+
+class TestNotificationManager:
+    """Tests for NotificationManager rate limiting."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """A monotonic clock the test moves by hand."""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(ui.notifications, "time", SimpleNamespace(monotonic=lambda: clock.now))
+        return clock
+    
+    @pytest.fixture
+    def shown(self):
+        """(title, message) of every notification that reached the display."""
+        return []
+    
+    @pytest.fixture
+    def manager(self, monkeypatch, clock, shown):
+        """Create a NotificationManager that records what it would display."""
+        monkeypatch.setattr(ui.notifications, "get_config", lambda: SimpleNamespace(notifications_enabled=True))
+        manager = NotificationManager()
+        manager._plyer_available = True
+        manager._show_plyer_notification = lambda title, message, timeout: shown.append((title, message)) or True
+        return manager
+    
+    def test_burst_then_rate_limited(self, manager, shown):
+        """Test that a burst of three is shown and the fourth is held back."""
+        results = [manager.notify(f"Alert {i}", "msg") for i in range(4)]
+        
+        assert results == [True, True, True, False]
+        assert len(shown) == 3
+    
+    def test_refill_shows_summary_of_pending(self, manager, clock, shown):
+        """Test that a refilled token folds held-back notifications into one."""
+        for i in range(4):
+            manager.notify(f"Alert {i}", "msg")
+        
+        clock.now += manager._rate_limit_seconds
+        assert manager.notify("Critical", "urgent", NotificationPriority.CRITICAL) is True
+        
+        title, message = shown[-1]
+        assert title == "Critical"
+        assert "+1" in message and "Alert 3" in message
+    
+    def test_tokens_capped_at_capacity(self, manager, clock, shown):
+        """Test that a long idle period does not allow more than the burst."""
+        clock.now += 3600
+        results = [manager.notify(f"Alert {i}", "msg") for i in range(4)]
+        
+        assert results == [True, True, True, False]
@@ -5,9 +5,6 @@ import threading
 from queue import Queue
 from unittest.mock import MagicMock, patch
 
-import sys
-sys.path.insert(0, str(__file__).rsplit('tests', 1)[0] + 'src')
-
 from core.process_monitor import ProcessMonitor, ProcessInfo
 
 
@@ -1,10 +1,7 @@
 """Tests for the rules engine module."""
 
 import pytest
-from unittest.mock import MagicMock, patch
-
-import sys
-sys.path.insert(0, str(__file__).rsplit('tests', 1)[0] + 'src')
+from unittest.mock import MagicMock
 
 from detection.rules_engine import RulesEngine, Rule, RuleType
 from utils.database import AlertSeverity
@@ -35,16 +32,7 @@ class TestRulesEngine:
     @pytest.fixture
     def engine(self):
         """Create a RulesEngine instance for testing."""
-        with patch('detection.rules_engine.get_config') as mock_config:
-            mock_config.return_value = MagicMock(
-                suspicious_process_names=["malware.exe"],
-                suspicious_ports=[4444],
-                max_upload_mb_per_min=50,
-                sensitive_extensions=[".key", ".pem"],
-            )
-            engine = RulesEngine()
-        
-        return engine
+        return RulesEngine()
     
     def test_engine_loads_default_rules(self, engine):
         """Test that default rules are loaded."""
@@ -129,6 +117,23 @@ class TestRulesEngine:
         critical_alerts = [a for a in alerts if a["severity"] == AlertSeverity.CRITICAL]
         assert len(critical_alerts) == 0
     
+    def test_replaced_rule_uses_new_conditions(self, engine):
+        """Test that re-adding a rule recompiles its conditions."""
+        engine.add_rule(Rule(
+            name="suspicious_port_connection",
+            rule_type=RuleType.NETWORK,
+            description="Connection to suspicious port detected",
+            severity=AlertSeverity.HIGH,
+            conditions={"suspicious_ports": [31337]},
+        ))
+        event = MagicMock()
+        event.source = "network_monitor"
+        event.data = {"remote_port": 31337}
+        
+        alerts = engine.evaluate(event)
+        
+        assert [a["details"]["remote_port"] for a in alerts] == [31337]
+    
     def test_get_enabled_rules(self, engine):
         """Test getting only enabled rules."""
         engine.disable_rule("untrusted_process")
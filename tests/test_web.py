@@ -0,0 +1,260 @@
+"""Tests for the web dashboard API."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, event
+from sqlalchemy.exc import OperationalError
+
+import utils.database
+import web.app
+from utils.database import Alert, AlertSeverity, Database
+from web.app import WebDashboard
+from web.routes import format_bytes
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """A fresh database the dashboard's get_database() returns."""
+    db = Database(tmp_path / "leatt.db")
+    monkeypatch.setattr(utils.database, "_database", db)
+    yield db
+    db.engine.dispose()
+
+
+@pytest.fixture
+def dashboard(database):
+    """Create a WebDashboard backed by the test database."""
+    return WebDashboard()
+
+
+@pytest.fixture
+def client(dashboard):
+    """HTTP client for the dashboard app."""
+    return TestClient(dashboard._app)
+
+
+def add_alert(database, description="Test alert"):
+    return database.add_alert(AlertSeverity.HIGH, "test", description)
+
+
+def add_alerts_at(database, timestamps):
+    """Insert alerts with the given timestamps, in that id order."""
+    with database.get_session() as session:
+        session.add_all(
+            Alert(severity="low", source="test", description=f"at {ts}", timestamp=ts)
+            for ts in timestamps
+        )
+        session.commit()
+
+
+class TestAlertsApi:
+    """Tests for the alert endpoints."""
+    
+    def test_alerts_page_revalidates_with_etag(self, client, database):
+        """Test that an unchanged alerts page answers 304."""
+        add_alert(database)
+        
+        response = client.get("/api/alerts")
+        etag = response.headers["etag"]
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert client.get("/api/alerts", headers={"If-None-Match": etag}).status_code == 304
+        
+        add_alert(database)
+        assert client.get("/api/alerts", headers={"If-None-Match": etag}).status_code == 200
+    
+    def test_get_alert_includes_details(self, client, database):
+        """Test fetching one alert by id."""
+        alert = database.add_alert(AlertSeverity.LOW, "test", "With details", details='{"a": 1}')
+        
+        response = client.get(f"/api/alerts/{alert.id}")
+        
+        assert response.status_code == 200
+        assert response.json()["details"] == '{"a": 1}'
+    
+    def test_get_missing_alert(self, client, database):
+        """Test that an unknown alert id is a 404."""
+        assert client.get("/api/alerts/999").status_code == 404
+    
+    def test_acknowledge_batch(self, client, database):
+        """Test acknowledging several alerts at once."""
+        ids = [add_alert(database).id for _ in range(3)]
+        
+        response = client.post("/api/alerts/acknowledge", json={"ids": ids[:2]})
+        
+        assert response.status_code == 200
+        assert response.json() == {"success": True, "updated": 2}
+        assert database.count_unacknowledged_alerts() == 1
+    
+    @pytest.mark.parametrize("body", [[1, 2], "x", None, {"ids": "1"}, {"ids": [True]}, {"ids": [1.0]}])
+    def test_acknowledge_batch_rejects_bad_bodies(self, client, database, body):
+        """Test that malformed batch bodies are a 400 and acknowledge nothing."""
+        add_alert(database)
+        
+        response = client.post("/api/alerts/acknowledge", json=body)
+        
+        assert response.status_code == 400
+        assert response.json()["success"] is False
+        assert database.count_unacknowledged_alerts() == 1
+    
+    def test_acknowledge_batch_rejects_too_many_ids(self, client, database):
+        """Test that an oversized id list is refused."""
+        response = client.post("/api/alerts/acknowledge", json={"ids": list(range(20000))})
+        
+        assert response.status_code == 413
+    
+    def test_acknowledge_batch_past_parameter_limit(self, database):
+        """Test that large id lists are split under SQLite's parameter limit."""
+        ids = [add_alert(database).id for _ in range(3)]
+        
+        assert database.acknowledge_alerts(list(range(5000, 7000)) + ids) == 3
+
+
+class TestListPages:
+    """Tests for the cached list pages."""
+    
+    @pytest.mark.parametrize("params, headers", [
+        ({}, {}),
+        ({}, {"Accept": "application/x-ndjson"}),
+        ({"limit": 2000}, {}),
+    ])
+    def test_page_is_newest_first(self, client, database, params, headers):
+        """Test that rows come back in timestamp DESC order, not insert order."""
+        base = datetime(2026, 1, 1)
+        add_alerts_at(database, [base + timedelta(minutes=m) for m in (5, 1, 9, 3, 7)])
+        
+        response = client.get("/api/alerts", params=params, headers=headers)
+        if headers:
+            rows = [json.loads(line) for line in response.text.splitlines()]
+        else:
+            rows = response.json()
+        
+        timestamps = [row["timestamp"] for row in rows]
+        assert len(timestamps) == 5
+        assert timestamps == sorted(timestamps, reverse=True)
+    
+    def test_cursor_does_not_skip_equal_timestamps(self, client, database):
+        """Test that paging visits every row when timestamps collide."""
+        same = datetime(2026, 1, 1)
+        add_alerts_at(database, [same] * 5 + [same - timedelta(seconds=1)])
+        
+        seen = []
+        params = {"limit": 2}
+        while True:
+            response = client.get("/api/alerts", params=params)
+            seen.extend(row["id"] for row in response.json())
+            if "x-next-cursor" not in response.headers:
+                break
+            params = {
+                "limit": 2,
+                "before": response.headers["x-next-cursor"],
+                "before_id": response.headers["x-next-cursor-id"],
+            }
+        
+        assert seen == [5, 4, 3, 2, 1, 6]
+    
+    def test_processes_paged_by_id(self, client, database):
+        """Test that rescanned processes neither repeat nor vanish between pages."""
+        for pid in range(1, 6):
+            database.add_process(pid=pid, name=f"proc{pid}.exe")
+        
+        first = client.get("/api/processes", params={"limit": 2})
+        database.add_process(pid=1, name="proc1.exe")
+        rest = client.get("/api/processes", params={"limit": 10, "before": first.headers["x-next-cursor"]})
+        
+        assert [p["pid"] for p in first.json() + rest.json()] == [5, 4, 3, 2, 1]
+    
+    def test_stale_page_served_when_database_fails(self, client, database, monkeypatch):
+        """Test that a cached page is served stale while queries fail."""
+        monkeypatch.setattr(web.app, "PAGE_TTL", 0)
+        database.add_process(pid=1234, name="test.exe")
+        
+        fresh = client.get("/api/processes")
+        
+        def fail(*args, **kwargs):
+            raise OperationalError("SELECT", {}, Exception("database is locked"))
+        
+        event.listen(database.engine, "before_cursor_execute", fail)
+        try:
+            stale = client.get("/api/processes")
+        finally:
+            event.remove(database.engine, "before_cursor_execute", fail)
+        
+        assert stale.status_code == 200
+        assert stale.json() == fresh.json()
+        assert stale.headers["etag"] == fresh.headers["etag"]
+
+
+class TestDashboardPage:
+    """Tests for the dashboard page and its assets."""
+    
+    def test_page_is_rendered(self, client):
+        """Test that the page has its placeholders filled in."""
+        response = client.get("/")
+        
+        assert response.status_code == 200
+        assert "{{APP_NAME}}" not in response.text
+    
+    def test_template_is_not_served_raw(self, client):
+        """Test that the unrendered template is not reachable under /static."""
+        assert client.get("/static/dashboard.html").status_code == 404
+
+
+class TestEventStream:
+    """Tests for the /api/events stream."""
+    
+    def test_alert_pushed_when_total_is_unchanged(self, dashboard, database, monkeypatch):
+        """Test that an insert offset by a delete in the same interval is still pushed."""
+        monkeypatch.setattr(web.app, "EVENT_POLL_INTERVAL", 0.01)
+        old = add_alert(database, "Old")
+        endpoint = next(r.endpoint for r in dashboard._app.routes if getattr(r, "path", "") == "/api/events")
+        
+        class Request:
+            checks = 0
+            
+            async def is_disconnected(self):
+                self.checks += 1
+                return self.checks > 3
+        
+        async def collect():
+            chunks = (await endpoint(Request())).body_iterator
+            # The retry hint, then the first stats event
+            await chunks.__anext__()
+            await chunks.__anext__()
+            add_alert(database, "New")
+            with database.get_session() as session:
+                session.execute(delete(Alert).where(Alert.id == old.id))
+                session.commit()
+            return [chunk async for chunk in chunks]
+        
+        alerts = [c for c in asyncio.run(collect()) if c.startswith("event: alert")]
+        
+        assert len(alerts) == 1
+        assert '"description":"New"' in alerts[0]
+
+
+class TestFormatBytes:
+    """Tests for format_bytes."""
+    
+    @pytest.mark.parametrize("num_bytes, expected", [
+        (0, "0 B"),
+        (0.5, "0.5 B"),
+        (-0.5, "-0.5 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536.0, "1.5 KB"),
+        (-2048, "-2.0 KB"),
+        (1024 ** 5, "1.0 PB"),
+        (1024 ** 6, "1024.0 PB"),
+        (float("inf"), "inf PB"),
+        (float("-inf"), "-inf PB"),
+        (float("nan"), "nan PB"),
+    ])
+    def test_format_bytes(self, num_bytes, expected):
+        """Test formatting byte counts across units."""
+        assert format_bytes(num_bytes) == expected
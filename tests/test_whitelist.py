@@ -3,9 +3,6 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
-import sys
-sys.path.insert(0, str(__file__).rsplit('tests', 1)[0] + 'src')
-
 from trust.whitelist import Whitelist, WhitelistEntry
 
 
@@ -23,6 +20,13 @@ class TestWhitelistEntry:
         assert entry.name == "notepad.exe"
         assert entry.added_by == "user"
         assert entry.hash_sha256 is None
+    
+    def test_entry_caches_lowercase_name(self):
+        """Test that the lowercased name is computed once at creation."""
+        entry = WhitelistEntry(name="Notepad.EXE")
+        
+        assert entry.name_lower == "notepad.exe"
+        assert entry == WhitelistEntry(name="Notepad.EXE")
 
 
 class TestWhitelist:
@@ -71,6 +75,7 @@ class TestWhitelist:
         assert whitelist.is_known_browser("chrome.exe") is True
         assert whitelist.is_known_browser("firefox.exe") is True
         assert whitelist.is_known_browser("myapp.exe") is False
+        assert whitelist.is_known_browser("Chrome.EXE") is True
     
     def test_clear_cache(self, whitelist):
         """Test clearing the cache."""
@@ -79,3 +84,60 @@ class TestWhitelist:
         whitelist.clear_cache()
         
         assert len(whitelist._cache) == 0
+    
+    def test_cache_evicts_least_recently_used(self, whitelist):
+        """Test that the trust cache drops its least recently used entry at the cap."""
+        whitelist.db.is_process_trusted.return_value = True
+        
+        with patch('trust.whitelist.TRUST_CACHE_SIZE', 2):
+            whitelist.is_trusted("one.exe")
+            whitelist.is_trusted("two.exe")
+            whitelist.is_trusted("one.exe")
+            whitelist.is_trusted("three.exe")
+        
+        assert list(whitelist._cache) == ["one.exe::", "three.exe::"]
+        assert whitelist.cache_info()["hits"] == 1
+    
+    def test_get_all_reuses_system_entries(self, whitelist):
+        """Test that system default entries are built once and reused."""
+        session = whitelist.db.get_session.return_value.__enter__.return_value
+        session.query.return_value.yield_per.return_value = []
+        
+        first = list(whitelist.get_all())
+        second = list(whitelist.get_all())
+        
+        assert len(first) == len(whitelist._system_processes)
+        assert all(a is b for a, b in zip(first, second))
+    
+    def test_get_all_skips_defaults_stored_in_db(self, whitelist):
+        """Test that a default also stored in the database is yielded once."""
+        name = next(iter(whitelist._system_processes))
+        row = MagicMock(added_by="user")
+        row.name = name
+        session = whitelist.db.get_session.return_value.__enter__.return_value
+        session.query.return_value.yield_per.return_value = [row]
+        
+        entries = list(whitelist.get_all())
+        
+        assert [e.name for e in entries].count(name) == 1
+        assert entries[0].added_by == "user"
+    
+    def test_get_all_uses_one_query(self, tmp_path):
+        """Test that listing stored entries costs one SELECT, not one per row."""
+        from sqlalchemy import event
+        from utils.database import Database
+        
+        db = Database(tmp_path / "leatt.db")
+        for i in range(5):
+            db.add_trusted_process(name=f"app{i}.exe", publisher="Vendor", reason="test")
+        
+        with patch('trust.whitelist.get_database', return_value=db):
+            whitelist = Whitelist()
+        
+        statements = []
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        
+        entries = list(whitelist.get_all())
+        
+        assert len(statements) == 1
+        assert {e.publisher for e in entries if e.name.startswith("app")} == {"Vendor"}